@@ -0,0 +1,100 @@
+"""add user_task_stats counters
+
+Revision ID: a9d4e2f7c318
+Revises: f1a6c3e92b57
+Create Date: 2026-10-17 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a9d4e2f7c318'
+down_revision: Union[str, Sequence[str], None] = 'f1a6c3e92b57'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Trigger bodies adding or removing one task row (the NEW or OLD alias)
+def _add(alias: str) -> str:
+    return f"""
+        INSERT INTO user_task_stats
+            (user_id, status_id, task_count, archived_count, done_count, open_count)
+        VALUES (
+            {alias}.created_by, {alias}.status_id, 1,
+            {alias}.archived = 1,
+            {alias}.archived = 0 AND {alias}.done = 1,
+            {alias}.archived = 0 AND {alias}.done = 0
+        )
+        ON CONFLICT (user_id, status_id) DO UPDATE SET
+            task_count = task_count + excluded.task_count,
+            archived_count = archived_count + excluded.archived_count,
+            done_count = done_count + excluded.done_count,
+            open_count = open_count + excluded.open_count;
+    """
+
+
+def _remove(alias: str) -> str:
+    return f"""
+        UPDATE user_task_stats SET
+            task_count = task_count - 1,
+            archived_count = archived_count - ({alias}.archived = 1),
+            done_count = done_count - ({alias}.archived = 0 AND {alias}.done = 1),
+            open_count = open_count - ({alias}.archived = 0 AND {alias}.done = 0)
+        WHERE user_id = {alias}.created_by AND status_id = {alias}.status_id;
+    """
+
+
+BACKFILL_SQL = """
+    INSERT INTO user_task_stats
+        (user_id, status_id, task_count, archived_count, done_count, open_count)
+    SELECT created_by, status_id, COUNT(*),
+           SUM(archived = 1),
+           SUM(archived = 0 AND done = 1),
+           SUM(archived = 0 AND done = 0)
+    FROM task
+    GROUP BY created_by, status_id
+"""
+
+
+def upgrade() -> None:
+    """Create per-user task counters kept current by triggers on task."""
+    op.create_table(
+        'user_task_stats',
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('status_id', sa.Integer(), nullable=False),
+        sa.Column('task_count', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('archived_count', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('done_count', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('open_count', sa.Integer(), nullable=False, server_default='0'),
+        sa.ForeignKeyConstraint(['user_id'], ['user.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('user_id', 'status_id'),
+    )
+    # Triggers cover every write path: ORM, set-based UPDATEs, imports and
+    # FK cascades (subtasks, account deletion)
+    op.execute(f"CREATE TRIGGER user_task_stats_ai AFTER INSERT ON task BEGIN {_add('new')} END")
+    op.execute(f"CREATE TRIGGER user_task_stats_ad AFTER DELETE ON task BEGIN {_remove('old')} END")
+    # Title, order and other edits leave the counters alone
+    op.execute(
+        f"""
+        CREATE TRIGGER user_task_stats_au
+        AFTER UPDATE OF created_by, status_id, done, archived ON task
+        WHEN old.created_by IS NOT new.created_by
+          OR old.status_id IS NOT new.status_id
+          OR old.done IS NOT new.done
+          OR old.archived IS NOT new.archived
+        BEGIN {_remove('old')} {_add('new')} END
+        """
+    )
+    op.execute(BACKFILL_SQL)
+
+
+def downgrade() -> None:
+    """Drop the task counters and their triggers."""
+    op.execute("DROP TRIGGER IF EXISTS user_task_stats_au")
+    op.execute("DROP TRIGGER IF EXISTS user_task_stats_ad")
+    op.execute("DROP TRIGGER IF EXISTS user_task_stats_ai")
+    op.drop_table('user_task_stats')
@@ -0,0 +1,48 @@
+"""add fractional task position
+
+Revision ID: b3f8d1a6e029
+Revises: a9d4e2f7c318
+Create Date: 2026-10-17 11:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b3f8d1a6e029'
+down_revision: Union[str, Sequence[str], None] = 'a9d4e2f7c318'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add task.position for fractional manual ordering."""
+    # add_column keeps the table (and its FTS / stats triggers) in place
+    op.add_column(
+        'task',
+        sa.Column('position', sa.Float(), nullable=False, server_default='0'),
+    )
+    # Seed from the legacy integer order, one step apart per user
+    op.execute(
+        """
+        UPDATE task SET position = ranked.rn
+        FROM (
+            SELECT id, ROW_NUMBER() OVER (
+                PARTITION BY created_by ORDER BY "order", id
+            ) AS rn
+            FROM task
+        ) AS ranked
+        WHERE task.id = ranked.id
+        """
+    )
+    # Next-position MAX() lookups and rebalancing walk this
+    op.create_index('ix_task_created_by_position', 'task', ['created_by', 'position'])
+
+
+def downgrade() -> None:
+    """Drop task.position."""
+    op.drop_index('ix_task_created_by_position', 'task')
+    op.drop_column('task', 'position')
@@ -0,0 +1,33 @@
+"""add task keyset pagination index
+
+Revision ID: b7e3c1d9a2f4
+Revises: e60c89a1cf95
+Create Date: 2026-10-16 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7e3c1d9a2f4'
+down_revision: Union[str, Sequence[str], None] = 'e60c89a1cf95'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add composite index backing cursor pagination on GET /api/tasks."""
+    # Matches WHERE created_by = ? AND archived = 0 ORDER BY updated_on DESC, id DESC
+    op.create_index(
+        'ix_task_created_by_archived_updated_on_id',
+        'task',
+        ['created_by', 'archived', 'updated_on', 'id'],
+    )
+
+
+def downgrade() -> None:
+    """Remove keyset pagination index."""
+    op.drop_index('ix_task_created_by_archived_updated_on_id', 'task')
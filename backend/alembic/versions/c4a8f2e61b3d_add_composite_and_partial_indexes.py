@@ -0,0 +1,106 @@
+"""add composite and partial indexes matched to query shapes
+
+Revision ID: c4a8f2e61b3d
+Revises: b7e3c1d9a2f4
+Create Date: 2026-10-16 10:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4a8f2e61b3d'
+down_revision: Union[str, Sequence[str], None] = 'b7e3c1d9a2f4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add indexes that lead with the owner column every hot query filters on."""
+    # Calendar: created_by = ? AND archived = 0 AND due_date IS NOT NULL ORDER BY due_date
+    op.create_index(
+        'ix_task_created_by_archived_due_date',
+        'task',
+        ['created_by', 'archived', 'due_date'],
+    )
+    # Overdue counts and lists only ever look at open, non-archived tasks
+    op.create_index(
+        'ix_task_open_created_by_due_date',
+        'task',
+        ['created_by', 'due_date'],
+        sqlite_where=sa.text('done = 0 AND archived = 0'),
+    )
+    # Completed-task analytics: created_by = ? AND done = 1 AND archived = 0
+    op.create_index(
+        'ix_task_created_by_done_archived_closed_on',
+        'task',
+        ['created_by', 'done', 'archived', 'closed_on'],
+    )
+    # Category usage joins task on category_id (also serves ON DELETE SET NULL)
+    op.create_index('ix_task_category_id', 'task', ['category_id'])
+    # Status counters and kanban columns
+    op.create_index(
+        'ix_task_created_by_status_archived',
+        'task',
+        ['created_by', 'status_id', 'archived'],
+    )
+
+    # Chat history: conversation_id = ? ORDER BY created_at
+    op.create_index(
+        'ix_message_conversation_id_created_at',
+        'message',
+        ['conversation_id', 'created_at'],
+    )
+    # Latest conversation: user_id = ? ORDER BY updated_at DESC LIMIT 1
+    op.create_index(
+        'ix_conversation_user_id_updated_at',
+        'conversation',
+        ['user_id', 'updated_at'],
+    )
+    # Journal ranges: user_id = ? AND entry_date BETWEEN ...
+    op.create_index(
+        'ix_journal_entries_user_id_entry_date',
+        'journal_entries',
+        ['user_id', 'entry_date'],
+    )
+    # Per-user lookups by name
+    op.create_index('ix_category_created_by_name', 'category', ['created_by', 'name'])
+    op.create_index('ix_tag_created_by_name', 'tag', ['created_by', 'name'])
+    op.create_index('ix_configuration_user_id', 'configuration', ['user_id'])
+    # Session listing and the expired-session reaper
+    op.create_index(
+        'ix_user_sessions_user_id_is_active_last_activity',
+        'user_sessions',
+        ['user_id', 'is_active', 'last_activity'],
+    )
+    op.create_index('ix_user_sessions_expires_at', 'user_sessions', ['expires_at'])
+    op.create_index('ix_user_sessions_last_activity', 'user_sessions', ['last_activity'])
+
+    # Boolean-only indexes are superseded by the composites above and only
+    # tempt the planner into scanning half the table
+    op.drop_index('ix_task_archived', 'task')
+    op.drop_index('ix_task_done', 'task')
+
+
+def downgrade() -> None:
+    """Restore the original single-column indexes."""
+    op.create_index('ix_task_archived', 'task', ['archived'])
+    op.create_index('ix_task_done', 'task', ['done'])
+
+    op.drop_index('ix_user_sessions_last_activity', 'user_sessions')
+    op.drop_index('ix_user_sessions_expires_at', 'user_sessions')
+    op.drop_index('ix_user_sessions_user_id_is_active_last_activity', 'user_sessions')
+    op.drop_index('ix_configuration_user_id', 'configuration')
+    op.drop_index('ix_tag_created_by_name', 'tag')
+    op.drop_index('ix_category_created_by_name', 'category')
+    op.drop_index('ix_journal_entries_user_id_entry_date', 'journal_entries')
+    op.drop_index('ix_conversation_user_id_updated_at', 'conversation')
+    op.drop_index('ix_message_conversation_id_created_at', 'message')
+    op.drop_index('ix_task_created_by_status_archived', 'task')
+    op.drop_index('ix_task_category_id', 'task')
+    op.drop_index('ix_task_created_by_done_archived_closed_on', 'task')
+    op.drop_index('ix_task_open_created_by_due_date', 'task')
+    op.drop_index('ix_task_created_by_archived_due_date', 'task')
@@ -0,0 +1,133 @@
+"""add sync_change log for delta sync
+
+Revision ID: c7e2a4f9d160
+Revises: b3f8d1a6e029
+Create Date: 2026-10-17 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c7e2a4f9d160'
+down_revision: Union[str, Sequence[str], None] = 'b3f8d1a6e029'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (entity, table, owner column) for every synced table
+ENTITIES = (
+    ('task', 'task', 'created_by'),
+    ('journal', 'journal_entries', 'user_id'),
+    ('category', 'category', 'created_by'),
+)
+
+
+def _mark(entity: str, alias: str, owner: str, deleted: int) -> str:
+    """Trigger body moving one row's change entry to a fresh seq."""
+    return f"""
+        DELETE FROM sync_change WHERE entity = '{entity}' AND entity_id = {alias}.id;
+        INSERT INTO sync_change (user_id, entity, entity_id, deleted)
+        VALUES ({alias}.{owner}, '{entity}', {alias}.id, {deleted});
+    """
+
+
+def _mark_tasks(where: str) -> str:
+    """Trigger body marking every task matching a condition as changed."""
+    return f"""
+        DELETE FROM sync_change
+        WHERE entity = 'task' AND entity_id IN (SELECT id FROM task WHERE {where});
+        INSERT INTO sync_change (user_id, entity, entity_id, deleted)
+        SELECT created_by, 'task', id, 0 FROM task WHERE {where};
+    """
+
+
+TRIGGERS = [
+    # Tag links and category/tag names are part of the task payload
+    (
+        'sync_change_task_tag_ai',
+        f"AFTER INSERT ON task_tag BEGIN {_mark_tasks('id = new.task_id')} END",
+    ),
+    (
+        'sync_change_task_tag_ad',
+        f"AFTER DELETE ON task_tag BEGIN {_mark_tasks('id = old.task_id')} END",
+    ),
+    (
+        'sync_change_category_name',
+        "AFTER UPDATE OF name ON category WHEN old.name IS NOT new.name "
+        f"BEGIN {_mark_tasks('category_id = new.id')} END",
+    ),
+    (
+        'sync_change_tag_name',
+        "AFTER UPDATE OF name ON tag WHEN old.name IS NOT new.name BEGIN "
+        + _mark_tasks('id IN (SELECT task_id FROM task_tag WHERE tag_id = new.id)')
+        + " END",
+    ),
+    # Rows written by cascades while a user is deleted go with the user
+    (
+        'sync_change_user_ad',
+        "AFTER DELETE ON user BEGIN "
+        "DELETE FROM sync_change WHERE user_id = old.id; END",
+    ),
+]
+for _entity, _table, _owner in ENTITIES:
+    TRIGGERS += [
+        (
+            f'sync_change_{_table}_ai',
+            f"AFTER INSERT ON {_table} BEGIN {_mark(_entity, 'new', _owner, 0)} END",
+        ),
+        (
+            f'sync_change_{_table}_au',
+            f"AFTER UPDATE ON {_table} BEGIN {_mark(_entity, 'new', _owner, 0)} END",
+        ),
+        (
+            f'sync_change_{_table}_ad',
+            f"AFTER DELETE ON {_table} BEGIN {_mark(_entity, 'old', _owner, 1)} END",
+        ),
+    ]
+
+
+def upgrade() -> None:
+    """Log the latest change to every task, journal entry and category."""
+    # AUTOINCREMENT: seq values are never reused, so a client's token stays
+    # valid even after the rows below it are deleted
+    op.create_table(
+        'sync_change',
+        sa.Column('seq', sa.Integer(), primary_key=True, autoincrement=True),
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('entity', sa.String(length=16), nullable=False),
+        sa.Column('entity_id', sa.Integer(), nullable=False),
+        sa.Column('deleted', sa.Boolean(), nullable=False, server_default='0'),
+        sqlite_autoincrement=True,
+    )
+    # One entry per row: each change replaces the row's previous entry
+    op.create_index(
+        'uq_sync_change_entity', 'sync_change', ['entity', 'entity_id'], unique=True
+    )
+    op.create_index('ix_sync_change_user_seq', 'sync_change', ['user_id', 'seq'])
+
+    # Triggers catch every write path, including set-based UPDATEs, imports
+    # and FK cascades (subtasks, ON DELETE SET NULL from categories)
+    for name, body in TRIGGERS:
+        op.execute(f"CREATE TRIGGER {name} {body}")
+
+    # Existing rows start out as changes, so token 0 means "everything"
+    for entity, table, owner in ENTITIES:
+        op.execute(
+            f"""
+            INSERT INTO sync_change (user_id, entity, entity_id, deleted)
+            SELECT {owner}, '{entity}', id, 0 FROM {table} ORDER BY id
+            """
+        )
+
+
+def downgrade() -> None:
+    """Drop the sync change log and its triggers."""
+    for name, _ in reversed(TRIGGERS):
+        op.execute(f"DROP TRIGGER IF EXISTS {name}")
+    op.drop_index('ix_sync_change_user_seq', 'sync_change')
+    op.drop_index('uq_sync_change_entity', 'sync_change')
+    op.drop_table('sync_change')
@@ -0,0 +1,30 @@
+"""add user data_version counter
+
+Revision ID: d2f7a9b3e815
+Revises: c4a8f2e61b3d
+Create Date: 2026-10-16 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd2f7a9b3e815'
+down_revision: Union[str, Sequence[str], None] = 'c4a8f2e61b3d'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add per-user data version used for ETags."""
+    # Bumped in the same transaction as every task, journal, category or settings write
+    op.add_column('user', sa.Column('data_version', sa.Integer(), nullable=False, server_default='0'))
+
+
+def downgrade() -> None:
+    """Remove per-user data version."""
+    with op.batch_alter_table('user') as batch_op:
+        batch_op.drop_column('data_version')
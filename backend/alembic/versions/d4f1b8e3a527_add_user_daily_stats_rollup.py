@@ -0,0 +1,140 @@
+"""add user_daily_stats rollup
+
+Revision ID: d4f1b8e3a527
+Revises: c7e2a4f9d160
+Create Date: 2026-10-17 13:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd4f1b8e3a527'
+down_revision: Union[str, Sequence[str], None] = 'c7e2a4f9d160'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Row keys: the day a task was created, and the day it was completed
+# (closed_on, falling back to created_on as the review endpoints do).
+# Tasks without a category count under category_id 0.
+def _category(alias: str) -> str:
+    return f"coalesce({alias}.category_id, 0)"
+
+
+def _completed_day(alias: str) -> str:
+    return f"date(coalesce({alias}.closed_on, {alias}.created_on))"
+
+
+def _late(alias: str) -> str:
+    return f"coalesce({_completed_day(alias)} > date({alias}.due_date), 0)"
+
+
+# Trigger bodies adding or removing one task row (the NEW or OLD alias).
+# Archived tasks are left out, like everywhere in the review analytics.
+def _add(alias: str) -> str:
+    return f"""
+        INSERT INTO user_daily_stats
+            (user_id, day, category_id, created_count, created_done_count,
+             completed_count, completed_late_count)
+        SELECT {alias}.created_by, date({alias}.created_on), {_category(alias)},
+               1, {alias}.done = 1, 0, 0
+        WHERE {alias}.archived = 0
+        ON CONFLICT (user_id, day, category_id) DO UPDATE SET
+            created_count = created_count + excluded.created_count,
+            created_done_count = created_done_count + excluded.created_done_count;
+        INSERT INTO user_daily_stats
+            (user_id, day, category_id, created_count, created_done_count,
+             completed_count, completed_late_count)
+        SELECT {alias}.created_by, {_completed_day(alias)}, {_category(alias)},
+               0, 0, 1, {_late(alias)}
+        WHERE {alias}.archived = 0 AND {alias}.done = 1
+        ON CONFLICT (user_id, day, category_id) DO UPDATE SET
+            completed_count = completed_count + excluded.completed_count,
+            completed_late_count = completed_late_count + excluded.completed_late_count;
+    """
+
+
+def _remove(alias: str) -> str:
+    return f"""
+        UPDATE user_daily_stats SET
+            created_count = created_count - 1,
+            created_done_count = created_done_count - ({alias}.done = 1)
+        WHERE {alias}.archived = 0
+          AND user_id = {alias}.created_by
+          AND day = date({alias}.created_on)
+          AND category_id = {_category(alias)};
+        UPDATE user_daily_stats SET
+            completed_count = completed_count - 1,
+            completed_late_count = completed_late_count - {_late(alias)}
+        WHERE {alias}.archived = 0 AND {alias}.done = 1
+          AND user_id = {alias}.created_by
+          AND day = {_completed_day(alias)}
+          AND category_id = {_category(alias)};
+    """
+
+
+BACKFILL_SQL = f"""
+    INSERT INTO user_daily_stats
+        (user_id, day, category_id, created_count, created_done_count,
+         completed_count, completed_late_count)
+    SELECT user_id, day, category_id, SUM(created), SUM(created_done),
+           SUM(completed), SUM(late)
+    FROM (
+        SELECT created_by AS user_id, date(created_on) AS day,
+               {_category('task')} AS category_id,
+               1 AS created, done = 1 AS created_done, 0 AS completed, 0 AS late
+        FROM task WHERE archived = 0
+        UNION ALL
+        SELECT created_by, {_completed_day('task')}, {_category('task')},
+               0, 0, 1, {_late('task')}
+        FROM task WHERE archived = 0 AND done = 1
+    )
+    GROUP BY user_id, day, category_id
+"""
+
+
+def upgrade() -> None:
+    """Create per-user daily task counters kept current by triggers on task."""
+    op.create_table(
+        'user_daily_stats',
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('day', sa.String(length=10), nullable=False),
+        sa.Column('category_id', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('created_count', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('created_done_count', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('completed_count', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('completed_late_count', sa.Integer(), nullable=False, server_default='0'),
+        sa.ForeignKeyConstraint(['user_id'], ['user.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('user_id', 'day', 'category_id'),
+    )
+    op.execute(f"CREATE TRIGGER user_daily_stats_ai AFTER INSERT ON task BEGIN {_add('new')} END")
+    op.execute(f"CREATE TRIGGER user_daily_stats_ad AFTER DELETE ON task BEGIN {_remove('old')} END")
+    # Title, status, order and other edits leave the rollup alone
+    op.execute(
+        f"""
+        CREATE TRIGGER user_daily_stats_au
+        AFTER UPDATE OF created_by, created_on, closed_on, done, archived,
+                        category_id, due_date ON task
+        WHEN old.created_by IS NOT new.created_by
+          OR old.created_on IS NOT new.created_on
+          OR old.closed_on IS NOT new.closed_on
+          OR old.done IS NOT new.done
+          OR old.archived IS NOT new.archived
+          OR old.category_id IS NOT new.category_id
+          OR old.due_date IS NOT new.due_date
+        BEGIN {_remove('old')} {_add('new')} END
+        """
+    )
+    op.execute(BACKFILL_SQL)
+
+
+def downgrade() -> None:
+    """Drop the daily rollup and its triggers."""
+    op.execute("DROP TRIGGER IF EXISTS user_daily_stats_au")
+    op.execute("DROP TRIGGER IF EXISTS user_daily_stats_ad")
+    op.execute("DROP TRIGGER IF EXISTS user_daily_stats_ai")
+    op.drop_table('user_daily_stats')
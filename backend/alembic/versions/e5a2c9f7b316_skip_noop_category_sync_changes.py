@@ -0,0 +1,52 @@
+"""skip no-op category updates in sync_change
+
+Revision ID: e5a2c9f7b316
+Revises: d4f1b8e3a527
+Create Date: 2026-10-17 14:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5a2c9f7b316'
+down_revision: Union[str, Sequence[str], None] = 'd4f1b8e3a527'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+MARK_CATEGORY = """
+    DELETE FROM sync_change WHERE entity = 'category' AND entity_id = new.id;
+    INSERT INTO sync_change (user_id, entity, entity_id, deleted)
+    VALUES (new.created_by, 'category', new.id, 0);
+"""
+
+# Columns of the category sync payload (Category.to_dict)
+SYNCED_COLUMNS = (
+    'name', 'description', 'color_hex', 'created_on', 'updated_on', 'created_by'
+)
+
+
+def upgrade() -> None:
+    """Only log category updates that change a synced column.
+
+    resolve_category_id's no-op upsert (ON CONFLICT DO UPDATE SET
+    name = excluded.name) still fires AFTER UPDATE triggers.
+    """
+    changed = " OR ".join(f"old.{c} IS NOT new.{c}" for c in SYNCED_COLUMNS)
+    op.execute("DROP TRIGGER IF EXISTS sync_change_category_au")
+    op.execute(
+        f"CREATE TRIGGER sync_change_category_au AFTER UPDATE ON category "
+        f"WHEN {changed} BEGIN {MARK_CATEGORY} END"
+    )
+
+
+def downgrade() -> None:
+    """Log every category update again."""
+    op.execute("DROP TRIGGER IF EXISTS sync_change_category_au")
+    op.execute(
+        f"CREATE TRIGGER sync_change_category_au AFTER UPDATE ON category "
+        f"BEGIN {MARK_CATEGORY} END"
+    )
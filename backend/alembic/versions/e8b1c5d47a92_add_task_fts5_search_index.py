@@ -0,0 +1,70 @@
+"""add task FTS5 search index
+
+Revision ID: e8b1c5d47a92
+Revises: d2f7a9b3e815
+Create Date: 2026-10-16 13:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e8b1c5d47a92'
+down_revision: Union[str, Sequence[str], None] = 'd2f7a9b3e815'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create an external-content FTS5 index over task text, kept in sync by triggers."""
+    # External content: the index stores only tokens, text stays in task
+    op.execute(
+        """
+        CREATE VIRTUAL TABLE task_fts USING fts5(
+            title, description, notes,
+            content='task', content_rowid='id',
+            tokenize='unicode61 remove_diacritics 2',
+            prefix='2 3'
+        )
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER task_fts_ai AFTER INSERT ON task BEGIN
+            INSERT INTO task_fts(rowid, title, description, notes)
+            VALUES (new.id, new.title, new.description, new.notes);
+        END
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER task_fts_ad AFTER DELETE ON task BEGIN
+            INSERT INTO task_fts(task_fts, rowid, title, description, notes)
+            VALUES ('delete', old.id, old.title, old.description, old.notes);
+        END
+        """
+    )
+    # Only text edits touch the index; done/archived/order flips skip it
+    op.execute(
+        """
+        CREATE TRIGGER task_fts_au AFTER UPDATE OF title, description, notes ON task BEGIN
+            INSERT INTO task_fts(task_fts, rowid, title, description, notes)
+            VALUES ('delete', old.id, old.title, old.description, old.notes);
+            INSERT INTO task_fts(rowid, title, description, notes)
+            VALUES (new.id, new.title, new.description, new.notes);
+        END
+        """
+    )
+    # Index existing rows
+    op.execute("INSERT INTO task_fts(task_fts) VALUES ('rebuild')")
+
+
+def downgrade() -> None:
+    """Drop the task search index and its triggers."""
+    op.execute("DROP TRIGGER IF EXISTS task_fts_au")
+    op.execute("DROP TRIGGER IF EXISTS task_fts_ad")
+    op.execute("DROP TRIGGER IF EXISTS task_fts_ai")
+    op.execute("DROP TABLE IF EXISTS task_fts")
@@ -0,0 +1,64 @@
+"""unique category name per user
+
+Revision ID: f1a6c3e92b57
+Revises: e8b1c5d47a92
+Create Date: 2026-10-17 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f1a6c3e92b57'
+down_revision: Union[str, Sequence[str], None] = 'e8b1c5d47a92'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Make (created_by, name) unique so categories can be upserted."""
+    # Racing auto-creates may have left duplicates: keep the oldest row and
+    # move tasks from the others onto it
+    op.execute(
+        """
+        UPDATE task SET category_id = (
+            SELECT MIN(keep.id) FROM category AS dup
+            JOIN category AS keep
+              ON keep.created_by = dup.created_by AND keep.name = dup.name
+            WHERE dup.id = task.category_id
+        )
+        WHERE category_id IN (
+            SELECT dup.id FROM category AS dup
+            WHERE EXISTS (
+                SELECT 1 FROM category AS older
+                WHERE older.created_by = dup.created_by
+                  AND older.name = dup.name
+                  AND older.id < dup.id
+            )
+        )
+        """
+    )
+    op.execute(
+        """
+        DELETE FROM category
+        WHERE EXISTS (
+            SELECT 1 FROM category AS older
+            WHERE older.created_by = category.created_by
+              AND older.name = category.name
+              AND older.id < category.id
+        )
+        """
+    )
+    op.drop_index('ix_category_created_by_name', 'category')
+    op.create_index(
+        'uq_category_created_by_name', 'category', ['created_by', 'name'], unique=True
+    )
+
+
+def downgrade() -> None:
+    """Back to a plain lookup index (merged duplicates are not restored)."""
+    op.drop_index('uq_category_created_by_name', 'category')
+    op.create_index('ix_category_created_by_name', 'category', ['created_by', 'name'])
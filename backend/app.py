@@ -90,8 +90,46 @@ def create_app():
         except Exception as e:
             print(f"Database initialization failed: {e}")
 
+        # Statuses are seed data; load them once instead of per request
+        try:
+            from backend.db.statuses import load_status_registry
+
+            await load_status_registry()
+        except Exception as e:
+            print(f"Status registry load failed: {e}")
+
+        # Background maintenance jobs (session reaping, activity flush)
+        try:
+            from backend.services.scheduler import start_scheduler
+
+            start_scheduler()
+        except Exception as e:
+            print(f"Maintenance scheduler failed to start: {e}")
+
     @app.after_serving
     async def shutdown():
+        try:
+            from backend.services.scheduler import shutdown_scheduler
+
+            shutdown_scheduler()
+        except Exception as e:
+            print(f"Maintenance scheduler shutdown failed: {e}")
+
+        # Write any buffered session activity before the engine goes away
+        try:
+            from backend.security.session_cache import session_cache
+
+            await session_cache.flush()
+        except Exception as e:
+            print(f"Session activity flush failed: {e}")
+
+        try:
+            from backend.security.pin_executor import pin_executor
+
+            pin_executor.shutdown()
+        except Exception as e:
+            print(f"PIN hashing pool shutdown failed: {e}")
+
         try:
             await async_engine.dispose()
             print("Database engine disposed")
@@ -139,6 +177,19 @@ def register_routes(app):
             }
         )
 
+    @app.route("/api/health/metrics")
+    @auth_required
+    async def health_metrics():
+        """Internal load metrics; kept off the anonymous health check."""
+        from backend.security.pin_executor import pin_executor
+
+        return jsonify(
+            {
+                # Queue depth and latency of the PIN hashing worker pool
+                "pin_hashing": pin_executor.stats(),
+            }
+        )
+
     @app.route("/api/export", methods=["GET"])
     @auth_required
     async def export_data():
@@ -147,67 +198,21 @@ def register_routes(app):
             try:
                 from backend.db.models import Task, JournalEntry, Configuration, Status
                 from backend.db.engine_async import AsyncSessionLocal
+                from backend.db.projections import fetch_task_dicts, task_projection
             except ImportError:
                 from db.models import Task, JournalEntry, Configuration, Status
                 from db.engine_async import AsyncSessionLocal
+                from db.projections import fetch_task_dicts, task_projection
             from sqlalchemy import select
-            from sqlalchemy.orm import selectinload
-            import logging
 
             async with AsyncSessionLocal() as db_session:
-                # Export tasks
-                task_result = await db_session.execute(
-                    select(Task)
-                    .options(selectinload(Task.status))
+                # Export tasks straight from columns; no ORM hydration
+                tasks = await fetch_task_dicts(
+                    db_session,
+                    task_projection()
                     .where(Task.created_by == session["user_id"])
+                    .order_by(Task.id),
                 )
-                tasks = []
-                for task in task_result.scalars().all():
-                    try:
-                        tasks.append(task.to_dict())
-                    except Exception as e:
-                        logging.error(f"Error serializing task {task.id}: {e}")
-                        # Fallback: create dict manually
-                        tasks.append(
-                            {
-                                "id": task.id,
-                                "title": task.title,
-                                "description": task.description,
-                                "notes": task.notes,
-                                "category": None,  # Skip complex relationships for now
-                                "status": (
-                                    {"id": task.status_id, "name": "Unknown"}
-                                    if task.status_id
-                                    else None
-                                ),
-                                "tags": [],
-                                "done": task.done,
-                                "archived": task.archived,
-                                "priority": task.priority,
-                                "estimate_minutes": task.estimate_minutes,
-                                "order": task.order,
-                                "parent_id": task.parent_id,
-                                "due_date": (
-                                    task.due_date.isoformat() if task.due_date else None
-                                ),
-                                "created_at": (
-                                    task.created_on.isoformat()
-                                    if task.created_on
-                                    else None
-                                ),
-                                "updated_on": (
-                                    task.updated_on.isoformat()
-                                    if task.updated_on
-                                    else None
-                                ),
-                                "closed_on": (
-                                    task.closed_on.isoformat()
-                                    if task.closed_on
-                                    else None
-                                ),
-                                "created_by": task.created_by,
-                            }
-                        )
 
                 # Export journal entries
                 journal_result = await db_session.execute(
@@ -258,9 +263,11 @@ def register_routes(app):
             try:
                 from backend.db.models import Task, JournalEntry, Configuration, Status
                 from backend.db.engine_async import AsyncSessionLocal
+                from backend.db.positions import next_position
             except ImportError:
                 from db.models import Task, JournalEntry, Configuration, Status
                 from db.engine_async import AsyncSessionLocal
+                from db.positions import next_position
             from sqlalchemy import select
             from datetime import datetime
 
@@ -313,6 +320,7 @@ def register_routes(app):
                                 else None
                             ),
                             created_by=session["user_id"],
+                            position=next_position(session["user_id"]),
                         )
                         db_session.add(task)
                         imported_count["tasks"] += 1
@@ -408,8 +416,24 @@ def register_routes(app):
 
                     imported_count["settings"] += 1
 
+                try:
+                    from backend.data_version import bump_data_version
+                except ImportError:
+                    from data_version import bump_data_version
+                await bump_data_version(
+                    db_session,
+                    session["user_id"],
+                    "task",
+                    "journal",
+                    "category",
+                    "settings",
+                )
                 await db_session.commit()
 
+                from backend.blueprints.tasks.routes import invalidate_task_counts
+
+                invalidate_task_counts(session["user_id"])
+
                 return jsonify(
                     {
                         "success": True,
@@ -504,6 +528,26 @@ def register_routes(app):
     except ImportError as e:
         print(f"[WARN] Categories blueprint not available: {e}")
 
+    try:
+        try:
+            from backend.blueprints.sync import sync_bp
+        except ImportError:
+            from blueprints.sync import sync_bp
+        app.register_blueprint(sync_bp)
+        print("[OK] Sync blueprint registered")
+    except ImportError as e:
+        print(f"[WARN] Sync blueprint not available: {e}")
+
+    try:
+        try:
+            from backend.blueprints.events import events_bp
+        except ImportError:
+            from blueprints.events import events_bp
+        app.register_blueprint(events_bp)
+        print("[OK] Events blueprint registered")
+    except ImportError as e:
+        print(f"[WARN] Events blueprint not available: {e}")
+
     # Error handlers - Standardized error responses
     try:
         from backend.errors import (
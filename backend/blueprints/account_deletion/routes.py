@@ -5,24 +5,34 @@ from datetime import datetime
 
 try:
     from backend.db.engine_async import AsyncSessionLocal
-    from backend.db.models import User, verify_and_migrate_pin
+    from backend.db.categories import category_ids
+    from backend.db.models import User
+    from backend.db.task_stats import get_task_stats
     from backend.security.auth_decorators import auth_required
+    from backend.security.pin_executor import verify_and_migrate_pin_async
+    from backend.security.session_cache import session_cache
     from backend.security_logging import security_logger
     from backend.errors import (
         ValidationError,
         AuthenticationError,
         DatabaseError,
+        ServiceUnavailableError,
         success_response,
     )
 except ImportError:
     from db.engine_async import AsyncSessionLocal
-    from db.models import User, verify_and_migrate_pin
+    from db.categories import category_ids
+    from db.models import User
+    from db.task_stats import get_task_stats
     from security.auth_decorators import auth_required
+    from security.pin_executor import verify_and_migrate_pin_async
+    from security.session_cache import session_cache
     from security_logging import security_logger
     from errors import (
         ValidationError,
         AuthenticationError,
         DatabaseError,
+        ServiceUnavailableError,
         success_response,
     )
 
@@ -89,7 +99,7 @@ async def delete_account():
                 raise AuthenticationError("User not found")
             
             # Verify PIN
-            is_valid, _ = verify_and_migrate_pin(pin, user.pin_hash)
+            is_valid, _ = await verify_and_migrate_pin_async(pin, user.pin_hash)
             if not is_valid:
                 # Log failed deletion attempt
                 security_logger.log_sensitive_operation(
@@ -125,6 +135,8 @@ async def delete_account():
             # - sessions (UserSession)
             await db_session.delete(user)
             await db_session.commit()
+            session_cache.invalidate_user(user_id)
+            category_ids.invalidate(user_id)
             
             logging.info(f"Account deleted successfully: user_id={user_id}, username={username}")
         
@@ -136,7 +148,7 @@ async def delete_account():
             "deleted_at": datetime.now().isoformat()
         })
         
-    except (ValidationError, AuthenticationError):
+    except (ValidationError, AuthenticationError, ServiceUnavailableError):
         raise  # Re-raise known errors
     except Exception as e:
         logging.exception(f"Failed to delete account for user {session.get('user_id')}")
@@ -168,9 +180,9 @@ async def preview_deletion():
         async with AsyncSessionLocal() as db_session:
             # Import models here to avoid circular imports
             try:
-                from backend.db.models import Task, JournalEntry, Conversation, UserSession
+                from backend.db.models import JournalEntry, Conversation, UserSession
             except ImportError:
-                from db.models import Task, JournalEntry, Conversation, UserSession
+                from db.models import JournalEntry, Conversation, UserSession
             
             # Fetch user
             result = await db_session.execute(
@@ -182,9 +194,7 @@ async def preview_deletion():
                 raise AuthenticationError("User not found")
             
             # Count related records
-            tasks_count = await db_session.scalar(
-                select(func.count(Task.id)).where(Task.created_by == user_id)
-            )
+            tasks_count = (await get_task_stats(db_session, user_id)).tasks
             
             journal_count = await db_session.scalar(
                 select(func.count(JournalEntry.id)).where(JournalEntry.user_id == user_id)
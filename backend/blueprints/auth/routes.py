@@ -12,17 +12,21 @@ try:
         User,
         Configuration,
         UserSession,
-        hash_pin,
         validate_pin,
-        verify_and_migrate_pin,
     )
     from backend.security.auth_decorators import auth_required
+    from backend.security.pin_executor import (
+        hash_pin_async,
+        verify_and_migrate_pin_async,
+    )
+    from backend.security.session_cache import session_cache
     from backend.security_logging import security_logger
     from quart_rate_limiter import rate_limit
     from backend.errors import (
         ValidationError,
         AuthenticationError,
         DatabaseError,
+        ServiceUnavailableError,
         success_response,
     )
 except ImportError:
@@ -32,15 +36,19 @@ except ImportError:
         User,
         Configuration,
         UserSession,
-        hash_pin,
         validate_pin,
-        verify_and_migrate_pin,
     )
     from backend.security.auth_decorators import auth_required
+    from backend.security.pin_executor import (
+        hash_pin_async,
+        verify_and_migrate_pin_async,
+    )
+    from backend.security.session_cache import session_cache
     from errors import (
         ValidationError,
         AuthenticationError,
         DatabaseError,
+        ServiceUnavailableError,
         success_response,
     )
 
@@ -91,7 +99,7 @@ async def setup_auth():
             email = data.get("email", "").strip()
             new_user = User(
                 username=username,
-                pin_hash=hash_pin(pin),
+                pin_hash=await hash_pin_async(pin),
                 email=(
                     email if email else None
                 ),  # Use None instead of empty string for UNIQUE constraint
@@ -153,8 +161,8 @@ async def setup_auth():
                 201,
             )
 
-    except ValidationError:
-        raise  # Re-raise validation errors
+    except (ValidationError, ServiceUnavailableError):
+        raise  # Re-raise validation and overload errors
     except Exception as e:
         logging.exception("Failed to create account")
         raise DatabaseError("Failed to create account")
@@ -196,7 +204,7 @@ async def login():
                 raise AuthenticationError("Invalid username or PIN")
 
             # Verify PIN and migrate legacy SHA-256 -> bcrypt if needed
-            is_valid, new_hash = verify_and_migrate_pin(pin, user.pin_hash)
+            is_valid, new_hash = await verify_and_migrate_pin_async(pin, user.pin_hash)
             if not is_valid:
                 # Log failed login - wrong PIN
                 ip_address = request.headers.get("X-Forwarded-For", request.remote_addr)
@@ -261,7 +269,7 @@ async def login():
                 }
             )
 
-    except (ValidationError, AuthenticationError):
+    except (ValidationError, AuthenticationError, ServiceUnavailableError):
         raise  # Re-raise known errors
     except Exception as e:
         logging.exception("Login failed")
@@ -276,6 +284,7 @@ async def logout():
         # Mark the current session as inactive in database
         current_session_id = session.get("session_id")
         if current_session_id:
+            session_cache.invalidate(current_session_id)
             async with AsyncSessionLocal() as db_session:
                 result = await db_session.execute(
                     select(UserSession).where(
@@ -286,6 +295,9 @@ async def logout():
                 if user_session:
                     user_session.is_active = False
                     await db_session.commit()
+                    # Again after commit, in case an open change stream
+                    # re-cached the session in between
+                    session_cache.invalidate(current_session_id)
                     import logging
 
                     logging.info(
@@ -337,13 +349,15 @@ async def change_pin():
                 raise AuthenticationError("User not found")
 
             # Verify current PIN
-            is_valid, _ = verify_and_migrate_pin(current_pin, user.pin_hash)
+            is_valid, _ = await verify_and_migrate_pin_async(
+                current_pin, user.pin_hash
+            )
             if not is_valid:
                 raise AuthenticationError("Current PIN is incorrect")
 
             # Store new PIN using bcrypt
 
-            user.pin_hash = hash_pin(new_pin)
+            user.pin_hash = await hash_pin_async(new_pin)
 
             await db_session.commit()
 
@@ -355,7 +369,7 @@ async def change_pin():
 
             return success_response({"message": "PIN updated successfully"})
 
-    except (ValidationError, AuthenticationError):
+    except (ValidationError, AuthenticationError, ServiceUnavailableError):
         raise  # Re-raise known errors
     except Exception as e:
         logging.exception("Failed to update PIN")
@@ -404,7 +418,7 @@ async def change_username():
                 raise AuthenticationError("User not found")
 
             # Verify PIN for security
-            is_valid, _ = verify_and_migrate_pin(pin, user.pin_hash)
+            is_valid, _ = await verify_and_migrate_pin_async(pin, user.pin_hash)
             if not is_valid:
                 # Log failed attempt
                 ip_address = request.headers.get("X-Forwarded-For", request.remote_addr)
@@ -457,7 +471,7 @@ async def change_username():
                 }
             )
 
-    except (ValidationError, AuthenticationError):
+    except (ValidationError, AuthenticationError, ServiceUnavailableError):
         raise  # Re-raise known errors
     except Exception as e:
         logging.exception("Failed to update username")
@@ -2,19 +2,30 @@
 import logging
 from quart import Blueprint, jsonify, request, session
 from sqlalchemy import select, func
+from sqlalchemy.exc import IntegrityError
 from backend.db.engine_async import AsyncSessionLocal
+from backend.db.categories import category_ids
 from backend.db.models import Category, Task
 from backend.security.auth_decorators import auth_required
-from backend.errors import ValidationError, DatabaseError, NotFoundError
+from backend.errors import ConflictError, ValidationError, DatabaseError, NotFoundError
 from backend.validation import CategoryValidator
 from backend.cache_utils import cache
+from backend.data_version import bump_data_version, data_version_etag
 
 # Create blueprint
 categories_bp = Blueprint("categories", __name__, url_prefix="/api/categories")
 
 
+def _duplicate_name(name: str) -> ConflictError:
+    """Names are unique per user (uq_category_created_by_name)."""
+    return ConflictError(
+        "A category with this name already exists", details={"name": name}
+    )
+
+
 @categories_bp.route("", methods=["GET"])
 @auth_required
+@data_version_etag
 async def get_categories():
     """Get all categories for the current user with caching."""
     cache_key = f"categories_user_{session['user_id']}"
@@ -57,6 +68,7 @@ async def create_category():
             )
             
             db_session.add(new_category)
+            await bump_data_version(db_session, session["user_id"], "category")
             await db_session.commit()
             await db_session.refresh(new_category)
             
@@ -68,6 +80,8 @@ async def create_category():
             
     except ValidationError:
         raise
+    except IntegrityError:
+        raise _duplicate_name(validated["name"])
     except Exception:
         logging.exception("Failed to create category")
         raise DatabaseError("Failed to create category")
@@ -75,6 +89,7 @@ async def create_category():
 
 @categories_bp.route("/<int:category_id>", methods=["GET"])
 @auth_required
+@data_version_etag
 async def get_category(category_id):
     """Get a single category by ID."""
     try:
@@ -127,17 +142,21 @@ async def update_category(category_id):
             if "color_hex" in validated:
                 category.color_hex = validated["color_hex"]
             
+            await bump_data_version(db_session, session["user_id"], "category", "task")
             await db_session.commit()
             await db_session.refresh(category)
             
             # Invalidate cache
             cache_key = f"categories_user_{session['user_id']}"
             cache.clear(cache_key)
+            category_ids.invalidate(session["user_id"])
             
             return jsonify(category.to_dict())
             
     except (ValidationError, NotFoundError):
         raise
+    except IntegrityError:
+        raise _duplicate_name(validated["name"])
     except Exception:
         logging.exception("Failed to update category")
         raise DatabaseError("Failed to update category")
@@ -160,11 +179,13 @@ async def delete_category(category_id):
                 raise NotFoundError("Category not found")
             
             await db_session.delete(category)
+            await bump_data_version(db_session, session["user_id"], "category", "task")
             await db_session.commit()
             
             # Invalidate cache
             cache_key = f"categories_user_{session['user_id']}"
             cache.clear(cache_key)
+            category_ids.invalidate(session["user_id"])
             
             return jsonify({"message": "Category deleted successfully"}), 200
             
@@ -177,6 +198,7 @@ async def delete_category(category_id):
 
 @categories_bp.route("/usage", methods=["GET"])
 @auth_required
+@data_version_etag
 async def get_category_usage():
     """Get usage statistics for all categories (how many tasks use each)."""
     try:
@@ -13,13 +13,17 @@ from backend.db.models import (
     Message,
     Configuration,
     Task,
-    Status,
-    Category,
     Tag,
 )
 from backend.db.engine_async import AsyncSessionLocal
+from backend.db.categories import resolve_category_id
+from backend.db.positions import next_position
+from backend.db.search import search_tasks
+from backend.db.statuses import get_status_registry
+from backend.data_version import bump_data_version
 from backend.services.llm_service import LLMService
 from backend.services.context_builder import ContextBuilder
+from backend.services.title_index import TitleMatch, title_indexes
 from backend.security.auth_decorators import auth_required
 
 logger = logging.getLogger(__name__)
@@ -88,51 +92,28 @@ async def create_task_from_ai(
             logger.error(f"Invalid due_date format: {due_date_str}")
             due_date = datetime.now()
 
-        # Get default "Todo" status (or first available status)
-        status_result = await db_session.execute(
-            select(Status).where(Status.title == "Todo").limit(1)
-        )
-        default_status = status_result.scalars().first()
-
-        # Fallback: use any status if "Todo" not found
-        if not default_status:
-            status_result = await db_session.execute(select(Status).limit(1))
-            default_status = status_result.scalars().first()
-
-        if not default_status:
+        # Default "Todo" status (or the first available status)
+        statuses = await get_status_registry(db_session)
+        default_status_id = statuses.default_id
+        if default_status_id is None:
             logger.error("No status found in database")
             return None
 
         # Optional: Get or create category
-        category_id = None
         category_name = action_data.get("category", "").strip()
-        if category_name:
-            category_result = await db_session.execute(
-                select(Category).where(
-                    and_(Category.name == category_name, Category.created_by == user_id)
-                )
-            )
-            category = category_result.scalars().first()
-
-            if not category:
-                # Auto-create category
-                category = Category(
-                    name=category_name,
-                    description=f"Auto-created from AI: {category_name}",
-                    color_hex="808080",  # Default gray
-                    created_by=user_id,
-                )
-                db_session.add(category)
-                await db_session.flush()
-
-            category_id = category.id
+        category_id = await resolve_category_id(
+            db_session,
+            user_id,
+            category_name,
+            description=f"Auto-created from AI: {category_name}",
+        )
 
         # Create task
         task = Task(
             title=title,
             description=action_data.get("description", ""),
             due_date=due_date,
-            status_id=default_status.id,
+            status_id=default_status_id,
             category_id=category_id,
             created_by=user_id,
             done=False,
@@ -140,6 +121,10 @@ async def create_task_from_ai(
             estimate_minutes=action_data.get("estimate_minutes"),
             archived=False,
             order=0,
+            position=next_position(user_id),
+            # Start with a loaded collection so appending tags below
+            # doesn't trigger a lazy load outside the async context
+            tags=[],
         )
         db_session.add(task)
         await db_session.flush()
@@ -173,6 +158,7 @@ async def create_task_from_ai(
                 # Associate tag with task
                 task.tags.append(tag)
 
+        await bump_data_version(db_session, user_id, "task", "category")
         logger.info(f"Created task '{title}' (ID: {task.id}) for user {user_id} via AI")
         return task.id
 
@@ -183,7 +169,7 @@ async def create_task_from_ai(
 
 async def find_task_by_title(db_session, user_id: int, task_title: str) -> Task | None:
     """
-    Find a task by title (case-insensitive, partial match).
+    Find a task by title (exact match first, then best full-text match).
 
     Args:
         db_session: Active database session
@@ -209,39 +195,52 @@ async def find_task_by_title(db_session, user_id: int, task_title: str) -> Task
         if task:
             return task
 
-        # Fallback: case-insensitive partial match
-        result = await db_session.execute(
-            select(Task)
-            .where(
-                and_(
-                    Task.created_by == user_id,
-                    Task.title.ilike(f"%{task_title}%"),
-                    Task.archived == False,
-                )
-            )
-            .limit(1)
-        )
-        return result.scalars().first()
+        # Fallback: best-ranked FTS5 match instead of scanning with ILIKE
+        hits = await search_tasks(db_session, user_id, task_title, limit=1)
+        if not hits:
+            return None
+        return await db_session.get(Task, hits[0].task_id)
 
     except Exception as e:
         logger.error(f"Error finding task '{task_title}': {e}")
         return None
 
 
-async def complete_task_action(db_session, user_id: int, action_data: dict) -> bool:
+async def _resolve_action_task(
+    db_session,
+    user_id: int,
+    task_title: str,
+    resolved: dict[str, TitleMatch | None] | None,
+) -> Task | None:
+    """Use a title pre-resolved from the trigram index, else look it up."""
+    match = (resolved or {}).get(task_title)
+    if match is not None:
+        task = await db_session.get(Task, match.task_id)
+        if task and task.created_by == user_id and not task.archived:
+            return task
+    return await find_task_by_title(db_session, user_id, task_title)
+
+
+async def complete_task_action(
+    db_session,
+    user_id: int,
+    action_data: dict,
+    resolved: dict[str, TitleMatch | None] | None = None,
+) -> bool:
     """Mark a task as completed."""
     try:
         task_title = action_data.get("task_title", "").strip()
         if not task_title:
             return False
 
-        task = await find_task_by_title(db_session, user_id, task_title)
+        task = await _resolve_action_task(db_session, user_id, task_title, resolved)
         if not task:
             logger.error(f"Task '{task_title}' not found for completion")
             return False
 
         task.done = True
         task.updated_on = datetime.now()
+        await bump_data_version(db_session, user_id, "task")
         logger.info(f"Marked task '{task.title}' (ID: {task.id}) as complete")
         return True
 
@@ -250,14 +249,19 @@ async def complete_task_action(db_session, user_id: int, action_data: dict) -> b
         return False
 
 
-async def update_task_action(db_session, user_id: int, action_data: dict) -> bool:
+async def update_task_action(
+    db_session,
+    user_id: int,
+    action_data: dict,
+    resolved: dict[str, TitleMatch | None] | None = None,
+) -> bool:
     """Update task properties (due_date, priority, category, etc)."""
     try:
         task_title = action_data.get("task_title", "").strip()
         if not task_title:
             return False
 
-        task = await find_task_by_title(db_session, user_id, task_title)
+        task = await _resolve_action_task(db_session, user_id, task_title, resolved)
         if not task:
             logger.error(f"Task '{task_title}' not found for update")
             return False
@@ -277,27 +281,12 @@ async def update_task_action(db_session, user_id: int, action_data: dict) -> boo
         if "category" in action_data:
             category_name = action_data["category"].strip()
             if category_name:
-                category_result = await db_session.execute(
-                    select(Category).where(
-                        and_(
-                            Category.name == category_name,
-                            Category.created_by == user_id,
-                        )
-                    )
+                task.category_id = await resolve_category_id(
+                    db_session,
+                    user_id,
+                    category_name,
+                    description=f"Auto-created from AI: {category_name}",
                 )
-                category = category_result.scalars().first()
-
-                if not category:
-                    category = Category(
-                        name=category_name,
-                        description=f"Auto-created from AI: {category_name}",
-                        color_hex="808080",
-                        created_by=user_id,
-                    )
-                    db_session.add(category)
-                    await db_session.flush()
-
-                task.category_id = category.id
 
         # Update description
         if "description" in action_data:
@@ -308,6 +297,7 @@ async def update_task_action(db_session, user_id: int, action_data: dict) -> boo
             task.estimate_minutes = action_data["estimate_minutes"]
 
         task.updated_on = datetime.now()
+        await bump_data_version(db_session, user_id, "task", "category")
         logger.info(f"Updated task '{task.title}' (ID: {task.id})")
         return True
 
@@ -316,20 +306,26 @@ async def update_task_action(db_session, user_id: int, action_data: dict) -> boo
         return False
 
 
-async def archive_task_action(db_session, user_id: int, action_data: dict) -> bool:
+async def archive_task_action(
+    db_session,
+    user_id: int,
+    action_data: dict,
+    resolved: dict[str, TitleMatch | None] | None = None,
+) -> bool:
     """Archive a task."""
     try:
         task_title = action_data.get("task_title", "").strip()
         if not task_title:
             return False
 
-        task = await find_task_by_title(db_session, user_id, task_title)
+        task = await _resolve_action_task(db_session, user_id, task_title, resolved)
         if not task:
             logger.error(f"Task '{task_title}' not found for archiving")
             return False
 
         task.archived = True
         task.updated_on = datetime.now()
+        await bump_data_version(db_session, user_id, "task")
         logger.info(f"Archived task '{task.title}' (ID: {task.id})")
         return True
 
@@ -447,12 +443,26 @@ async def send_message():
             actions = parse_action_json(ai_response)
             executed_actions = []  # Track successful executions for cache invalidation
 
+            # Resolve every task title the response refers to in one pass
+            titles = [
+                action.get("task_title", "").strip()
+                for action in actions
+                if action.get("action") != "create_task" and action.get("task_title")
+            ]
+            resolved = None
+            if titles:
+                index = await title_indexes.get(db_session, user_id)
+                resolved = index.resolve_many(titles)
+
             for action in actions:
                 action_type = action.get("action")
 
                 if action_type == "create_task":
                     task_id = await create_task_from_ai(db_session, user_id, action)
                     if task_id:
+                        # The index snapshot predates this task, so later
+                        # actions look titles up in the database instead
+                        resolved = None
                         logger.info(
                             f"Executed create_task action, created task ID {task_id}"
                         )
@@ -463,7 +473,9 @@ async def send_message():
                         logger.error(f"Failed to execute create_task action: {action}")
 
                 elif action_type == "complete_task":
-                    success = await complete_task_action(db_session, user_id, action)
+                    success = await complete_task_action(
+                        db_session, user_id, action, resolved
+                    )
                     if success:
                         logger.info(
                             f"Executed complete_task action for '{action.get('task_title')}'"
@@ -475,7 +487,9 @@ async def send_message():
                         )
 
                 elif action_type == "update_task":
-                    success = await update_task_action(db_session, user_id, action)
+                    success = await update_task_action(
+                        db_session, user_id, action, resolved
+                    )
                     if success:
                         logger.info(
                             f"Executed update_task action for '{action.get('task_title')}'"
@@ -485,7 +499,9 @@ async def send_message():
                         logger.error(f"Failed to execute update_task action: {action}")
 
                 elif action_type == "archive_task":
-                    success = await archive_task_action(db_session, user_id, action)
+                    success = await archive_task_action(
+                        db_session, user_id, action, resolved
+                    )
                     if success:
                         logger.info(
                             f"Executed archive_task action for '{action.get('task_title')}'"
@@ -510,6 +526,12 @@ async def send_message():
 
             await db_session.commit()
 
+            if executed_actions:
+                from backend.blueprints.tasks.routes import invalidate_task_counts
+
+                invalidate_task_counts(user_id)
+                title_indexes.invalidate(user_id)
+
             return (
                 jsonify(
                     {
@@ -0,0 +1,4 @@
+"""Events blueprint initialization."""
+from .routes import events_bp
+
+__all__ = ["events_bp"]
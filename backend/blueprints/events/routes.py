@@ -0,0 +1,62 @@
+"""Server-sent change stream for the logged-in user."""
+import json
+from quart import Blueprint, make_response, session
+from backend.config import CHANGE_STREAM_HEARTBEAT_SECONDS
+from backend.data_version import get_data_version
+from backend.security.auth_decorators import auth_required, session_is_active
+from backend.services.change_hub import change_hub
+
+events_bp = Blueprint("events", __name__, url_prefix="/api/events")
+
+HEARTBEAT = b": heartbeat\n\n"
+
+
+def _sse(event: str, data: dict, event_id: int) -> bytes:
+    return f"id: {event_id}\nevent: {event}\ndata: {json.dumps(data)}\n\n".encode()
+
+
+@events_bp.route("", methods=["GET"])
+@auth_required
+async def stream_changes():
+    """Stream change events as text/event-stream.
+
+    Opens with a "ready" event carrying the current data version, then
+    sends a "change" event ({"version", "changed": [...]}) after every
+    committed write to the user's tasks, journal, categories or settings.
+    A "resync" event means events were dropped and everything listed
+    should be refetched. Idle connections get a comment line every
+    CHANGE_STREAM_HEARTBEAT_SECONDS. The stream closes once the login
+    session is revoked or expires.
+    """
+    user_id = session["user_id"]
+    session_id = session["session_id"]
+
+    async def stream():
+        # Subscribe before reading the version so no commit falls between
+        subscription = change_hub.subscribe(user_id)
+        try:
+            version = await get_data_version(user_id)
+            yield _sse("ready", {"version": version}, version)
+            while True:
+                event = await subscription.get(CHANGE_STREAM_HEARTBEAT_SECONDS)
+                # Logout elsewhere must not keep a stream alive (cached check)
+                if not await session_is_active(session_id):
+                    break
+                if event is None:
+                    yield HEARTBEAT
+                else:
+                    yield _sse(event.type, event.to_dict(), event.version)
+        finally:
+            change_hub.unsubscribe(subscription)
+
+    response = await make_response(
+        stream(),
+        {
+            "Content-Type": "text/event-stream",
+            "Cache-Control": "no-cache",
+            # Keep reverse proxies from buffering the stream
+            "X-Accel-Buffering": "no",
+        },
+    )
+    response.timeout = None
+    return response
@@ -1,12 +1,16 @@
 from quart import Blueprint, jsonify, request, session
-from datetime import datetime, date, timedelta
+from datetime import datetime, date, time, timedelta
 from sqlalchemy import func, select
 from sqlalchemy.exc import SQLAlchemyError
 
 try:
-    from backend.db.models import JournalEntry, Task
+    from backend.db.models import JournalEntry, Task, UserTaskStats
     from backend.security.auth_decorators import auth_required
     from backend.db.engine_async import AsyncSessionLocal
+    from backend.db.statuses import get_status_registry
+    from backend.db.task_stats import get_task_stats
+    from backend.db.daily_stats import get_daily_stats
+    from backend.data_version import bump_data_version, data_version_etag
     from backend.errors import (
         ValidationError,
         NotFoundError,
@@ -14,9 +18,13 @@ try:
         success_response,
     )
 except ImportError:
-    from db.models import JournalEntry, Task
+    from db.models import JournalEntry, Task, UserTaskStats
     from backend.security.auth_decorators import auth_required
     from db.engine_async import AsyncSessionLocal
+    from db.statuses import get_status_registry
+    from db.task_stats import get_task_stats
+    from db.daily_stats import get_daily_stats
+    from data_version import bump_data_version, data_version_etag
     from errors import ValidationError, NotFoundError, DatabaseError, success_response
 
 review_bp = Blueprint("review", __name__)
@@ -24,6 +32,7 @@ review_bp = Blueprint("review", __name__)
 
 @review_bp.route("/api/review/journal", methods=["GET"])
 @auth_required
+@data_version_etag
 async def get_journal():
     # Get query params for date range
     start_date = request.args.get("start_date")
@@ -47,12 +56,15 @@ async def get_journal():
 
     try:
         async with AsyncSessionLocal() as s:
+            # Half-open datetime range over whole days, so the
+            # (user_id, entry_date) index is range-scanned
             result = await s.execute(
                 select(JournalEntry)
                 .where(
                     JournalEntry.user_id == user_id,
-                    func.date(JournalEntry.entry_date) >= start_date,
-                    func.date(JournalEntry.entry_date) <= end_date,
+                    JournalEntry.entry_date >= datetime.combine(start_date, time.min),
+                    JournalEntry.entry_date
+                    < datetime.combine(end_date + timedelta(days=1), time.min),
                 )
                 .order_by(JournalEntry.entry_date.desc())
             )
@@ -89,6 +101,7 @@ async def create_journal():
         )
         async with AsyncSessionLocal() as s:
             s.add(entry)
+            await bump_data_version(s, user_id, "journal")
             await s.commit()
             await s.refresh(entry)
             return success_response(entry.to_dict(), 201)
@@ -130,6 +143,7 @@ async def update_journal(entry_id):
                     new_date = data["entry_date"]
                 entry.entry_date = datetime.combine(new_date, datetime.min.time())
 
+            await bump_data_version(s, user_id, "journal")
             await s.commit()
             return success_response(entry.to_dict())
     except (ValidationError, NotFoundError):
@@ -156,6 +170,7 @@ async def delete_journal(entry_id):
                     "Journal entry not found", details={"entry_id": entry_id}
                 )
             await s.delete(entry)
+            await bump_data_version(s, user_id, "journal")
             await s.commit()
             return ("", 204)
     except NotFoundError:
@@ -169,6 +184,7 @@ async def delete_journal(entry_id):
 
 @review_bp.route("/api/review/summary/daily", methods=["GET"])
 @auth_required
+@data_version_etag
 async def daily_summary():
     target_date = request.args.get("date", date.today().isoformat())
     # Handle both date and datetime strings
@@ -181,100 +197,73 @@ async def daily_summary():
 
     try:
         async with AsyncSessionLocal() as s:
-            # Tasks completed on that day (exclude archived)
-            result = await s.execute(
-                select(func.count())
-                .select_from(Task)
-                .where(
-                    func.date(Task.created_on) == target_date,
-                    Task.done == True,
-                    Task.created_by == user_id,
-                    Task.archived == False,
-                )
-            )
-            completed_tasks = result.scalar_one()
-
-            # Tasks created on that day (exclude archived)
-            result = await s.execute(
-                select(func.count())
-                .select_from(Task)
-                .where(
-                    func.date(Task.created_on) == target_date,
-                    Task.created_by == user_id,
-                    Task.archived == False,
-                )
+            # Created / completed counts and categories from the daily rollup
+            # (non-archived tasks). "Completed" keeps its meaning here: tasks
+            # created that day that are done.
+            day_rows = await get_daily_stats(
+                s, user_id, target_date, target_date + timedelta(days=1)
             )
-            created_tasks = result.scalar_one()
-
-            # To Do tasks - tasks with status_id = 1 (To Do) (exclude archived)
-            result = await s.execute(
-                select(func.count())
-                .select_from(Task)
-                .where(
-                    Task.status_id == 1,
-                    Task.done == False,
-                    Task.created_by == user_id,
-                    Task.archived == False,
-                )
-            )
-            todo_tasks = result.scalar_one()
+            created_tasks = sum(row.created for row in day_rows)
+            completed_tasks = sum(row.created_done for row in day_rows)
+            # Categories of the tasks created that day
+            categories = {
+                row.category_name: row.created
+                for row in day_rows
+                if row.category_id is not None and row.created
+            }
 
-            # Overdue tasks (exclude archived)
-            today = date.today()
-            result = await s.execute(
-                select(func.count())
-                .select_from(Task)
-                .where(
-                    Task.due_date < today,
-                    Task.done == False,
-                    Task.created_by == user_id,
-                    Task.archived == False,
+            # To Do / In Progress from the status counters, overdue from the
+            # open-task partial index and the journal entry, in one statement
+            statuses = await get_status_registry(s)
+            day_start = datetime.combine(target_date, time.min)
+
+            def open_in(status_id):
+                return (
+                    select(UserTaskStats.open_count)
+                    .where(
+                        UserTaskStats.user_id == user_id,
+                        UserTaskStats.status_id == status_id,
+                    )
+                    .scalar_subquery()
                 )
-            )
-            overdue_tasks = result.scalar_one()
 
-            # In progress tasks - only count tasks with status_id = 2 (In Progress) (exclude archived)
             result = await s.execute(
-                select(func.count())
-                .select_from(Task)
-                .where(
-                    Task.status_id == 2,
-                    Task.done == False,
-                    Task.created_by == user_id,
-                    Task.archived == False,
+                select(
+                    func.coalesce(open_in(statuses.todo_id), 0).label("todo"),
+                    func.coalesce(open_in(statuses.in_progress_id), 0).label(
+                        "in_progress"
+                    ),
+                    select(func.count())
+                    .select_from(Task)
+                    .where(
+                        Task.created_by == user_id,
+                        Task.done == False,
+                        Task.archived == False,
+                        Task.due_date < datetime.combine(date.today(), time.min),
+                    )
+                    .scalar_subquery()
+                    .label("overdue"),
+                    select(JournalEntry.content)
+                    .where(
+                        JournalEntry.user_id == user_id,
+                        JournalEntry.entry_date >= day_start,
+                        JournalEntry.entry_date < day_start + timedelta(days=1),
+                    )
+                    .order_by(JournalEntry.entry_date)
+                    .limit(1)
+                    .scalar_subquery()
+                    .label("journal"),
                 )
             )
-            in_progress_tasks = result.scalar_one()
+            row = result.one()
+            todo_tasks = row.todo
+            in_progress_tasks = row.in_progress
+            overdue_tasks = row.overdue
+            journal_content = row.journal
 
             # Time spent (since estimate_minutes field doesn't exist in new schema, set to 0)
             time_spent = 0
 
-            # Categories breakdown (exclude archived)
-            try:
-                from backend.db.models import Category
-            except ImportError:
-                from db.models import Category
-
-            result = await s.execute(
-                select(Category.name, func.count(Task.id))
-                .join(Task)
-                .where(
-                    func.date(Task.created_on) == target_date,
-                    Task.created_by == user_id,
-                    Task.category_id.isnot(None),
-                    Task.archived == False,
-                )
-                .group_by(Category.name)
-            )
-            categories = {row[0]: row[1] for row in result.all()}
-
-            # Journal entry
-            result = await s.execute(
-                select(JournalEntry).filter_by(entry_date=target_date, user_id=user_id)
-            )
-            journal = result.scalars().first()
-            journal_content = journal.content if journal else None
-
         return success_response(
             {
                 "date": target_date.isoformat(),
@@ -297,10 +286,25 @@ async def daily_summary():
 
 @review_bp.route("/api/review/summary/weekly", methods=["GET"])
 @auth_required
+@data_version_etag
 async def weekly_summary():
-    # For the current week
-    today = date.today()
-    start_of_week = today - timedelta(days=today.weekday())
+    """Completion summary for the 7 days from ?week_start=YYYY-MM-DD.
+
+    Defaults to the current week (from Monday). A task counts as completed
+    on the day of closed_on, falling back to created_on.
+    """
+    week_start = request.args.get("week_start")
+    if week_start:
+        try:
+            start_of_week = date.fromisoformat(week_start[:10])
+        except ValueError:
+            raise ValidationError(
+                "Invalid week_start, expected YYYY-MM-DD",
+                details={"field": "week_start"},
+            )
+    else:
+        today = date.today()
+        start_of_week = today - timedelta(days=today.weekday())
     end_of_week = start_of_week + timedelta(days=6)
 
     user_id = session.get("user_id")
@@ -308,87 +312,43 @@ async def weekly_summary():
         return jsonify({"error": "Authentication required"}), 401
 
     async with AsyncSessionLocal() as s:
-        # Tasks completed this week - use closed_on if available, otherwise created_on (exclude archived)
-        result = await s.execute(
-            select(func.count())
-            .select_from(Task)
-            .where(
-                func.coalesce(Task.closed_on, Task.created_on) >= start_of_week,
-                func.coalesce(Task.closed_on, Task.created_on)
-                <= end_of_week + timedelta(days=1),
-                Task.done == True,
-                Task.created_by == user_id,
-                Task.archived == False,
-            )
-        )
-        total_completed = result.scalar_one()
-
-        # Total tasks created this week (exclude archived)
-        result = await s.execute(
-            select(func.count())
-            .select_from(Task)
-            .where(
-                Task.created_on >= start_of_week,
-                Task.created_on <= end_of_week + timedelta(days=1),
-                Task.created_by == user_id,
-                Task.archived == False,
-            )
+        # Non-archived tasks created / completed (closed_on, else created_on)
+        # on each day of the week, from the daily rollup
+        day_rows = await get_daily_stats(
+            s, user_id, start_of_week, start_of_week + timedelta(days=7)
         )
-        total_tasks = result.scalar_one()
 
-        # Average daily completion
-        days_in_week = 7
-        average_daily = total_completed / days_in_week if days_in_week > 0 else 0
-
-        # Daily breakdown - ensure proper weekday order (exclude archived)
-        daily_breakdown = []
-        max_count = 0
-        most_productive_day = None
-
-        for i in range(7):
-            day = start_of_week + timedelta(days=i)
-            result = await s.execute(
-                select(func.count())
-                .select_from(Task)
-                .where(
-                    func.date(func.coalesce(Task.closed_on, Task.created_on)) == day,
-                    Task.done == True,
-                    Task.created_by == user_id,
-                    Task.archived == False,
-                )
-            )
-            count = result.scalar_one()
-            day_name = day.strftime("%A")
-            daily_breakdown.append(
-                {"day": day_name, "count": count, "date": day.isoformat()}
-            )
-
-            # Track most productive day
-            if count > max_count:
-                max_count = count
-                most_productive_day = day_name
-
-        # Total time spent (estimate_minutes field doesn't exist in new schema)
-        total_time = 0  # Convert to hours
-
-        # Category performance (exclude archived)
-        from backend.db.models import Category
-
-        result = await s.execute(
-            select(Category.name, func.count(Task.id))
-            .join(Task)
-            .where(
-                func.coalesce(Task.closed_on, Task.created_on) >= start_of_week,
-                func.coalesce(Task.closed_on, Task.created_on)
-                <= end_of_week + timedelta(days=1),
-                Task.done == True,
-                Task.created_by == user_id,
-                Task.category_id.isnot(None),
-                Task.archived == False,
-            )
-            .group_by(Category.name)
-        )
-        category_performance = {row[0]: {"completed": row[1]} for row in result.all()}
+    completed_by_day: dict[date, int] = {}
+    category_performance: dict[str, dict] = {}
+    for row in day_rows:
+        completed_by_day[row.day] = completed_by_day.get(row.day, 0) + row.completed
+        if row.category_id is not None and row.completed:
+            entry = category_performance.setdefault(row.category_name, {"completed": 0})
+            entry["completed"] += row.completed
+    total_completed = sum(completed_by_day.values())
+    total_tasks = sum(row.created for row in day_rows)
+
+    # Average daily completion
+    days_in_week = 7
+    average_daily = total_completed / days_in_week if days_in_week > 0 else 0
+
+    # Daily breakdown in weekday order, with empty days filled in
+    daily_breakdown = []
+    max_count = 0
+    most_productive_day = None
+    for i in range(7):
+        day = start_of_week + timedelta(days=i)
+        count = completed_by_day.get(day, 0)
+        day_name = day.strftime("%A")
+        daily_breakdown.append({"day": day_name, "count": count, "date": day.isoformat()})
+
+        # Track most productive day
+        if count > max_count:
+            max_count = count
+            most_productive_day = day_name
+
+    # Total time spent (estimate_minutes field doesn't exist in new schema)
+    total_time = 0  # Convert to hours
 
     return jsonify(
         {
@@ -406,31 +366,40 @@ async def weekly_summary():
     )
 
 
+# Trend horizon for /api/review/insights, in weeks
+DEFAULT_TREND_WEEKS = 4
+MAX_TREND_WEEKS = 104
+
+
+def _weeks_ago_label(weeks_ago: int) -> str:
+    if weeks_ago == 0:
+        return "This Week"
+    if weeks_ago == 1:
+        return "Last Week"
+    return f"{weeks_ago} Weeks Ago"
+
+
 @review_bp.route("/api/review/insights", methods=["GET"])
 @auth_required
+@data_version_etag
 async def get_insights():
-    # Simple insights
+    """Completion stats and weekly trends.
+
+    ?weeks= sets the trend horizon (default 4, up to MAX_TREND_WEEKS);
+    most_productive_day is the best day within it. Any horizon costs the
+    same two queries.
+    """
     user_id = session.get("user_id")
     if not user_id:
         return jsonify({"error": "Authentication required"}), 401
+    weeks = request.args.get("weeks", DEFAULT_TREND_WEEKS, type=int)
+    weeks = max(1, min(weeks, MAX_TREND_WEEKS))
 
     async with AsyncSessionLocal() as s:
-        # Basic stats (exclude archived)
-        result = await s.execute(
-            select(func.count())
-            .select_from(Task)
-            .where(Task.created_by == user_id, Task.archived == False)
-        )
-        total_tasks = result.scalar_one()
-
-        result = await s.execute(
-            select(func.count())
-            .select_from(Task)
-            .where(
-                Task.done == True, Task.created_by == user_id, Task.archived == False
-            )
-        )
-        completed_tasks = result.scalar_one()
+        # Basic stats (exclude archived), from the materialized counters
+        stats = await get_task_stats(s, user_id)
+        total_tasks = stats.active
+        completed_tasks = stats.done
 
         completion_rate = (
             (completed_tasks / total_tasks * 100) if total_tasks > 0 else 0
@@ -442,60 +411,37 @@ async def get_insights():
         # Productivity score (based on completion rate and other factors)
         productivity_score = min(100, completion_rate * 1.2)  # Simple calculation
 
-        # Most productive day (exclude archived) - use closed_on when available
-        result = await s.execute(
-            select(
-                func.date(func.coalesce(Task.closed_on, Task.created_on)).label("date"),
-                func.count(Task.id).label("count"),
-            )
-            .where(
-                Task.done == True, Task.created_by == user_id, Task.archived == False
-            )
-            .group_by(func.date(func.coalesce(Task.closed_on, Task.created_on)))
-            .order_by(func.count(Task.id).desc())
-        )
-        productive_days = result.first()
-
-        # Performance trends (last 4 weeks including current week, exclude archived) - use closed_on when available
-        performance_trends = []
-        for weeks_ago in range(3, -1, -1):  # Changed to include current week (0)
-            week_start = date.today() - timedelta(
-                days=date.today().weekday() + (weeks_ago * 7)
-            )
-            week_end = week_start + timedelta(days=6)
-
-            result = await s.execute(
-                select(func.count())
-                .select_from(Task)
-                .where(
-                    func.coalesce(Task.closed_on, Task.created_on) >= week_start,
-                    func.coalesce(Task.closed_on, Task.created_on)
-                    <= week_end + timedelta(days=1),
-                    Task.done == True,
-                    Task.created_by == user_id,
-                    Task.archived == False,
+        # Completions per day over the trend horizon (exclude archived) - by
+        # closed_on when available - from the daily rollup. The same rows
+        # feed both the weekly trends and the most productive day.
+        this_week = date.today() - timedelta(days=date.today().weekday())
+        first_week = this_week - timedelta(weeks=weeks - 1)
+        completed_by_day: dict[date, int] = {}
+        for row in await get_daily_stats(
+            s, user_id, first_week, this_week + timedelta(weeks=1)
+        ):
+            if row.completed:
+                completed_by_day[row.day] = (
+                    completed_by_day.get(row.day, 0) + row.completed
                 )
-            )
-            weekly_completed = result.scalar_one()
-
-            # More intuitive labeling
-            if weeks_ago == 0:
-                period_label = "This Week"
-            elif weeks_ago == 1:
-                period_label = "Last Week"
-            elif weeks_ago == 2:
-                period_label = "2 Weeks Ago"
-            elif weeks_ago == 3:
-                period_label = "3 Weeks Ago"
-            else:
-                period_label = f"{weeks_ago} Weeks Ago"
 
+        productive_day, productive_count = None, 0
+        weekly_completed = [0] * weeks
+        for day, count in completed_by_day.items():
+            if count > productive_count:
+                productive_day, productive_count = day, count
+            weekly_completed[(day - first_week).days // 7] += count
+
+        # Performance trends (oldest first, ending with the current week)
+        performance_trends = []
+        for week, completed in enumerate(weekly_completed):
+            week_start = first_week + timedelta(weeks=week)
             performance_trends.append(
                 {
-                    "period": period_label,
-                    "completed": weekly_completed,
+                    "period": _weeks_ago_label(weeks - 1 - week),
+                    "completed": completed,
                     "week_start": week_start.isoformat(),
-                    "week_end": week_end.isoformat(),
+                    "week_end": (week_start + timedelta(days=6)).isoformat(),
                 }
             )
 
@@ -507,14 +453,14 @@ async def get_insights():
             strengths.append("High task completion rate")
         if avg_task_time < 60:
             strengths.append("Efficient task completion time")
-        if productive_days and productive_days.count > 3:
+        if productive_count > 3:
             strengths.append("Consistent daily productivity")
 
         if completion_rate < 50:
             improvements.append("Focus on completing more tasks")
         if total_tasks < 5:
             improvements.append("Create more tasks to build momentum")
-        if not productive_days:
+        if not completed_tasks:
             improvements.append("Start completing tasks regularly")
 
         # Recommendations
@@ -541,10 +487,10 @@ async def get_insights():
             "productivity_score": round(productivity_score, 1),
             "completion_rate": round(completion_rate, 1),
             "avg_task_time": round(avg_task_time, 1),
-            "most_productive_day": productive_days.date if productive_days else None,
-            "tasks_on_most_productive_day": (
-                productive_days.count if productive_days else 0
+            "most_productive_day": (
+                productive_day.isoformat() if productive_day else None
             ),
+            "tasks_on_most_productive_day": productive_count,
             "performance_trends": performance_trends,
             "strengths": strengths,
             "improvements": improvements,
@@ -7,10 +7,12 @@ try:
     from backend.db.engine_async import AsyncSessionLocal
     from backend.db.models import UserSession
     from backend.security.auth_decorators import auth_required
+    from backend.security.session_cache import session_cache
 except ImportError:
     from db.engine_async import AsyncSessionLocal
     from db.models import UserSession
     from backend.security.auth_decorators import auth_required
+    from backend.security.session_cache import session_cache
 
 sessions_bp = Blueprint("sessions", __name__, url_prefix="/api/sessions")
 
@@ -26,6 +28,9 @@ async def get_current_sessions():
     they don't recognize.
     """
     try:
+        # Write buffered activity first so last_activity is current
+        await session_cache.flush()
+
         async with AsyncSessionLocal() as db_session:
             # Find all active sessions for this user
             result = await db_session.execute(
@@ -85,6 +90,8 @@ async def force_logout_session(session_id):
             # Mark session as inactive (this will force them to log in again)
             target_session.is_active = False
             await db_session.commit()
+            # Drop it from the validation cache so it is rejected right away
+            session_cache.invalidate(target_session.session_id)
 
             return jsonify({"message": "Session terminated successfully"})
 
@@ -125,6 +132,7 @@ async def logout_all_other_sessions():
                 count += 1
 
             await db_session.commit()
+            session_cache.invalidate(*(s.session_id for s in other_sessions))
 
             return jsonify(
                 {
@@ -144,42 +152,25 @@ async def cleanup_expired_sessions():
     Delete expired sessions from the database.
 
     This helps keep the database clean and prevents it from filling up
-    with old session records. Can be called manually or via a scheduled job.
-
-    Note: Only admins should call this in production, or it should be
-    triggered by a background task.
+    with old session records. The maintenance scheduler already runs the
+    same reaper in the background; this endpoint triggers it on demand.
     """
     try:
-        async with AsyncSessionLocal() as db_session:
-            # Find all expired sessions
-            result = await db_session.execute(
-                select(UserSession).where(
-                    and_(
-                        UserSession.expires_at != None,
-                        UserSession.expires_at < datetime.now(),
-                    )
-                )
-            )
-            expired_sessions = result.scalars().all()
+        from backend.services.scheduler import reap_sessions
 
-            # Delete them
-            count = 0
-            for expired in expired_sessions:
-                await db_session.delete(expired)
-                count += 1
+        # Bulk DELETE in bounded batches instead of loading every row
+        count = await reap_sessions(inactive_days=None)
 
-            await db_session.commit()
-
-            import logging
+        import logging
 
-            logging.info(f"Cleaned up {count} expired sessions")
+        logging.info(f"Cleaned up {count} expired sessions")
 
-            return jsonify(
-                {
-                    "message": f"Cleaned up {count} expired sessions",
-                    "deleted_count": count,
-                }
-            )
+        return jsonify(
+            {
+                "message": f"Cleaned up {count} expired sessions",
+                "deleted_count": count,
+            }
+        )
 
     except Exception as e:
         import logging
@@ -6,6 +6,7 @@ try:
     from backend.db.models import Configuration
     from backend.security.auth_decorators import auth_required
     from backend.db.engine_async import AsyncSessionLocal
+    from backend.data_version import bump_data_version, data_version_etag
     from backend.errors import (
         ValidationError,
         AuthenticationError,
@@ -16,6 +17,7 @@ except ImportError:
     from db.models import Configuration
     from backend.security.auth_decorators import auth_required
     from db.engine_async import AsyncSessionLocal
+    from data_version import bump_data_version, data_version_etag
     from errors import (
         ValidationError,
         AuthenticationError,
@@ -60,6 +62,7 @@ async def get_settings():
 
 @settings_bp.route("/api/settings", methods=["GET"])
 @auth_required
+@data_version_etag
 async def get_all_settings():
     settings = await get_settings()
     return success_response(settings.to_dict())
@@ -104,6 +107,7 @@ async def update_settings():
             if "theme" in data:
                 settings.theme = data["theme"]
 
+            await bump_data_version(s, user_id, "settings")
             await s.commit()
             await s.refresh(settings)
             return success_response(settings.to_dict())
@@ -137,6 +141,7 @@ async def update_notes():
             if "enabled" in data:
                 settings.notes_enabled = bool(data["enabled"])
 
+            await bump_data_version(s, user_id, "settings")
             await s.commit()
             await s.refresh(settings)
             return success_response({"notes_enabled": settings.notes_enabled})
@@ -170,6 +175,7 @@ async def update_timer():
             if "enabled" in data:
                 settings.timer_enabled = bool(data["enabled"])
 
+            await bump_data_version(s, user_id, "settings")
             await s.commit()
             await s.refresh(settings)
             return success_response({"timer_enabled": settings.timer_enabled})
@@ -203,6 +209,7 @@ async def update_ai_url():
             if "url" in data:
                 settings.ai_url = data["url"]
 
+            await bump_data_version(s, user_id, "settings")
             await s.commit()
             await s.refresh(settings)
             return success_response({"ai_url": settings.ai_url})
@@ -236,6 +243,7 @@ async def update_auto_lock():
             if "minutes" in data:
                 settings.auto_lock_minutes = int(data["minutes"])
 
+            await bump_data_version(s, user_id, "settings")
             await s.commit()
             await s.refresh(settings)
             return success_response({"auto_lock_minutes": settings.auto_lock_minutes})
@@ -269,6 +277,7 @@ async def update_theme():
             if "theme" in data:
                 settings.theme = data["theme"]
 
+            await bump_data_version(s, user_id, "settings")
             await s.commit()
             await s.refresh(settings)
             return success_response({"theme": settings.theme})
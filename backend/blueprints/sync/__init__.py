@@ -0,0 +1,4 @@
+"""Sync blueprint initialization."""
+from .routes import sync_bp
+
+__all__ = ["sync_bp"]
@@ -0,0 +1,44 @@
+"""Delta sync endpoint: what changed since a client's last change token."""
+import logging
+from quart import Blueprint, request, session
+from backend.db.engine_async import AsyncSessionLocal
+from backend.db.sync import SYNC_PAGE_SIZE, changes_since
+from backend.security.auth_decorators import auth_required
+from backend.data_version import data_version_etag
+from backend.errors import ValidationError, DatabaseError, success_response
+
+sync_bp = Blueprint("sync", __name__, url_prefix="/api/sync")
+
+
+def _since_arg() -> int:
+    value = request.args.get("since", "0") or "0"
+    try:
+        since = int(value)
+    except ValueError:
+        since = -1
+    if since < 0:
+        raise ValidationError("Invalid sync token", details={"field": "since"})
+    return since
+
+
+@sync_bp.route("", methods=["GET"])
+@auth_required
+@data_version_etag
+async def get_changes():
+    """Tasks, journal entries and categories changed since ?since=<token>.
+
+    Returns the changed rows in their usual shapes, ids deleted since the
+    token under "deleted", and the token to send next time. Omit since (or
+    pass 0) for a full snapshot. Follow has_more with the returned token;
+    ?limit= caps the changes per call (default and max SYNC_PAGE_SIZE).
+    """
+    since = _since_arg()
+    limit = request.args.get("limit", SYNC_PAGE_SIZE, type=int)
+    limit = max(1, min(limit, SYNC_PAGE_SIZE))
+    try:
+        async with AsyncSessionLocal() as db_session:
+            batch = await changes_since(db_session, session["user_id"], since, limit)
+        return success_response(batch.to_dict())
+    except Exception:
+        logging.exception("Failed to load sync changes")
+        raise DatabaseError("Failed to load sync changes")
@@ -1,16 +1,32 @@
-from quart import Blueprint, request, jsonify, session
+from quart import Blueprint, current_app, request, jsonify, session
+import base64
+import json
 import logging
-from datetime import datetime, date, timedelta
-from sqlalchemy import select, and_, func
+from datetime import datetime, date, time, timedelta
+from sqlalchemy import select, update, and_, case, func, tuple_
 from sqlalchemy.orm import selectinload
 from backend.db.engine_async import AsyncSessionLocal
-from backend.db.models import Task, Status, Category
+from backend.db.models import Task, Category
+from backend.db.categories import resolve_category_id
+from backend.db.positions import move_task, next_position, rebalance_positions_later
+from backend.db.projections import (
+    TASK_FIELDS,
+    fetch_task_dicts,
+    fetch_task_rows,
+    task_projection,
+)
+from backend.db.search import search_tasks
+from backend.db.statuses import TODO_STATUS_ID, get_status_registry
+from backend.db.task_tree import MAX_TREE_DEPTH, is_in_subtree, load_task_trees
 from backend.security.auth_decorators import auth_required
 from backend.cache_utils import cache
+from backend.data_version import bump_data_version, data_version_etag
 from backend.errors import (
+    ConflictError,
     ValidationError,
     NotFoundError,
     DatabaseError,
+    APIError,
     success_response,
 )
 
@@ -19,96 +35,187 @@ from backend.validation import TaskValidator, create_validation_error_response
 tasks_bp = Blueprint("tasks", __name__, url_prefix="/api/tasks")
 
 
-async def resolve_category_name_to_id(
-    category_name: str, db_session, user_id: int
-) -> int | None:
-    """
-    Resolve a category name to its database ID, creating it if needed.
-    Thread-safe with proper locking to prevent race conditions.
-    """
-    if not category_name or not category_name.strip():
-        return None
+def encode_task_cursor(updated_on: datetime, task_id: int) -> str:
+    """Build an opaque cursor pointing just after the given task."""
+    raw = json.dumps([updated_on.isoformat(), task_id]).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
 
-    category_name = category_name.strip()
 
-    # First attempt: try to get existing category
-    result = await db_session.execute(
-        select(Category)
-        .where(and_(Category.name == category_name, Category.created_by == user_id))
-        .with_for_update()  # Lock the row to prevent race conditions
-    )
-    existing_category = result.scalars().first()
+def decode_task_cursor(cursor: str) -> tuple[datetime, int]:
+    """Parse a cursor produced by encode_task_cursor."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        updated_on, task_id = json.loads(base64.urlsafe_b64decode(padded))
+        return datetime.fromisoformat(updated_on), int(task_id)
+    except Exception:
+        raise ValidationError("Invalid cursor", details={"field": "cursor"})
 
-    if existing_category:
-        return existing_category.id
 
-    # Category doesn't exist, create it with exception handling for race conditions
-    try:
-        new_category = Category(
-            name=category_name,
-            description=f"Auto-created category: {category_name}",
-            color_hex="808080",
-            created_by=user_id,
+def invalidate_task_counts(user_id: int):
+    """Drop cached task totals after a write that adds, removes, archives or
+    re-parents tasks."""
+    cache.clear(f"active_task_count_user_{user_id}")
+    cache.clear(f"active_top_level_task_count_user_{user_id}")
+
+
+async def count_active_tasks(
+    db_session, user_id: int, top_level_only: bool = False
+) -> int:
+    """Count the user's non-archived tasks, cached briefly between pages.
+
+    top_level_only counts just tasks without a parent, as listed by
+    ?subtasks=.
+    """
+    conditions = [Task.created_by == user_id, Task.archived == False]
+    if top_level_only:
+        cache_key = f"active_top_level_task_count_user_{user_id}"
+        conditions.append(Task.parent_id.is_(None))
+    else:
+        cache_key = f"active_task_count_user_{user_id}"
+    cached_total = cache.get(cache_key)
+    if cached_total is not None:
+        return cached_total
+
+    count_result = await db_session.execute(
+        select(func.count(Task.id)).where(and_(*conditions))
+    )
+    total = count_result.scalar() or 0
+    cache.set(cache_key, total, ttl_seconds=60)
+    return total
+
+
+def _tree_depth(arg: str, default: int | None = None) -> int | None:
+    """Read a subtree depth query parameter, clamped to MAX_TREE_DEPTH."""
+    if arg not in request.args:
+        return default
+    depth = request.args.get(arg, type=int)
+    if depth is None or depth < 0:
+        raise ValidationError(
+            f"{arg} must be a non-negative integer", details={"field": arg}
         )
-        db_session.add(new_category)
-        await db_session.flush()
-        return new_category.id
-    except Exception:
-        # Race condition: another transaction created it, rollback and retry
-        await db_session.rollback()
+    return min(depth, MAX_TREE_DEPTH)
 
-        # Retry: fetch the category that was just created by another transaction
-        result = await db_session.execute(
-            select(Category).where(
-                and_(Category.name == category_name, Category.created_by == user_id)
-            )
+
+def _fields_arg() -> frozenset[str] | None:
+    """Read ?fields=a,b,... as a set of task fields (id is always included).
+
+    Returns None when the parameter is absent, meaning every field.
+    """
+    value = request.args.get("fields")
+    if value is None:
+        return None
+    fields = {name.strip() for name in value.split(",") if name.strip()}
+    unknown = sorted(fields.difference(TASK_FIELDS))
+    if unknown:
+        raise ValidationError(
+            f"Unknown task fields: {', '.join(unknown)}",
+            details={"field": "fields", "allowed": list(TASK_FIELDS)},
         )
-        retry_category = result.scalars().first()
+    return frozenset(fields | {"id"})
 
-        if retry_category:
-            return retry_category.id
 
-        # If still not found, something went wrong
-        raise
+async def _with_subtasks(db_session, user_id: int, tasks: list, depth: int) -> list:
+    """Replace each listed task with its subtree node, keeping list order."""
+    trees = await load_task_trees(
+        db_session, user_id, [task["id"] for task in tasks], depth
+    )
+    return [trees.get(task["id"], task) for task in tasks]
 
 
 @tasks_bp.route("/", methods=["GET"])
 @tasks_bp.route("", methods=["GET"])
 @auth_required
+@data_version_etag
 async def get_tasks():
-    """Get all non-archived tasks for the user with pagination."""
+    """Get all non-archived tasks for the user with pagination.
+
+    Page-number mode (default): ?page=&per_page= returns a total and page count.
+    Cursor mode: pass ?cursor= (empty for the first page) and follow
+    pagination.next_cursor. It is keyed on (updated_on, id), so deep pages
+    cost the same as the first one. Add include_total=1 for a cached total.
+    ?subtasks=<depth> lists only top-level tasks, each with its subtask
+    tree and rolled-up counts (see /<id>/tree).
+    ?fields=title,status,... returns only those task fields (plus id);
+    subtask tree nodes are always complete.
+    """
     try:
-        page = request.args.get("page", 1, type=int)
         per_page = request.args.get("per_page", 20, type=int)
+        user_id = session["user_id"]
+        subtask_depth = _tree_depth("subtasks")
+        fields = _fields_arg()
+        base_query = (
+            task_projection(fields, extra=(Task.updated_on,))
+            .where(and_(Task.created_by == user_id, Task.archived == False))
+            .order_by(Task.updated_on.desc(), Task.id.desc())
+        )
+        if subtask_depth is not None:
+            base_query = base_query.where(Task.parent_id.is_(None))
+
+        if "cursor" in request.args:
+            cursor = request.args.get("cursor", "")
+            include_total = request.args.get("include_total", "0") in ("1", "true")
+            per_page = max(1, min(per_page, 100))
+
+            query = base_query
+            if cursor:
+                after_updated_on, after_id = decode_task_cursor(cursor)
+                query = query.where(
+                    tuple_(Task.updated_on, Task.id)
+                    < tuple_(after_updated_on, after_id)
+                )
+
+            async with AsyncSessionLocal() as db_session:
+                # Fetch one extra row to know whether another page exists
+                rows, tasks = await fetch_task_rows(
+                    db_session, query.limit(per_page + 1), fields
+                )
+                has_more = len(tasks) > per_page
+                tasks = tasks[:per_page]
+                if subtask_depth is not None:
+                    tasks = await _with_subtasks(
+                        db_session, user_id, tasks, subtask_depth
+                    )
+
+                pagination = {
+                    "per_page": per_page,
+                    "has_more": has_more,
+                    "next_cursor": (
+                        encode_task_cursor(
+                            rows[per_page - 1].updated_on, rows[per_page - 1].id
+                        )
+                        if has_more
+                        else None
+                    ),
+                }
+                if include_total:
+                    pagination["total"] = await count_active_tasks(
+                        db_session, user_id, top_level_only=subtask_depth is not None
+                    )
+
+                return success_response(
+                    {
+                        "tasks": tasks,
+                        "pagination": pagination,
+                    }
+                )
+
+        page = request.args.get("page", 1, type=int)
         offset = (page - 1) * per_page
 
         async with AsyncSessionLocal() as db_session:
-            count_result = await db_session.execute(
-                select(func.count(Task.id)).where(
-                    and_(Task.created_by == session["user_id"], Task.archived == False)
-                )
+            total = await count_active_tasks(
+                db_session, user_id, top_level_only=subtask_depth is not None
             )
-            total = count_result.scalar() or 0
 
-            result = await db_session.execute(
-                select(Task)
-                .options(
-                    selectinload(Task.status),
-                    selectinload(Task.tags),
-                    selectinload(Task.category),
-                )
-                .where(
-                    and_(Task.created_by == session["user_id"], Task.archived == False)
-                )
-                .order_by(Task.updated_on.desc())
-                .limit(per_page)
-                .offset(offset)
+            tasks = await fetch_task_dicts(
+                db_session, base_query.limit(per_page).offset(offset), fields
             )
-            tasks = result.scalars().all()
+            if subtask_depth is not None:
+                tasks = await _with_subtasks(db_session, user_id, tasks, subtask_depth)
 
             return success_response(
                 {
-                    "tasks": [task.to_dict() for task in tasks],
+                    "tasks": tasks,
                     "pagination": {
                         "page": page,
                         "per_page": per_page,
@@ -117,6 +224,8 @@ async def get_tasks():
                     },
                 }
             )
+    except ValidationError:
+        raise
     except Exception:
         logging.exception("Failed to fetch tasks")
         raise DatabaseError("Failed to fetch tasks")
@@ -137,44 +246,12 @@ async def create_task():
         validated_data = TaskValidator.validate_task_data(data)
 
         async with AsyncSessionLocal() as db_session:
-            # Get or default status_id
-            if "status_id" in validated_data:
-                status_id = validated_data["status_id"]
-                # Verify status exists
-                status_result = await db_session.execute(
-                    select(Status).where(Status.id == status_id)
-                )
-                if not status_result.scalar_one_or_none():
-                    raise ValidationError(
-                        "Invalid status ID", details={"field": "status_id"}
-                    )
-            else:
-                res = await db_session.execute(select(Status).limit(1))
-                first_status = res.scalars().first()
-                status_id = first_status.id if first_status else 1
-
-            # Handle category with thread-safe creation
-            category_id = None
-            if "category" in validated_data:
-                category_id = await resolve_category_name_to_id(
-                    validated_data["category"], db_session, session["user_id"]
-                )
-
-            # Create task with validated data
-            task = Task(
-                title=validated_data["title"],
-                description=validated_data["description"],
-                category_id=category_id,
-                status_id=status_id,
-                due_date=validated_data["due_date"] or datetime.now(),
-                priority=validated_data["priority"],
-                estimate_minutes=validated_data["estimate_minutes"],
-                created_by=session["user_id"],
-            )
-
+            task = await _build_task(db_session, validated_data, session["user_id"])
             db_session.add(task)
+            await bump_data_version(db_session, session["user_id"], "task", "category")
             await db_session.commit()
             await db_session.refresh(task)
+            invalidate_task_counts(session["user_id"])
 
             return success_response(
                 {"message": "Task created successfully", "task_id": task.id}, 201
@@ -190,71 +267,232 @@ async def create_task():
         raise DatabaseError("Failed to create task")
 
 
-async def get_cached_statuses(db_session):
-    """Get all statuses with caching - speeds up loading."""
-    cached_statuses = cache.get("all_statuses")
-    if cached_statuses is not None:
-        return cached_statuses
-
-    status_result = await db_session.execute(select(Status))
-    statuses = status_result.scalars().all()
-    cache.set("all_statuses", statuses, ttl_seconds=1800)
-    return statuses
+def _kanban_limit() -> int:
+    """Per-column task limit from ?limit= (default 100, max 500)."""
+    limit = request.args.get("limit", 100, type=int)
+    return max(1, min(limit, 500))
+
+
+def _kanban_column(status, rows: list, tasks: list, limit: int) -> dict:
+    """Build one board column from up to limit + 1 rows and their task dicts."""
+    has_more = len(tasks) > limit
+    return {
+        "status_id": status.id,
+        "name": status.title,
+        "tasks": tasks[:limit],
+        "has_more": has_more,
+        "next_cursor": (
+            encode_task_cursor(rows[limit - 1].updated_on, rows[limit - 1].id)
+            if has_more
+            else None
+        ),
+    }
+
+
+def _kanban_task_query(fields):
+    """Projection of the requested fields plus what grouping and cursors need."""
+    return task_projection(fields, extra=(Task.status_id, Task.updated_on))
+
+
+async def _build_task(db_session, validated_data: dict, user_id: int) -> Task:
+    """Create a Task from TaskValidator.validate_task_data output (not yet added)."""
+    statuses = await get_status_registry(db_session)
+    if "status_id" in validated_data:
+        status_id = validated_data["status_id"]
+        if status_id not in statuses:
+            raise ValidationError("Invalid status ID", details={"field": "status_id"})
+    else:
+        status_id = statuses.default_id or TODO_STATUS_ID
+
+    category_id = None
+    if "category" in validated_data:
+        category_id = await resolve_category_id(
+            db_session, user_id, validated_data["category"]
+        )
 
+    parent_id = validated_data.get("parent_id")
+    if parent_id is not None:
+        await _check_parent(db_session, parent_id, user_id)
+
+    # Create task with validated data
+    return Task(
+        parent_id=parent_id,
+        title=validated_data["title"],
+        description=validated_data["description"],
+        category_id=category_id,
+        status_id=status_id,
+        due_date=validated_data["due_date"] or datetime.now(),
+        priority=validated_data["priority"],
+        estimate_minutes=validated_data["estimate_minutes"],
+        created_by=user_id,
+        position=next_position(user_id),
+    )
 
-async def _resolve_status_id(
-    db_session, fallback_id: int, *preferred_titles: str
-) -> int | None:
-    """Resolve a status id by title with an optional fallback."""
-    statuses = await get_cached_statuses(db_session)
-    normalized_titles = {title.strip().lower() for title in preferred_titles if title}
 
-    for status in statuses:
-        title = getattr(status, "title", "")
-        if title and title.strip().lower() in normalized_titles:
-            return status.id
+async def _check_parent(db_session, parent_id: int, user_id: int, task_id=None):
+    """Ensure parent_id is the user's task and would not create a cycle."""
+    parent = await db_session.get(Task, parent_id)
+    if not parent or parent.created_by != user_id:
+        raise ValidationError("Invalid parent task", details={"field": "parent_id"})
+    if task_id is not None and await is_in_subtree(db_session, task_id, parent_id):
+        raise ValidationError(
+            "A task cannot be moved under itself or its subtasks",
+            details={"field": "parent_id"},
+        )
 
-    for status in statuses:
-        if status.id == fallback_id:
-            return status.id
 
-    return None
+def _as_int(data: dict, field: str) -> int:
+    try:
+        return int(data[field])
+    except (KeyError, ValueError, TypeError):
+        raise ValidationError(f"{field} must be a number", details={"field": field})
+
+
+def validate_task_update(data: dict) -> dict:
+    """Validate the fields of a partial task update and return cleaned values."""
+    changes = {}
+    if "title" in data:
+        changes["title"] = TaskValidator.validate_title(data["title"])
+    if "description" in data:
+        changes["description"] = TaskValidator.validate_description(
+            data.get("description")
+        )
+    if "notes" in data:
+        changes["notes"] = data["notes"]
+    for flag in ("done", "archived", "priority"):
+        if flag in data:
+            changes[flag] = bool(data[flag])
+    if "estimate_minutes" in data:
+        changes["estimate_minutes"] = TaskValidator.validate_estimate_minutes(
+            data.get("estimate_minutes")
+        )
+    if "order" in data:
+        changes["order"] = _as_int(data, "order")
+    if "category" in data:
+        changes["category"] = data["category"]
+    elif "category_id" in data:
+        changes["category_id"] = data["category_id"]
+    if "due_date" in data:
+        changes["due_date"] = TaskValidator.validate_due_date(data.get("due_date"))
+    if "status_id" in data:
+        changes["status_id"] = _as_int(data, "status_id")
+    if "parent_id" in data:
+        changes["parent_id"] = TaskValidator.validate_parent_id(data["parent_id"])
+    return changes
+
+
+async def _apply_task_update(db_session, task: Task, changes: dict, user_id: int):
+    """Apply validate_task_update output to a loaded task.
+
+    Every check that can raise runs before the first field is set, so a
+    rejected update leaves the task untouched.
+    """
+    if changes.get("parent_id") is not None:
+        await _check_parent(db_session, changes["parent_id"], user_id, task.id)
+
+    if "category" in changes:
+        changes = {
+            **changes,
+            "category_id": await resolve_category_id(
+                db_session, user_id, changes["category"]
+            ),
+        }
+
+    status_id = changes.get("status_id")
+    if status_id is None and "done" in changes:
+        statuses = await get_status_registry(db_session)
+        status_id = statuses.done_id if changes["done"] else statuses.todo_id
+
+    for field in (
+        "title",
+        "description",
+        "notes",
+        "archived",
+        "priority",
+        "estimate_minutes",
+        "order",
+        "parent_id",
+    ):
+        if field in changes:
+            setattr(task, field, changes[field])
+
+    if "done" in changes:
+        is_done = changes["done"]
+        task.done = is_done
+        # Set closed_on timestamp when task is completed
+        if is_done and not task.closed_on:
+            task.closed_on = datetime.now()
+        elif not is_done:
+            # Clear closed_on if task is marked as incomplete
+            task.closed_on = None
+
+    if "category_id" in changes:
+        task.category_id = changes["category_id"]
+
+    if "due_date" in changes:
+        task.due_date = changes["due_date"] if changes["due_date"] else None
+
+    if status_id is not None:
+        task.status_id = status_id
 
 
 @tasks_bp.route("/kanban", methods=["GET"])
 @auth_required
+@data_version_etag
 async def get_kanban_board():
-    """Display kanban board grouped by status."""
+    """Display kanban board grouped by status.
+
+    Every column is filled from one task query: ROW_NUMBER() per status keeps
+    at most ?limit= tasks per column, and columns with more tasks return a
+    next_cursor for GET /kanban/<status_id>. ?fields= trims each task as
+    on GET /api/tasks.
+    """
+    limit = _kanban_limit()
+    fields = _fields_arg()
     try:
         async with AsyncSessionLocal() as db_session:
-            statuses = await get_cached_statuses(db_session)
-
-            kanban_data = {}
-
-            for status in statuses:
-                task_result = await db_session.execute(
-                    select(Task)
-                    .options(
-                        selectinload(Task.status),
-                        selectinload(Task.tags),
-                        selectinload(Task.category),
+            statuses = await get_status_registry(db_session)
+
+            ranked = (
+                select(
+                    Task.id,
+                    func.row_number()
+                    .over(
+                        partition_by=Task.status_id,
+                        order_by=(Task.updated_on.desc(), Task.id.desc()),
                     )
-                    .where(
-                        and_(
-                            Task.created_by == session["user_id"],
-                            Task.status_id == status.id,
-                            Task.archived == False,
-                        )
+                    .label("rn"),
+                )
+                .where(
+                    and_(
+                        Task.created_by == session["user_id"],
+                        Task.archived == False,
                     )
-                    .order_by(Task.updated_on.desc())
                 )
-                tasks = task_result.scalars().all()
+                .subquery()
+            )
+            rows, tasks = await fetch_task_rows(
+                db_session,
+                _kanban_task_query(fields)
+                .join(ranked, Task.id == ranked.c.id)
+                .where(ranked.c.rn <= limit + 1)
+                .order_by(Task.updated_on.desc(), Task.id.desc()),
+                fields,
+            )
 
-                kanban_data[status.title.lower().replace(" ", "_")] = {
-                    "status_id": status.id,
-                    "name": status.title,
-                    "tasks": [task.to_dict() for task in tasks],
-                }
+            by_status: dict[int, tuple[list, list]] = {}
+            for row, task in zip(rows, tasks):
+                column_rows, column_tasks = by_status.setdefault(
+                    row.status_id, ([], [])
+                )
+                column_rows.append(row)
+                column_tasks.append(task)
+
+            kanban_data = {}
+            for status in statuses:
+                kanban_data[status.title.lower().replace(" ", "_")] = _kanban_column(
+                    status, *by_status.get(status.id, ([], [])), limit
+                )
 
             return success_response(kanban_data)
 
@@ -263,8 +501,54 @@ async def get_kanban_board():
         raise DatabaseError("Failed to fetch kanban board")
 
 
+@tasks_bp.route("/kanban/<int:status_id>", methods=["GET"])
+@auth_required
+@data_version_etag
+async def get_kanban_column(status_id):
+    """Load more tasks for one kanban column, continuing from ?cursor=."""
+    try:
+        limit = _kanban_limit()
+        fields = _fields_arg()
+        cursor = request.args.get("cursor", "")
+
+        async with AsyncSessionLocal() as db_session:
+            statuses = await get_status_registry(db_session)
+            status = statuses.get(status_id)
+            if status is None:
+                raise NotFoundError("Status not found", details={"status_id": status_id})
+
+            query = _kanban_task_query(fields).where(
+                and_(
+                    Task.created_by == session["user_id"],
+                    Task.status_id == status_id,
+                    Task.archived == False,
+                )
+            )
+            if cursor:
+                after_updated_on, after_id = decode_task_cursor(cursor)
+                query = query.where(
+                    tuple_(Task.updated_on, Task.id)
+                    < tuple_(after_updated_on, after_id)
+                )
+
+            rows, tasks = await fetch_task_rows(
+                db_session,
+                query.order_by(Task.updated_on.desc(), Task.id.desc()).limit(limit + 1),
+                fields,
+            )
+
+            return success_response(_kanban_column(status, rows, tasks, limit))
+
+    except (ValidationError, NotFoundError):
+        raise
+    except Exception:
+        logging.exception("Failed to fetch kanban column")
+        raise DatabaseError("Failed to fetch kanban column")
+
+
 @tasks_bp.route("/categories", methods=["GET"])
 @auth_required
+@data_version_etag
 async def get_categories():
     """Get available categories for the user as a list of category names with caching."""
     cache_key = f"task_categories_user_{session['user_id']}"
@@ -286,8 +570,56 @@ async def get_categories():
         logging.exception("Failed to fetch categories")
 
 
+@tasks_bp.route("/search", methods=["GET"])
+@auth_required
+@data_version_etag
+async def search_tasks_route():
+    """Full-text search over task title, description and notes.
+
+    ?q= free text (all words must match, as prefixes), ?limit= (max 100),
+    ?include_archived=1. Results are ordered by BM25 rank and carry an
+    HTML-escaped snippet with matches wrapped in <mark>.
+    """
+    query = request.args.get("q", "").strip()
+    if not query:
+        raise ValidationError("q is required", details={"field": "q"})
+    limit = max(1, min(request.args.get("limit", 20, type=int), 100))
+    include_archived = request.args.get("include_archived", "0") in ("1", "true")
+
+    try:
+        async with AsyncSessionLocal() as db_session:
+            hits = await search_tasks(
+                db_session,
+                session["user_id"],
+                query,
+                limit=limit,
+                include_archived=include_archived,
+            )
+            tasks = {}
+            if hits:
+                tasks = {
+                    task["id"]: task
+                    for task in await fetch_task_dicts(
+                        db_session,
+                        task_projection().where(
+                            Task.id.in_([hit.task_id for hit in hits])
+                        ),
+                    )
+                }
+            results = [
+                {**tasks[hit.task_id], "rank": hit.rank, "snippet": hit.snippet}
+                for hit in hits
+                if hit.task_id in tasks
+            ]
+            return success_response({"query": query, "results": results})
+    except Exception:
+        logging.exception("Failed to search tasks")
+        raise DatabaseError("Failed to search tasks")
+
+
 @tasks_bp.route("/<int:task_id>", methods=["GET"])
 @auth_required
+@data_version_etag
 async def get_task(task_id):
     """Fetch a single task by id for the current user."""
     try:
@@ -312,6 +644,31 @@ async def get_task(task_id):
         raise DatabaseError("Failed to fetch task")
 
 
+@tasks_bp.route("/<int:task_id>/tree", methods=["GET"])
+@auth_required
+@data_version_etag
+async def get_task_tree(task_id):
+    """Return a task with its subtasks nested up to ?depth= levels (default 5).
+
+    Every node carries child_count / done_child_count and
+    descendant_count / done_descendant_count over its whole subtree, and
+    truncated=true when deeper subtasks were cut off by the depth limit.
+    """
+    depth = _tree_depth("depth", default=5)
+    try:
+        async with AsyncSessionLocal() as db_session:
+            trees = await load_task_trees(
+                db_session, session["user_id"], [task_id], depth
+            )
+    except Exception:
+        logging.exception("Failed to fetch task tree")
+        raise DatabaseError("Failed to fetch task tree")
+
+    if task_id not in trees:
+        raise NotFoundError("Task not found", details={"task_id": task_id})
+    return success_response(trees[task_id])
+
+
 @tasks_bp.route("/<int:task_id>", methods=["PUT"])
 @auth_required
 async def update_task(task_id):
@@ -327,74 +684,13 @@ async def update_task(task_id):
             if not task or task.created_by != session["user_id"]:
                 raise NotFoundError("Task not found", details={"task_id": task_id})
 
-            # Validate and update title if provided
-            if "title" in data:
-                validated_title = TaskValidator.validate_title(data["title"])
-                task.title = validated_title
-
-            if "description" in data:
-                validated_description = TaskValidator.validate_description(
-                    data.get("description")
-                )
-                task.description = validated_description
-
-            if "notes" in data:
-                task.notes = data["notes"]
-
-            status_override: int | None = None
-            if "done" in data:
-                is_done = bool(data["done"])
-                task.done = is_done
-                # Set closed_on timestamp when task is completed
-                if is_done and not task.closed_on:
-                    task.closed_on = datetime.now()
-                elif not is_done:
-                    # Clear closed_on if task is marked as incomplete
-                    task.closed_on = None
-
-                if "status_id" not in data:
-                    if is_done:
-                        status_override = await _resolve_status_id(
-                            db_session, 3, "Done", "Completed"
-                        )
-                    else:
-                        status_override = await _resolve_status_id(
-                            db_session, 1, "Todo", "To Do"
-                        )
-
-            if "archived" in data:
-                task.archived = bool(data["archived"])
-            if "priority" in data:
-                task.priority = bool(data["priority"])
-
-            if "estimate_minutes" in data:
-                validated_estimate = TaskValidator.validate_estimate_minutes(
-                    data.get("estimate_minutes")
-                )
-                task.estimate_minutes = validated_estimate
-
-            if "order" in data:
-                task.order = int(data["order"])
-
-            if "category" in data:
-                task.category_id = await resolve_category_name_to_id(
-                    data["category"], db_session, session["user_id"]
-                )
-            elif "category_id" in data:
-                task.category_id = data["category_id"]
-
-            if "due_date" in data:
-                validated_due_date = TaskValidator.validate_due_date(
-                    data.get("due_date")
-                )
-                task.due_date = validated_due_date if validated_due_date else None
-
-            if "status_id" in data:
-                task.status_id = int(data["status_id"])
-            elif status_override is not None:
-                task.status_id = status_override
+            changes = validate_task_update(data)
+            await _apply_task_update(db_session, task, changes, session["user_id"])
 
+            await bump_data_version(db_session, session["user_id"], "task", "category")
             await db_session.commit()
+            if "archived" in data or "parent_id" in data:
+                invalidate_task_counts(session["user_id"])
             result = await db_session.execute(
                 select(Task)
                 .options(
@@ -417,6 +713,104 @@ async def update_task(task_id):
         raise DatabaseError("Failed to update task")
 
 
+def _neighbour_id(data: dict, field: str, task_id: int) -> int | None:
+    if data.get(field) is None:
+        return None
+    neighbour_id = _as_int(data, field)
+    if neighbour_id == task_id:
+        raise ValidationError(
+            "A task cannot be its own neighbour", details={"field": field}
+        )
+    return neighbour_id
+
+
+@tasks_bp.route("/<int:task_id>/reorder", methods=["POST"])
+@auth_required
+async def reorder_task(task_id):
+    """Move a task between two neighbours in the manual order.
+
+    Body: {"prev_id": <task above or null>, "next_id": <task below or null>,
+           "status_id": <optional, e.g. when dropped in another kanban column>}
+    Only the moved task is written: its position becomes the midpoint of
+    its neighbours' positions. When positions get too dense the user's
+    tasks are renumbered in the background.
+    """
+    data = await request.get_json()
+    if not isinstance(data, dict):
+        raise ValidationError("No data provided")
+
+    user_id = session["user_id"]
+    prev_id = _neighbour_id(data, "prev_id", task_id)
+    next_id = _neighbour_id(data, "next_id", task_id)
+    if prev_id is None and next_id is None:
+        raise ValidationError("prev_id or next_id is required")
+    if prev_id == next_id:
+        raise ValidationError(
+            "prev_id and next_id must differ", details={"field": "next_id"}
+        )
+
+    try:
+        async with AsyncSessionLocal() as db_session:
+            values = {}
+            if "status_id" in data:
+                values["status_id"] = _as_int(data, "status_id")
+                if values["status_id"] not in await get_status_registry(db_session):
+                    raise ValidationError(
+                        "Invalid status ID", details={"field": "status_id"}
+                    )
+
+            neighbours = [n for n in (prev_id, next_id) if n is not None]
+            result = await db_session.execute(
+                select(Task.id, Task.position).where(
+                    and_(
+                        Task.id.in_([task_id, *neighbours]),
+                        Task.created_by == user_id,
+                    )
+                )
+            )
+            positions = dict(result.all())
+            if task_id not in positions:
+                raise NotFoundError("Task not found", details={"task_id": task_id})
+            for field, neighbour_id in (("prev_id", prev_id), ("next_id", next_id)):
+                if neighbour_id is not None and neighbour_id not in positions:
+                    raise ValidationError(
+                        "Invalid neighbour task", details={"field": field}
+                    )
+            if (
+                prev_id is not None
+                and next_id is not None
+                and positions[prev_id] >= positions[next_id]
+            ):
+                raise ConflictError(
+                    "Neighbours are out of order; reload and retry",
+                    details={"prev_id": prev_id, "next_id": next_id},
+                )
+
+            moved = await move_task(
+                db_session,
+                user_id,
+                task_id,
+                prev_id,
+                next_id,
+                {n: positions[n] for n in neighbours},
+                **values,
+            )
+            await bump_data_version(db_session, user_id, "task")
+            await db_session.commit()
+    except (ValidationError, NotFoundError, ConflictError):
+        raise
+    except Exception:
+        logging.exception("Failed to reorder task")
+        raise DatabaseError("Failed to reorder task")
+
+    if moved.needs_rebalance:
+        current_app.add_background_task(rebalance_positions_later, user_id)
+
+    return success_response(
+        {"task_id": task_id, "position": moved.position, **values}
+    )
+
+
 @tasks_bp.route("/<int:task_id>", methods=["DELETE"])
 @auth_required
 async def delete_task(task_id):
@@ -427,7 +821,9 @@ async def delete_task(task_id):
             if not task or task.created_by != session["user_id"]:
                 raise NotFoundError("Task not found", details={"task_id": task_id})
             await db_session.delete(task)
+            await bump_data_version(db_session, session["user_id"], "task")
             await db_session.commit()
+            invalidate_task_counts(session["user_id"])
             return ("", 204)
     except NotFoundError:
         raise
@@ -436,37 +832,260 @@ async def delete_task(task_id):
         raise DatabaseError("Failed to delete task")
 
 
+# Most operations accepted by one POST /api/tasks/bulk request
+BULK_MAX_OPERATIONS = 200
+
+
+def _bulk_failure(index: int, op, error: APIError) -> dict:
+    return {"index": index, "op": op, "success": False, **error.to_dict()}
+
+
+@tasks_bp.route("/bulk", methods=["POST"])
+@auth_required
+async def bulk_tasks():
+    """Apply a list of create/update/delete operations in one transaction.
+
+    Body: {"operations": [{"op": "create", "data": {...}},
+                          {"op": "update", "id": 1, "data": {...}},
+                          {"op": "delete", "id": 2}]}
+
+    Each operation is validated with TaskValidator before anything is
+    written; invalid or unknown items are reported in their result and
+    skipped while the rest are committed together. Results come back in
+    request order.
+    """
+    data = await request.get_json()
+    operations = data.get("operations") if isinstance(data, dict) else None
+    if not isinstance(operations, list) or not operations:
+        raise ValidationError(
+            "operations must be a non-empty list", details={"field": "operations"}
+        )
+    if len(operations) > BULK_MAX_OPERATIONS:
+        raise ValidationError(
+            f"At most {BULK_MAX_OPERATIONS} operations per request",
+            details={"field": "operations"},
+        )
+
+    user_id = session["user_id"]
+    results: list[dict | None] = [None] * len(operations)
+    planned: list[tuple[int, str, int | None, dict | None]] = []
+
+    # Validate everything up front so a bad item never half-applies
+    for index, item in enumerate(operations):
+        op = item.get("op") if isinstance(item, dict) else None
+        try:
+            if op not in ("create", "update", "delete"):
+                raise ValidationError(
+                    "op must be create, update or delete", details={"field": "op"}
+                )
+            payload = item.get("data") or {}
+            if not isinstance(payload, dict):
+                raise ValidationError(
+                    "data must be an object", details={"field": "data"}
+                )
+            task_id = None if op == "create" else _as_int(item, "id")
+            if op == "create":
+                payload = TaskValidator.validate_task_data(payload)
+            elif op == "update":
+                payload = validate_task_update(payload)
+            planned.append((index, op, task_id, payload))
+        except ValidationError as e:
+            results[index] = _bulk_failure(index, op, e)
+        except ValueError as e:
+            error_info = create_validation_error_response(e)
+            results[index] = _bulk_failure(
+                index, op, ValidationError(error_info["error"], details=error_info)
+            )
+
+    try:
+        async with AsyncSessionLocal() as db_session:
+            target_ids = {task_id for _, _, task_id, _ in planned if task_id}
+            owned: dict[int, Task] = {}
+            if target_ids:
+                result = await db_session.execute(
+                    select(Task).where(
+                        and_(Task.id.in_(target_ids), Task.created_by == user_id)
+                    )
+                )
+                owned = {task.id: task for task in result.scalars().all()}
+
+            created: list[tuple[int, Task]] = []
+            changed_counts = False
+            for index, op, task_id, payload in planned:
+                try:
+                    if op == "create":
+                        task = await _build_task(db_session, payload, user_id)
+                        db_session.add(task)
+                        created.append((index, task))
+                        changed_counts = True
+                        continue
+
+                    task = owned.get(task_id)
+                    if task is None:
+                        raise NotFoundError(
+                            "Task not found", details={"task_id": task_id}
+                        )
+                    if op == "update":
+                        await _apply_task_update(db_session, task, payload, user_id)
+                        changed_counts = (
+                            changed_counts
+                            or "archived" in payload
+                            or "parent_id" in payload
+                        )
+                    else:
+                        await db_session.delete(task)
+                        # A later operation on the same id sees it as gone
+                        del owned[task_id]
+                        changed_counts = True
+                    results[index] = {
+                        "index": index,
+                        "op": op,
+                        "success": True,
+                        "task_id": task_id,
+                    }
+                except (ValidationError, NotFoundError) as e:
+                    results[index] = _bulk_failure(index, op, e)
+
+            applied = len(created) + sum(
+                1 for r in results if r is not None and r["success"]
+            )
+            if applied:
+                await db_session.flush()
+                for index, task in created:
+                    results[index] = {
+                        "index": index,
+                        "op": "create",
+                        "success": True,
+                        "task_id": task.id,
+                    }
+                await bump_data_version(db_session, user_id, "task", "category")
+                await db_session.commit()
+                if changed_counts:
+                    invalidate_task_counts(user_id)
+    except Exception:
+        logging.exception("Failed to apply bulk task operations")
+        raise DatabaseError("Failed to apply bulk task operations")
+
+    succeeded = sum(1 for r in results if r["success"])
+    return success_response(
+        {
+            "results": results,
+            "succeeded": succeeded,
+            "failed": len(results) - succeeded,
+        }
+    )
+
+
+# Widest from/to window the calendar endpoint will serve
+CALENDAR_MAX_DAYS = 366
+
+
+def _parse_calendar_date(name: str) -> date | None:
+    value = request.args.get(name)
+    if not value:
+        return None
+    try:
+        return date.fromisoformat(value[:10])
+    except ValueError:
+        raise ValidationError(
+            f"Invalid {name} date, expected YYYY-MM-DD", details={"field": name}
+        )
+
+
+def _calendar_window() -> tuple[date, date] | None:
+    """Read the inclusive from/to day window, defaulting to the current month
+    in counts mode. Returns None when no window applies."""
+    start = _parse_calendar_date("from")
+    end = _parse_calendar_date("to")
+    counts_only = request.args.get("counts", "0") in ("1", "true")
+
+    if start is None and end is None:
+        if not counts_only:
+            return None
+        today = date.today()
+        start = today.replace(day=1)
+        end = (start + timedelta(days=32)).replace(day=1) - timedelta(days=1)
+    elif start is None or end is None:
+        missing = "from" if start is None else "to"
+        raise ValidationError(
+            "Both from and to are required", details={"field": missing}
+        )
+
+    if end < start:
+        raise ValidationError("to must not be before from", details={"field": "to"})
+    if (end - start).days >= CALENDAR_MAX_DAYS:
+        raise ValidationError(
+            f"Calendar window is limited to {CALENDAR_MAX_DAYS} days",
+            details={"field": "to"},
+        )
+    return start, end
+
+
 @tasks_bp.route("/calendar", methods=["GET"])
 @auth_required
+@data_version_etag
 async def get_calendar_tasks():
-    """Get tasks grouped by due date for calendar view."""
+    """Get tasks grouped by due date for calendar view.
+
+    ?from=YYYY-MM-DD&to=YYYY-MM-DD limits the result to an inclusive day
+    range. ?counts=1 returns {day: {"total", "done"}} for a month grid
+    instead of full tasks (defaulting to the current month); load a day's
+    tasks on demand with from=to=day. ?fields= trims each task as on
+    GET /api/tasks.
+    """
+    window = _calendar_window()
+    fields = _fields_arg()
+    counts_only = request.args.get("counts", "0") in ("1", "true")
+
+    conditions = [
+        Task.created_by == session["user_id"],
+        Task.archived == False,
+        Task.due_date.isnot(None),
+    ]
+    if window:
+        # Half-open datetime range so the (created_by, archived, due_date)
+        # index is range-scanned
+        conditions.append(Task.due_date >= datetime.combine(window[0], time.min))
+        conditions.append(
+            Task.due_date < datetime.combine(window[1] + timedelta(days=1), time.min)
+        )
+
     try:
         async with AsyncSessionLocal() as db_session:
-            result = await db_session.execute(
-                select(Task)
-                .options(
-                    selectinload(Task.status),
-                    selectinload(Task.tags),
-                    selectinload(Task.category),
-                )
-                .where(
-                    and_(
-                        Task.created_by == session["user_id"],
-                        Task.due_date.isnot(None),
-                        Task.archived == False,
+            if counts_only:
+                day = func.date(Task.due_date)
+                result = await db_session.execute(
+                    select(
+                        day.label("day"),
+                        func.count(Task.id).label("total"),
+                        func.sum(case((Task.done == True, 1), else_=0)).label("done"),
                     )
+                    .where(and_(*conditions))
+                    .group_by(day)
+                    .order_by(day)
                 )
-                .order_by(Task.due_date, Task.updated_on.desc())
+                return jsonify(
+                    {
+                        row.day: {"total": row.total, "done": row.done or 0}
+                        for row in result
+                    }
+                )
+
+            rows, tasks = await fetch_task_rows(
+                db_session,
+                task_projection(fields, extra=(Task.due_date,))
+                .where(and_(*conditions))
+                .order_by(Task.due_date, Task.updated_on.desc()),
+                fields,
             )
-            tasks = result.scalars().all()
 
             grouped_tasks: dict[str, list[dict]] = {}
-            for task in tasks:
+            for row, task in zip(rows, tasks):
                 # Use date-only key so frontend calendar (`YYYY-MM-DD`) matches
-                date_key = task.due_date.date().isoformat()
+                date_key = row.due_date.date().isoformat()
                 if date_key not in grouped_tasks:
                     grouped_tasks[date_key] = []
-                grouped_tasks[date_key].append(task.to_dict())
+                grouped_tasks[date_key].append(task)
 
             return jsonify(grouped_tasks)
     except Exception:
@@ -480,23 +1099,25 @@ async def archive_completed_tasks():
     """Archive all completed tasks for the current user."""
     try:
         async with AsyncSessionLocal() as db_session:
+            # One set-based UPDATE instead of loading every completed task
             result = await db_session.execute(
-                select(Task).where(
+                update(Task)
+                .where(
                     and_(
                         Task.created_by == session["user_id"],
                         Task.done == True,
                         Task.archived == False,
                     )
                 )
+                .values(archived=True)
+                .execution_options(synchronize_session=False)
             )
-            tasks = result.scalars().all()
-
-            archived_count = 0
-            for task in tasks:
-                task.archived = True
-                archived_count += 1
+            archived_count = result.rowcount or 0
 
+            if archived_count:
+                await bump_data_version(db_session, session["user_id"], "task")
             await db_session.commit()
+            invalidate_task_counts(session["user_id"])
 
             return success_response(
                 {
@@ -511,24 +1132,22 @@ async def archive_completed_tasks():
 
 @tasks_bp.route("/archived", methods=["GET"])
 @auth_required
+@data_version_etag
 async def get_archived_tasks():
-    """Get all archived tasks for the current user."""
+    """Get all archived tasks for the current user (?fields= as on GET /api/tasks)."""
+    fields = _fields_arg()
     try:
         async with AsyncSessionLocal() as db_session:
-            result = await db_session.execute(
-                select(Task)
-                .options(
-                    selectinload(Task.status),
-                    selectinload(Task.tags),
-                    selectinload(Task.category),
-                )
+            tasks = await fetch_task_dicts(
+                db_session,
+                task_projection(fields)
                 .where(
                     and_(Task.created_by == session["user_id"], Task.archived == True)
                 )
-                .order_by(Task.updated_on.desc())
+                .order_by(Task.updated_on.desc()),
+                fields,
             )
-            tasks = result.scalars().all()
-            return success_response([task.to_dict() for task in tasks])
+            return success_response(tasks)
     except Exception:
         logging.exception("Failed to fetch archived tasks")
         raise DatabaseError("Failed to fetch archived tasks")
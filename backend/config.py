@@ -28,3 +28,29 @@ def get_database_url():
     return db_url
 
 DATABASE_URL = get_database_url()
+
+# How long a validated login session is trusted before auth_required re-checks
+# the user_sessions row (revocations in this process take effect immediately)
+SESSION_CACHE_TTL_SECONDS = int(os.getenv("SESSION_CACHE_TTL_SECONDS", "30"))
+
+# How often buffered last_activity updates are written back to user_sessions
+SESSION_ACTIVITY_FLUSH_SECONDS = int(os.getenv("SESSION_ACTIVITY_FLUSH_SECONDS", "60"))
+
+# PIN hashing runs on a small thread pool so it never blocks the event loop.
+# Once this many hash/verify calls are queued or running, new ones get a 503.
+PIN_HASH_WORKERS = int(os.getenv("PIN_HASH_WORKERS", "2"))
+PIN_HASH_MAX_PENDING = int(os.getenv("PIN_HASH_MAX_PENDING", "16"))
+
+# Background maintenance scheduler (APScheduler, started in before_serving)
+MAINTENANCE_SCHEDULER_ENABLED = os.getenv("MAINTENANCE_SCHEDULER_ENABLED", "1") == "1"
+# Expired or long-inactive user_sessions rows are deleted on this interval,
+# at most SESSION_REAP_BATCH_SIZE rows per DELETE statement
+SESSION_REAP_INTERVAL_MINUTES = int(os.getenv("SESSION_REAP_INTERVAL_MINUTES", "15"))
+SESSION_REAP_BATCH_SIZE = int(os.getenv("SESSION_REAP_BATCH_SIZE", "500"))
+SESSION_INACTIVE_DAYS = int(os.getenv("SESSION_INACTIVE_DAYS", "30"))
+
+# Server-sent change stream (/api/events): a comment line is sent on this
+# interval to keep idle connections open, and each connection buffers at most
+# CHANGE_STREAM_QUEUE_SIZE events before it is told to resync instead
+CHANGE_STREAM_HEARTBEAT_SECONDS = int(os.getenv("CHANGE_STREAM_HEARTBEAT_SECONDS", "15"))
+CHANGE_STREAM_QUEUE_SIZE = int(os.getenv("CHANGE_STREAM_QUEUE_SIZE", "32"))
@@ -0,0 +1,94 @@
+"""Per-user data version used for ETag / If-None-Match on read endpoints
+and for the change events pushed to /api/events."""
+
+from datetime import date
+from functools import wraps
+
+from quart import make_response, request, session
+from sqlalchemy import event, select, update
+
+
+_PENDING_KEY = "pending_change_events"
+
+
+def _publish_pending(sync_session):
+    from backend.services.change_hub import ChangeEvent, change_hub
+
+    for user_id, (version, changed) in sync_session.info.pop(_PENDING_KEY, {}).items():
+        change_hub.publish(user_id, ChangeEvent(version, tuple(sorted(changed))))
+
+
+def _discard_pending(sync_session):
+    sync_session.info.pop(_PENDING_KEY, None)
+
+
+async def bump_data_version(db_session, user_id: int, *changed: str):
+    """Increment the user's data version inside the caller's transaction.
+
+    Call before committing any write to the user's tasks, journal,
+    categories or settings so the new version becomes visible together
+    with the data it describes. changed names what was written ("task",
+    "journal", "category", "settings"); once the transaction commits, a
+    change event with the new version is sent to the user's open
+    /api/events streams.
+    """
+    from backend.db.models import User
+
+    version = await db_session.scalar(
+        update(User)
+        .where(User.id == user_id)
+        .values(data_version=User.data_version + 1)
+        .returning(User.data_version)
+        .execution_options(synchronize_session=False)
+    )
+    if version is None:
+        return
+
+    sync_session = db_session.sync_session
+    pending = sync_session.info.get(_PENDING_KEY)
+    if pending is None:
+        pending = sync_session.info[_PENDING_KEY] = {}
+        if not event.contains(sync_session, "after_commit", _publish_pending):
+            event.listen(sync_session, "after_commit", _publish_pending)
+            event.listen(sync_session, "after_rollback", _discard_pending)
+    _, seen = pending.get(user_id, (version, set()))
+    pending[user_id] = (version, seen | set(changed))
+
+
+async def get_data_version(user_id: int) -> int:
+    """Read the current data version for a user (0 if unknown)."""
+    from backend.db.engine_async import AsyncSessionLocal
+    from backend.db.models import User
+
+    async with AsyncSessionLocal() as db_session:
+        version = await db_session.scalar(
+            select(User.data_version).where(User.id == user_id)
+        )
+    return version or 0
+
+
+def data_version_etag(f):
+    """Serve a weak ETag from the data version and answer matches with 304.
+
+    The tag also carries the user id and today's date, since several views
+    (overdue counts, daily summaries) change at midnight without a write.
+    Must sit below auth_required so session["user_id"] is trusted.
+    """
+
+    @wraps(f)
+    async def decorated_function(*args, **kwargs):
+        user_id = session["user_id"]
+        version = await get_data_version(user_id)
+        etag = f"u{user_id}-v{version}-{date.today():%Y%m%d}"
+
+        if request.if_none_match.contains_weak(etag):
+            response = await make_response("", 304)
+            response.set_etag(etag, weak=True)
+            return response
+
+        response = await make_response(await f(*args, **kwargs))
+        if response.status_code == 200:
+            response.set_etag(etag, weak=True)
+        return response
+
+    return decorated_function
@@ -0,0 +1,113 @@
+"""
+Category name -> id resolution for task writes.
+
+Tasks and the AI assistant name categories by text and create them on first
+use. Names are unique per user (uq_category_created_by_name), so a miss is a
+single INSERT ... ON CONFLICT ... RETURNING id that either creates the row or
+returns the existing one. Resolved ids are kept in a per-user cache so a hit
+costs no query at all; ids only enter the cache once the session that
+resolved them commits.
+"""
+
+from collections import OrderedDict
+from datetime import datetime
+
+from sqlalchemy import event
+from sqlalchemy.dialects.sqlite import insert
+
+from backend.db.models import Category
+
+DEFAULT_CATEGORY_COLOR = "808080"
+
+_PENDING_KEY = "pending_category_ids"
+
+
+class CategoryIdCache:
+    """Per-user name -> id maps, least recently used users evicted first.
+
+    Rename, delete and account removal must call invalidate(user_id).
+    """
+
+    def __init__(self, max_users: int = 256):
+        self.max_users = max_users
+        self._users: OrderedDict[int, dict[str, int]] = OrderedDict()
+
+    def get(self, user_id: int, name: str) -> int | None:
+        names = self._users.get(user_id)
+        if names is None:
+            return None
+        self._users.move_to_end(user_id)
+        return names.get(name)
+
+    def put(self, user_id: int, name: str, category_id: int):
+        self._users.setdefault(user_id, {})[name] = category_id
+        self._users.move_to_end(user_id)
+        while len(self._users) > self.max_users:
+            self._users.popitem(last=False)
+
+    def invalidate(self, user_id: int | None = None):
+        """Drop one user's names, or every user's when user_id is None."""
+        if user_id is None:
+            self._users.clear()
+        else:
+            self._users.pop(user_id, None)
+
+
+category_ids = CategoryIdCache()
+
+
+def _publish_pending(sync_session):
+    for user_id, name, category_id in sync_session.info.pop(_PENDING_KEY, ()):
+        category_ids.put(user_id, name, category_id)
+
+
+def _discard_pending(sync_session):
+    sync_session.info.pop(_PENDING_KEY, None)
+
+
+def _remember_on_commit(db_session, user_id: int, name: str, category_id: int):
+    sync_session = db_session.sync_session
+    pending = sync_session.info.get(_PENDING_KEY)
+    if pending is None:
+        pending = sync_session.info[_PENDING_KEY] = []
+        if not event.contains(sync_session, "after_commit", _publish_pending):
+            event.listen(sync_session, "after_commit", _publish_pending)
+            event.listen(sync_session, "after_rollback", _discard_pending)
+    pending.append((user_id, name, category_id))
+
+
+async def resolve_category_id(
+    db_session, user_id: int, name: str, description: str | None = None
+) -> int | None:
+    """Id of the user's category called name, creating it if needed.
+
+    Runs inside the caller's transaction and never rolls it back. Returns
+    None for a blank name.
+    """
+    name = (name or "").strip()
+    if not name:
+        return None
+
+    cached = category_ids.get(user_id, name)
+    if cached is not None:
+        return cached
+
+    now = datetime.now()
+    stmt = insert(Category).values(
+        name=name,
+        description=description or f"Auto-created category: {name}",
+        color_hex=DEFAULT_CATEGORY_COLOR,
+        created_by=user_id,
+        created_on=now,
+        updated_on=now,
+    )
+    # A no-op DO UPDATE (rather than DO NOTHING) makes RETURNING yield the
+    # existing id too, so a miss is one statement either way
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[Category.created_by, Category.name],
+        set_={"name": stmt.excluded.name},
+    ).returning(Category.id)
+    category_id = await db_session.scalar(stmt)
+
+    _remember_on_commit(db_session, user_id, name, category_id)
+    return category_id
@@ -0,0 +1,186 @@
+"""
+Materialized per-user daily task counters (user_daily_stats).
+
+Triggers on task keep one row per (user, day, category) for non-archived
+tasks: how many were created that day (and how many of those are done
+now), and how many were completed that day (and how many of those after
+their due date). The review endpoints read a few rows per day from here
+instead of scanning the user's task history.
+
+Check the rollup against task, and optionally rebuild it:
+
+    python -m backend.db.daily_stats [--fix]
+"""
+
+import argparse
+import asyncio
+import sys
+from dataclasses import dataclass
+from datetime import date
+
+from sqlalchemy import and_, case, delete, func, insert, literal, select, union_all
+
+from backend.db.models import Category, Task, UserDailyStats
+
+_COUNTERS = (
+    "created_count",
+    "created_done_count",
+    "completed_count",
+    "completed_late_count",
+)
+
+
+@dataclass(frozen=True)
+class DayStats:
+    """One (day, category) rollup row."""
+
+    day: date
+    # None for tasks without a category
+    category_id: int | None
+    category_name: str | None
+    created: int
+    created_done: int
+    completed: int
+    completed_late: int
+
+
+@dataclass(frozen=True)
+class DailyStatsDrift:
+    user_id: int
+    day: str
+    category_id: int
+    stored: tuple[int, int, int, int]
+    actual: tuple[int, int, int, int]
+
+
+async def get_daily_stats(
+    db_session, user_id: int, start: date, end: date
+) -> list[DayStats]:
+    """Rollup rows for start <= day < end, by day then category."""
+    result = await db_session.execute(
+        select(
+            UserDailyStats.day,
+            UserDailyStats.category_id,
+            Category.name,
+            *(getattr(UserDailyStats, name) for name in _COUNTERS),
+        )
+        .outerjoin(Category, Category.id == UserDailyStats.category_id)
+        .where(
+            UserDailyStats.user_id == user_id,
+            UserDailyStats.day >= start.isoformat(),
+            UserDailyStats.day < end.isoformat(),
+        )
+        .order_by(UserDailyStats.day, UserDailyStats.category_id)
+    )
+    return [
+        DayStats(date.fromisoformat(row.day), row.category_id or None, row.name, *row[3:])
+        for row in result
+    ]
+
+
+def _actual_counts():
+    """The rollup recomputed from task, grouped like user_daily_stats."""
+    category = func.coalesce(Task.category_id, 0)
+    completed_day = func.date(func.coalesce(Task.closed_on, Task.created_on))
+    active = Task.archived == False
+
+    created = select(
+        Task.created_by.label("user_id"),
+        func.date(Task.created_on).label("day"),
+        category.label("category_id"),
+        literal(1).label("created"),
+        case((Task.done == True, 1), else_=0).label("created_done"),
+        literal(0).label("completed"),
+        literal(0).label("late"),
+    ).where(active)
+    completed = select(
+        Task.created_by,
+        completed_day,
+        category,
+        literal(0),
+        literal(0),
+        literal(1),
+        case((completed_day > func.date(Task.due_date), 1), else_=0),
+    ).where(and_(active, Task.done == True))
+
+    rows = union_all(created, completed).subquery()
+    return select(
+        rows.c.user_id,
+        rows.c.day,
+        rows.c.category_id,
+        func.sum(rows.c.created),
+        func.sum(rows.c.created_done),
+        func.sum(rows.c.completed),
+        func.sum(rows.c.late),
+    ).group_by(rows.c.user_id, rows.c.day, rows.c.category_id)
+
+
+async def find_daily_stats_drift(db_session) -> list[DailyStatsDrift]:
+    """Every (user, day, category) whose stored counters differ from task."""
+    stored_rows = await db_session.execute(
+        select(
+            UserDailyStats.user_id, UserDailyStats.day, UserDailyStats.category_id
+        ).add_columns(*(getattr(UserDailyStats, name) for name in _COUNTERS))
+    )
+    stored = {tuple(row[:3]): tuple(row[3:]) for row in stored_rows}
+    actual = {
+        tuple(row[:3]): tuple(row[3:])
+        for row in await db_session.execute(_actual_counts())
+    }
+
+    zero = (0, 0, 0, 0)
+    drift = []
+    for key in sorted(stored.keys() | actual.keys()):
+        have, want = stored.get(key, zero), actual.get(key, zero)
+        if have != want:
+            drift.append(DailyStatsDrift(*key, have, want))
+    return drift
+
+
+async def rebuild_daily_stats(db_session):
+    """Recompute the whole rollup from task (caller commits)."""
+    await db_session.execute(delete(UserDailyStats))
+    await db_session.execute(
+        insert(UserDailyStats).from_select(
+            ["user_id", "day", "category_id", *_COUNTERS], _actual_counts()
+        )
+    )
+
+
+async def reconcile_daily_stats(fix: bool = False) -> list[DailyStatsDrift]:
+    """Report rollup drift; with fix=True, rebuild the table when any is found."""
+    from backend.db.engine_async import AsyncSessionLocal
+
+    async with AsyncSessionLocal() as db_session:
+        drift = await find_daily_stats_drift(db_session)
+        if drift and fix:
+            await rebuild_daily_stats(db_session)
+            await db_session.commit()
+    return drift
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--fix", action="store_true", help="rebuild the rollup if it drifted"
+    )
+    args = parser.parse_args(argv)
+
+    drift = asyncio.run(reconcile_daily_stats(fix=args.fix))
+    for item in drift:
+        print(
+            f"user {item.user_id} day {item.day} category {item.category_id}: "
+            f"stored {dict(zip(_COUNTERS, item.stored))} "
+            f"actual {dict(zip(_COUNTERS, item.actual))}"
+        )
+    if not drift:
+        print("user_daily_stats is consistent with task")
+        return 0
+    if args.fix:
+        print(f"Rebuilt user_daily_stats ({len(drift)} rows had drifted)")
+        return 0
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -5,6 +5,7 @@ import logging
 from passlib.hash import pbkdf2_sha256
 from sqlalchemy import (
     Boolean,
+    Float,
     String,
     DateTime,
     ForeignKey,
@@ -45,6 +46,10 @@ class User(Base):
         DateTime, nullable=False, default=datetime.now
     )
     config_data: Mapped[str] = mapped_column(String(1000), default="{}")
+    # Bumped on every write to the user's tasks, journal, categories or settings
+    data_version: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default="0"
+    )
 
     # Relating user to all their created tasks
     tasks: Mapped[list["Task"]] = relationship(
@@ -153,6 +158,10 @@ class Task(Base):
     estimate_minutes: Mapped[int | None] = mapped_column(Integer, nullable=True)
     # Order for manual sorting/drag-drop
     order: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    # Fractional manual ordering (see backend/db/positions.py)
+    position: Mapped[float] = mapped_column(
+        Float, nullable=False, default=0.0, server_default="0"
+    )
     due_date: Mapped[datetime] = mapped_column(DateTime, nullable=False, default=None)
     created_on: Mapped[datetime] = mapped_column(
         DateTime, nullable=False, default=datetime.now
@@ -239,6 +248,7 @@ class Task(Base):
             "priority": getattr(self, "priority", False),
             "estimate_minutes": getattr(self, "estimate_minutes", None),
             "order": getattr(self, "order", 0),
+            "position": getattr(self, "position", 0.0),
             "parent_id": getattr(self, "parent_id", None),
             "due_date": _iso(getattr(self, "due_date", None)),
             # Frontend expects 'created_at' not 'created_on'
@@ -455,6 +465,73 @@ class Configuration(Base):
         }
 
 
+class UserTaskStats(Base):
+    """Task counters per (user, status), maintained by triggers on task.
+
+    See backend/db/task_stats.py for reads and drift reconciliation.
+    """
+
+    __tablename__ = "user_task_stats"
+
+    user_id: Mapped[int] = mapped_column(
+        ForeignKey("user.id", ondelete="CASCADE"), primary_key=True
+    )
+    status_id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    # Every task, archived or not
+    task_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    archived_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    # Non-archived tasks, split by the done flag
+    done_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    open_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+
+class UserDailyStats(Base):
+    """Non-archived task counters per (user, day, category), maintained by
+    triggers on task.
+
+    See backend/db/daily_stats.py for reads and drift reconciliation.
+    """
+
+    __tablename__ = "user_daily_stats"
+
+    user_id: Mapped[int] = mapped_column(
+        ForeignKey("user.id", ondelete="CASCADE"), primary_key=True
+    )
+    # YYYY-MM-DD, as SQLite's date() returns it
+    day: Mapped[str] = mapped_column(String(10), primary_key=True)
+    # 0 for tasks without a category
+    category_id: Mapped[int] = mapped_column(Integer, primary_key=True, default=0)
+    # Keyed by the day the task was created; created_done_count is the
+    # subset that is done now
+    created_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    created_done_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    # Keyed by the day the task was completed (closed_on, else created_on);
+    # late means completed on a day after its due date
+    completed_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    completed_late_count: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0
+    )
+
+
+class SyncChange(Base):
+    """Latest change to each task, journal entry and category, written by triggers.
+
+    seq is a never-reused sequence; clients sync with the highest seq they
+    have seen (see backend/db/sync.py). Deleted rows keep an entry as a
+    tombstone.
+    """
+
+    __tablename__ = "sync_change"
+    __table_args__ = {"sqlite_autoincrement": True}
+
+    seq: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    user_id: Mapped[int] = mapped_column(Integer, nullable=False)
+    # "task", "journal" or "category"
+    entity: Mapped[str] = mapped_column(String(16), nullable=False)
+    entity_id: Mapped[int] = mapped_column(Integer, nullable=False)
+    deleted: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False)
+
+
 class UserSession(Base):
     __tablename__ = "user_sessions"
 
@@ -0,0 +1,141 @@
+"""
+Fractional manual ordering for tasks (task.position).
+
+Each task has a REAL position in its owner's single ordering space; any
+filtered view (a kanban column, a subtask list) sorts by it. New tasks go
+after the user's last task. Moving a task between two neighbours sets its
+position to their midpoint in one UPDATE, so only the moved row changes.
+Repeated moves into the same gap halve it each time; once a gap falls
+below MIN_POSITION_GAP the user's positions are renumbered evenly, in the
+background when there is still room and inline when there is not.
+"""
+
+import logging
+from dataclasses import dataclass
+
+from sqlalchemy import and_, func, select, update
+from sqlalchemy.orm import aliased
+
+from backend.db.models import Task
+
+POSITION_STEP = 1.0
+# Gaps below this trigger a rebalance (about 20 moves into one gap)
+MIN_POSITION_GAP = 1e-6
+
+logger = logging.getLogger(__name__)
+
+
+def next_position(user_id: int):
+    """SQL expression for a position after all of the user's tasks.
+
+    Assign it to Task.position before the INSERT; it is evaluated inside the
+    INSERT itself and read back through RETURNING.
+    """
+    return (
+        select(func.coalesce(func.max(Task.position), 0.0) + POSITION_STEP)
+        .where(Task.created_by == user_id)
+        .scalar_subquery()
+    )
+
+
+@dataclass(frozen=True)
+class MoveResult:
+    position: float
+    # True when the next move into the same gap would find no room left
+    needs_rebalance: bool
+
+
+def _neighbour_position(neighbour_id: int):
+    neighbour = aliased(Task)
+    return (
+        select(neighbour.position)
+        .where(neighbour.id == neighbour_id)
+        .scalar_subquery()
+    )
+
+
+async def _move(db_session, user_id, task_id, prev_id, next_id, values) -> float:
+    # Neighbour positions are read inside the UPDATE, so a concurrent
+    # rebalance can never pair a stale midpoint with the new scale
+    if prev_id is not None and next_id is not None:
+        position = (_neighbour_position(prev_id) + _neighbour_position(next_id)) / 2
+    elif prev_id is not None:
+        position = _neighbour_position(prev_id) + POSITION_STEP
+    else:
+        position = _neighbour_position(next_id) - POSITION_STEP
+
+    return await db_session.scalar(
+        update(Task)
+        .where(and_(Task.id == task_id, Task.created_by == user_id))
+        .values(position=position, **values)
+        .returning(Task.position)
+        .execution_options(synchronize_session=False)
+    )
+
+
+async def move_task(
+    db_session,
+    user_id: int,
+    task_id: int,
+    prev_id: int | None,
+    next_id: int | None,
+    neighbour_positions: dict[int, float],
+    **values,
+) -> MoveResult:
+    """Place task_id between prev_id and next_id (either may be None).
+
+    The caller has checked that all ids are the user's tasks and passes the
+    neighbours' positions as it read them, with prev_id sorting before
+    next_id. Extra values (e.g. status_id) are written in the same UPDATE.
+    Does not commit.
+    """
+    if prev_id is not None and next_id is not None:
+        gap = neighbour_positions[next_id] - neighbour_positions[prev_id]
+        if gap / 2 < MIN_POSITION_GAP:
+            # No room left between them: renumber first, then move
+            await rebalance_positions(db_session, user_id)
+            position = await _move(
+                db_session, user_id, task_id, prev_id, next_id, values
+            )
+            return MoveResult(position, False)
+
+    position = await _move(db_session, user_id, task_id, prev_id, next_id, values)
+    gaps = [abs(position - p) for p in neighbour_positions.values()]
+    return MoveResult(position, bool(gaps) and min(gaps) < MIN_POSITION_GAP * 2)
+
+
+async def rebalance_positions(db_session, user_id: int) -> int:
+    """Renumber the user's positions POSITION_STEP apart, keeping their order.
+
+    Returns the number of tasks renumbered. Does not commit.
+    """
+    result = await db_session.execute(
+        select(Task.id)
+        .where(Task.created_by == user_id)
+        .order_by(Task.position, Task.id)
+    )
+    ids = result.scalars().all()
+    if ids:
+        await db_session.execute(
+            update(Task).execution_options(synchronize_session=False),
+            [
+                {"id": task_id, "position": (index + 1) * POSITION_STEP}
+                for index, task_id in enumerate(ids)
+            ],
+        )
+    return len(ids)
+
+
+async def rebalance_positions_later(user_id: int):
+    """Background job: rebalance one user's positions in its own transaction."""
+    from backend.data_version import bump_data_version
+    from backend.db.engine_async import AsyncSessionLocal
+
+    try:
+        async with AsyncSessionLocal() as db_session:
+            count = await rebalance_positions(db_session, user_id)
+            await bump_data_version(db_session, user_id, "task")
+            await db_session.commit()
+        logger.info("Rebalanced %d task positions for user %s", count, user_id)
+    except Exception:
+        logger.exception("Task position rebalance failed for user %s", user_id)
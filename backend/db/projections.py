@@ -0,0 +1,169 @@
+"""
+Column projections for task list endpoints.
+
+List views only need a handful of scalar columns plus the status and
+category names, so these helpers select exactly that (joined in SQL),
+fetch tag names for the whole page in one query, and build the response
+dicts straight from row tuples. The output matches Task.to_dict() without
+hydrating ORM objects or their relationships.
+
+Callers may ask for a subset of the dict's fields (sparse fieldsets); the
+query then selects only the columns and joins behind them, and skips the
+tag lookup unless tags were requested.
+"""
+
+from collections.abc import Iterable
+
+from sqlalchemy import Select, select
+
+from backend.db.models import Category, Status, Tag, Task, task_tag
+
+# Largest IN (...) list sent to SQLite when looking up tags
+TAG_LOOKUP_CHUNK = 500
+
+# Response field -> columns it is built from. category and status also need
+# their joins; tags comes from a separate lookup and needs no column.
+_FIELD_COLUMNS = {
+    "id": (Task.id,),
+    "title": (Task.title,),
+    "description": (Task.description,),
+    "notes": (Task.notes,),
+    "category": (Category.name.label("category_name"),),
+    "status": (Task.status_id, Status.title.label("status_name")),
+    "tags": (),
+    "done": (Task.done,),
+    "archived": (Task.archived,),
+    "priority": (Task.priority,),
+    "estimate_minutes": (Task.estimate_minutes,),
+    "order": (Task.order,),
+    "position": (Task.position,),
+    "parent_id": (Task.parent_id,),
+    "due_date": (Task.due_date,),
+    "created_at": (Task.created_on,),
+    "updated_on": (Task.updated_on,),
+    "closed_on": (Task.closed_on,),
+    "created_by": (Task.created_by,),
+}
+
+# Every field a task dict can carry, in Task.to_dict() order
+TASK_FIELDS = tuple(_FIELD_COLUMNS)
+
+
+def task_projection(
+    fields: Iterable[str] | None = None, extra: Iterable = ()
+) -> Select:
+    """SELECT of the columns a task dict needs, with status and category joined.
+
+    With fields, only the columns behind those fields (plus Task.id) are
+    selected, and the status/category joins are added only when asked for.
+    extra adds columns the caller needs from the row but not in the dict,
+    such as Task.updated_on for a cursor.
+    """
+    fields = set(TASK_FIELDS if fields is None else fields)
+    columns = {"id": Task.id}
+    for name in TASK_FIELDS:
+        if name in fields:
+            for column in _FIELD_COLUMNS[name]:
+                columns.setdefault(column.key, column)
+    for column in extra:
+        columns.setdefault(column.key, column)
+
+    query = select(*columns.values()).select_from(Task)
+    if "status" in fields:
+        query = query.outerjoin(Status, Status.id == Task.status_id)
+    if "category" in fields:
+        query = query.outerjoin(Category, Category.id == Task.category_id)
+    return query
+
+
+async def fetch_tag_names(db_session, task_ids: Iterable[int]) -> dict[int, list[str]]:
+    """Map task id -> tag names for the given tasks."""
+    task_ids = list(task_ids)
+    tags_by_task: dict[int, list[str]] = {}
+    for start in range(0, len(task_ids), TAG_LOOKUP_CHUNK):
+        chunk = task_ids[start : start + TAG_LOOKUP_CHUNK]
+        result = await db_session.execute(
+            select(task_tag.c.task_id, Tag.name)
+            .join(Tag, Tag.id == task_tag.c.tag_id)
+            .where(task_tag.c.task_id.in_(chunk))
+            .order_by(task_tag.c.task_id, Tag.id)
+        )
+        for task_id, name in result.all():
+            tags_by_task.setdefault(task_id, []).append(name)
+    return tags_by_task
+
+
+def _iso(value):
+    return value.isoformat() if value is not None else None
+
+
+def _status(row):
+    if row.status_name is None:
+        return None
+    return {"id": row.status_id, "name": row.status_name}
+
+
+_FIELD_VALUES = {
+    "id": lambda row, tags: row.id,
+    "title": lambda row, tags: row.title,
+    "description": lambda row, tags: row.description,
+    "notes": lambda row, tags: row.notes,
+    "category": lambda row, tags: row.category_name,
+    "status": lambda row, tags: _status(row),
+    "tags": lambda row, tags: tags or [],
+    "done": lambda row, tags: row.done,
+    "archived": lambda row, tags: row.archived,
+    "priority": lambda row, tags: row.priority,
+    "estimate_minutes": lambda row, tags: row.estimate_minutes,
+    "order": lambda row, tags: row.order,
+    "position": lambda row, tags: row.position,
+    "parent_id": lambda row, tags: row.parent_id,
+    "due_date": lambda row, tags: _iso(row.due_date),
+    "created_at": lambda row, tags: _iso(row.created_on),
+    "updated_on": lambda row, tags: _iso(row.updated_on),
+    "closed_on": lambda row, tags: _iso(row.closed_on),
+    "created_by": lambda row, tags: row.created_by,
+}
+
+
+def task_row_to_dict(
+    row, tags: list[str] | None = None, fields: Iterable[str] | None = None
+) -> dict:
+    """Build the Task.to_dict() shape from a task_projection() row.
+
+    With fields, only those keys (and id) are included.
+    """
+    if fields is None:
+        return {name: value(row, tags) for name, value in _FIELD_VALUES.items()}
+    fields = set(fields)
+    return {
+        name: value(row, tags)
+        for name, value in _FIELD_VALUES.items()
+        if name == "id" or name in fields
+    }
+
+
+async def fetch_task_rows(
+    db_session, query: Select, fields: Iterable[str] | None = None
+) -> tuple[list, list[dict]]:
+    """Run a task_projection() query; return its rows and their task dicts.
+
+    Tag names are looked up only when the dicts include tags.
+    """
+    rows = (await db_session.execute(query)).all()
+    if fields is not None:
+        fields = set(fields)
+    tags_by_task = {}
+    if rows and (fields is None or "tags" in fields):
+        tags_by_task = await fetch_tag_names(db_session, [row.id for row in rows])
+    return rows, [
+        task_row_to_dict(row, tags_by_task.get(row.id), fields) for row in rows
+    ]
+
+
+async def fetch_task_dicts(
+    db_session, query: Select, fields: Iterable[str] | None = None
+) -> list[dict]:
+    """Run a task_projection() query and return task dicts with their tags."""
+    _, tasks = await fetch_task_rows(db_session, query, fields)
+    return tasks
@@ -0,0 +1,119 @@
+"""EXPLAIN QUERY PLAN helpers for catching full table scans."""
+
+from __future__ import annotations
+
+import re
+import sqlite3
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+# Tables that are fine to read in full: tiny seeded lookup data
+ALLOWED_FULL_SCANS = frozenset({"status"})
+
+# "SCAN task" and "SCAN task LEFT-JOIN" are full table scans;
+# "SCAN task USING INDEX ..." walks an index instead
+_FULL_SCAN = re.compile(r"^SCAN (\w+)\b(?!.*\bUSING\b)")
+
+# "FROM task AS task_1" / "JOIN task AS parent": plans name the alias
+_TABLE_ALIAS = re.compile(
+    r'(?:\bFROM|\bJOIN|,)\s+"?(\w+)"?\s+AS\s+"?(\w+)"?', re.IGNORECASE
+)
+
+
+@dataclass
+class CapturedQuery:
+    statement: str
+    parameters: tuple
+
+
+@dataclass
+class QueryRecorder:
+    """Collects every SELECT/UPDATE/DELETE an engine runs while attached."""
+
+    engine: Engine
+    queries: list[CapturedQuery] = field(default_factory=list)
+
+    def _before_cursor_execute(
+        self, conn, cursor, statement, parameters, context, executemany
+    ):
+        verb = statement.lstrip().split(None, 1)[0].upper()
+        if verb not in ("SELECT", "UPDATE", "DELETE", "WITH"):
+            return
+        if executemany:
+            parameters = parameters[0] if parameters else ()
+        self.queries.append(CapturedQuery(statement, tuple(parameters or ())))
+
+    def __enter__(self) -> "QueryRecorder":
+        event.listen(self.engine, "before_cursor_execute", self._before_cursor_execute)
+        return self
+
+    def __exit__(self, *exc):
+        event.remove(self.engine, "before_cursor_execute", self._before_cursor_execute)
+
+
+def explain(
+    conn: sqlite3.Connection, statement: str, parameters: tuple = ()
+) -> list[str]:
+    """Return the detail column of EXPLAIN QUERY PLAN for a statement."""
+    rows = conn.execute(f"EXPLAIN QUERY PLAN {statement}", parameters).fetchall()
+    return [row[3] for row in rows]
+
+
+def full_table_scans(
+    plan: Iterable[str], allowed: Iterable[str] = ALLOWED_FULL_SCANS
+) -> list[str]:
+    """Names of real tables that a query plan reads without an index."""
+    allowed = set(allowed)
+    scans = []
+    for detail in plan:
+        match = _FULL_SCAN.match(detail.strip())
+        if match and match.group(1) not in allowed:
+            scans.append(match.group(1))
+    return scans
+
+
+def table_aliases(statement: str, tables: Iterable[str]) -> dict[str, str]:
+    """Map each alias of a real table in statement to the table name."""
+    tables = set(tables)
+    return {
+        alias: table
+        for table, alias in _TABLE_ALIAS.findall(statement)
+        if table in tables
+    }
+
+
+def find_full_scans(
+    db_path: str,
+    queries: Iterable[CapturedQuery],
+    allowed: Iterable[str] = ALLOWED_FULL_SCANS,
+) -> dict[str, list[str]]:
+    """Explain each distinct query against db_path and report table scans.
+
+    Only names that are real tables (or aliases of one) count, so scans of
+    CTEs, subqueries and FTS virtual tables are ignored.
+    """
+    conn = sqlite3.connect(db_path)
+    try:
+        tables = {
+            row[0]
+            for row in conn.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'table' AND sql NOT LIKE 'CREATE VIRTUAL%'"
+            )
+        }
+        problems: dict[str, list[str]] = {}
+        for query in queries:
+            if query.statement in problems:
+                continue
+            plan = explain(conn, query.statement, query.parameters)
+            # Plans name aliased tables by alias; report the table itself
+            aliases = table_aliases(query.statement, tables)
+            scanned = [aliases.get(t, t) for t in full_table_scans(plan, ())]
+            scans = [t for t in scanned if t in tables and t not in allowed]
+            if scans:
+                problems[query.statement] = scans
+        return problems
+    finally:
+        conn.close()
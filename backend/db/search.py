@@ -0,0 +1,96 @@
+"""Full-text task search backed by the task_fts FTS5 index."""
+
+import html
+import re
+from dataclasses import dataclass
+
+from sqlalchemy import text
+
+# Column weights for bm25(): title matches count most, then description
+BM25_WEIGHTS = (10.0, 4.0, 1.0)
+
+_TERM = re.compile(r"\w+", re.UNICODE)
+
+# Private-use characters FTS5 wraps matches in; the task text is
+# HTML-escaped before they are swapped for the real mark tags
+_MATCH_OPEN = "\ue000"
+_MATCH_CLOSE = "\ue001"
+
+_SEARCH_SQL = text(
+    f"""
+    SELECT task.id AS id,
+           bm25(task_fts, {', '.join(str(w) for w in BM25_WEIGHTS)}) AS rank,
+           snippet(task_fts, -1, :mark_open, :mark_close, '…', 12) AS snippet
+    FROM task_fts
+    JOIN task ON task.id = task_fts.rowid
+    WHERE task_fts MATCH :match
+      AND task.created_by = :user_id
+      AND (:include_archived OR task.archived = 0)
+    ORDER BY rank
+    LIMIT :limit
+    """
+)
+
+
+def _highlight(snippet: str, mark_open: str, mark_close: str) -> str:
+    """Escape task text as HTML, then mark the matched terms."""
+    return (
+        html.escape(snippet or "")
+        .replace(_MATCH_OPEN, mark_open)
+        .replace(_MATCH_CLOSE, mark_close)
+    )
+
+
+@dataclass(frozen=True)
+class SearchHit:
+    task_id: int
+    rank: float
+    snippet: str
+
+
+def build_match_query(query: str) -> str | None:
+    """Turn free text into a safe FTS5 MATCH expression.
+
+    Every word becomes a quoted prefix term ("wri"* "rep"*), so user input
+    can never inject FTS operators and partial words still match. All terms
+    must match. Returns None when the text has no searchable words.
+    """
+    terms = _TERM.findall(query or "")
+    if not terms:
+        return None
+    return " ".join(f'"{term}"*' for term in terms)
+
+
+async def search_tasks(
+    db_session,
+    user_id: int,
+    query: str,
+    limit: int = 20,
+    include_archived: bool = False,
+    mark_open: str = "<mark>",
+    mark_close: str = "</mark>",
+) -> list[SearchHit]:
+    """Rank the user's tasks against query with BM25, best match first.
+
+    Snippets are HTML-escaped task text with matches wrapped in
+    mark_open / mark_close.
+    """
+    match = build_match_query(query)
+    if match is None:
+        return []
+
+    result = await db_session.execute(
+        _SEARCH_SQL,
+        {
+            "match": match,
+            "user_id": user_id,
+            "include_archived": bool(include_archived),
+            "limit": limit,
+            "mark_open": _MATCH_OPEN,
+            "mark_close": _MATCH_CLOSE,
+        },
+    )
+    return [
+        SearchHit(row.id, row.rank, _highlight(row.snippet, mark_open, mark_close))
+        for row in result
+    ]
@@ -0,0 +1,135 @@
+"""
+Process-wide, read-only lookup of task statuses.
+
+Statuses are seed data (d16fdcc4c152_seed_core_defaults) and no endpoint
+writes them, so they are loaded once at startup into an immutable registry
+instead of being queried on every task write. Entries are plain frozen
+records, not ORM instances, so they are safe to share across sessions.
+"""
+
+from dataclasses import dataclass
+from types import MappingProxyType
+
+from sqlalchemy import select
+
+# Seed ids, used only when the status table has no row with a matching title
+TODO_STATUS_ID = 1
+IN_PROGRESS_STATUS_ID = 2
+DONE_STATUS_ID = 3
+
+TODO_TITLES = ("Todo", "To Do")
+IN_PROGRESS_TITLES = ("In Progress",)
+DONE_TITLES = ("Done", "Completed")
+
+
+@dataclass(frozen=True)
+class StatusInfo:
+    id: int
+    title: str
+    description: str | None = None
+
+
+def _normalize(title: str) -> str:
+    return " ".join((title or "").lower().split())
+
+
+class StatusRegistry:
+    """Immutable lookup of statuses by id and by normalized title."""
+
+    def __init__(self, statuses):
+        ordered = tuple(sorted(statuses, key=lambda status: status.id))
+        by_title = {}
+        for status in ordered:
+            by_title.setdefault(_normalize(status.title), status)
+        self._statuses = ordered
+        self._by_id = MappingProxyType({status.id: status for status in ordered})
+        self._by_title = MappingProxyType(by_title)
+
+    def __iter__(self):
+        return iter(self._statuses)
+
+    def __len__(self) -> int:
+        return len(self._statuses)
+
+    def __contains__(self, status_id) -> bool:
+        return status_id in self._by_id
+
+    def get(self, status_id: int) -> StatusInfo | None:
+        return self._by_id.get(status_id)
+
+    def by_title(self, *titles: str) -> StatusInfo | None:
+        """First status matching any of titles (case and spacing ignored)."""
+        for title in titles:
+            status = self._by_title.get(_normalize(title))
+            if status is not None:
+                return status
+        return None
+
+    def resolve_id(self, fallback_id: int, *titles: str) -> int | None:
+        """Id of the first status matching titles, else fallback_id if it exists."""
+        status = self.by_title(*titles)
+        if status is not None:
+            return status.id
+        return fallback_id if fallback_id in self._by_id else None
+
+    @property
+    def todo_id(self) -> int | None:
+        return self.resolve_id(TODO_STATUS_ID, *TODO_TITLES)
+
+    @property
+    def in_progress_id(self) -> int | None:
+        return self.resolve_id(IN_PROGRESS_STATUS_ID, *IN_PROGRESS_TITLES)
+
+    @property
+    def done_id(self) -> int | None:
+        return self.resolve_id(DONE_STATUS_ID, *DONE_TITLES)
+
+    @property
+    def default_id(self) -> int | None:
+        """Status for new tasks: Todo, else the lowest id."""
+        todo = self.todo_id
+        if todo is not None:
+            return todo
+        return self._statuses[0].id if self._statuses else None
+
+
+_registry: StatusRegistry | None = None
+
+
+async def load_status_registry(db_session=None) -> StatusRegistry:
+    """(Re)load the registry from the status table and install it."""
+    global _registry
+    from backend.db.models import Status
+
+    async def _read(s):
+        result = await s.execute(
+            select(Status.id, Status.title, Status.description).order_by(Status.id)
+        )
+        return StatusRegistry(StatusInfo(*row) for row in result.all())
+
+    if db_session is not None:
+        registry = await _read(db_session)
+    else:
+        from backend.db.engine_async import AsyncSessionLocal
+
+        async with AsyncSessionLocal() as s:
+            registry = await _read(s)
+    _registry = registry
+    return registry
+
+
+async def get_status_registry(db_session=None) -> StatusRegistry:
+    """The loaded registry; loads it on first use if startup did not.
+
+    Concurrent first calls may both load, which is harmless: the seed rows
+    are identical and the last one installed wins.
+    """
+    if _registry is not None:
+        return _registry
+    return await load_status_registry(db_session)
+
+
+def reset_status_registry():
+    """Forget the loaded registry (the next lookup reloads it)."""
+    global _registry
+    _registry = None
@@ -0,0 +1,104 @@
+"""
+Delta sync for tasks, journal entries and categories.
+
+Triggers keep one sync_change entry per row, moved to a fresh seq on every
+insert, update or delete (deletes leave a tombstone). The change token a
+client holds is the highest seq it has applied, so catching up is an index
+range scan on (user_id, seq) plus a primary-key fetch of the changed rows.
+Tag links and category or tag renames count as task changes, since they
+alter the task payload.
+"""
+
+from dataclasses import dataclass, field
+
+from sqlalchemy import and_, select
+
+from backend.db.models import Category, JournalEntry, SyncChange, Task
+from backend.db.projections import fetch_task_dicts, task_projection
+
+# Largest number of changes returned by one sync call
+SYNC_PAGE_SIZE = 500
+
+# sync_change.entity -> response key
+ENTITY_KEYS = {
+    "task": "tasks",
+    "journal": "journal_entries",
+    "category": "categories",
+}
+
+
+@dataclass
+class SyncBatch:
+    token: int
+    has_more: bool
+    changed: dict[str, list[dict]] = field(
+        default_factory=lambda: {key: [] for key in ENTITY_KEYS.values()}
+    )
+    deleted: dict[str, list[int]] = field(
+        default_factory=lambda: {key: [] for key in ENTITY_KEYS.values()}
+    )
+
+    def to_dict(self) -> dict:
+        return {
+            **self.changed,
+            "deleted": self.deleted,
+            "token": self.token,
+            "has_more": self.has_more,
+        }
+
+
+async def _load_rows(db_session, user_id: int, ids: dict[str, list[int]]) -> dict:
+    changed = {key: [] for key in ENTITY_KEYS.values()}
+    if ids["task"]:
+        changed["tasks"] = await fetch_task_dicts(
+            db_session,
+            task_projection()
+            .where(and_(Task.id.in_(ids["task"]), Task.created_by == user_id))
+            .order_by(Task.id),
+        )
+    for entity, model, owner in (
+        ("journal", JournalEntry, JournalEntry.user_id),
+        ("category", Category, Category.created_by),
+    ):
+        if ids[entity]:
+            result = await db_session.execute(
+                select(model)
+                .where(and_(model.id.in_(ids[entity]), owner == user_id))
+                .order_by(model.id)
+            )
+            changed[ENTITY_KEYS[entity]] = [
+                row.to_dict() for row in result.scalars().all()
+            ]
+    return changed
+
+
+async def changes_since(
+    db_session, user_id: int, since: int = 0, limit: int = SYNC_PAGE_SIZE
+) -> SyncBatch:
+    """Rows changed or deleted after token since, oldest change first.
+
+    Returns at most limit changes; when has_more is set, call again with
+    the returned token. since=0 returns every live row and no tombstones.
+    """
+    result = await db_session.execute(
+        select(
+            SyncChange.seq, SyncChange.entity, SyncChange.entity_id, SyncChange.deleted
+        )
+        .where(and_(SyncChange.user_id == user_id, SyncChange.seq > since))
+        .order_by(SyncChange.seq)
+        .limit(limit + 1)
+    )
+    changes = result.all()
+    has_more = len(changes) > limit
+    changes = changes[:limit]
+
+    batch = SyncBatch(token=changes[-1].seq if changes else since, has_more=has_more)
+    live_ids = {entity: [] for entity in ENTITY_KEYS}
+    for change in changes:
+        if not change.deleted:
+            live_ids[change.entity].append(change.entity_id)
+        elif since:
+            batch.deleted[ENTITY_KEYS[change.entity]].append(change.entity_id)
+
+    batch.changed = await _load_rows(db_session, user_id, live_ids)
+    return batch
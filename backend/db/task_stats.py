@@ -0,0 +1,161 @@
+"""
+Materialized per-user task counters (user_task_stats).
+
+Triggers on task keep one row per (user, status) current, so totals, done,
+archived and per-status open counts are a primary-key read instead of a
+COUNT(*) over the user's tasks. Overdue depends on today's date and is not
+materialized.
+
+Check the counters against task, and optionally rebuild them:
+
+    python -m backend.db.task_stats [--fix]
+"""
+
+import argparse
+import asyncio
+import sys
+from dataclasses import dataclass, field
+from types import MappingProxyType
+
+from sqlalchemy import and_, case, delete, func, insert, select
+
+from backend.db.models import Task, UserTaskStats
+
+_COUNTERS = ("task_count", "archived_count", "done_count", "open_count")
+
+
+@dataclass(frozen=True)
+class TaskStats:
+    """One user's counters, summed over statuses."""
+
+    # Every task, archived or not
+    tasks: int = 0
+    archived: int = 0
+    # Non-archived tasks by done flag
+    done: int = 0
+    open: int = 0
+    open_by_status: MappingProxyType = field(
+        default_factory=lambda: MappingProxyType({})
+    )
+
+    @property
+    def active(self) -> int:
+        return self.done + self.open
+
+    def open_in(self, status_id: int | None) -> int:
+        """Non-archived, not-done tasks in a status."""
+        return self.open_by_status.get(status_id, 0)
+
+
+@dataclass(frozen=True)
+class StatsDrift:
+    user_id: int
+    status_id: int
+    stored: tuple[int, int, int, int]
+    actual: tuple[int, int, int, int]
+
+
+async def get_task_stats(db_session, user_id: int) -> TaskStats:
+    """Read a user's counters (one row per status, by primary key)."""
+    result = await db_session.execute(
+        select(
+            UserTaskStats.status_id,
+            UserTaskStats.task_count,
+            UserTaskStats.archived_count,
+            UserTaskStats.done_count,
+            UserTaskStats.open_count,
+        ).where(UserTaskStats.user_id == user_id)
+    )
+    tasks = archived = done = open_ = 0
+    open_by_status = {}
+    for status_id, task_count, archived_count, done_count, open_count in result:
+        tasks += task_count
+        archived += archived_count
+        done += done_count
+        open_ += open_count
+        open_by_status[status_id] = open_count
+    return TaskStats(tasks, archived, done, open_, MappingProxyType(open_by_status))
+
+
+def _actual_counts():
+    """The counters recomputed from task, grouped like user_task_stats."""
+    active = Task.archived == False
+    return select(
+        Task.created_by,
+        Task.status_id,
+        func.count(),
+        func.sum(case((Task.archived == True, 1), else_=0)),
+        func.sum(case((and_(active, Task.done == True), 1), else_=0)),
+        func.sum(case((and_(active, Task.done == False), 1), else_=0)),
+    ).group_by(Task.created_by, Task.status_id)
+
+
+async def find_stats_drift(db_session) -> list[StatsDrift]:
+    """Every (user, status) whose stored counters differ from task."""
+    stored_rows = await db_session.execute(
+        select(UserTaskStats.user_id, UserTaskStats.status_id).add_columns(
+            *(getattr(UserTaskStats, name) for name in _COUNTERS)
+        )
+    )
+    stored = {(row[0], row[1]): tuple(row[2:]) for row in stored_rows}
+    actual = {
+        (row[0], row[1]): tuple(row[2:])
+        for row in await db_session.execute(_actual_counts())
+    }
+
+    zero = (0, 0, 0, 0)
+    drift = []
+    for key in sorted(stored.keys() | actual.keys()):
+        have, want = stored.get(key, zero), actual.get(key, zero)
+        if have != want:
+            drift.append(StatsDrift(key[0], key[1], have, want))
+    return drift
+
+
+async def rebuild_task_stats(db_session):
+    """Recompute every counter from task (caller commits)."""
+    await db_session.execute(delete(UserTaskStats))
+    await db_session.execute(
+        insert(UserTaskStats).from_select(
+            ["user_id", "status_id", *_COUNTERS], _actual_counts()
+        )
+    )
+
+
+async def reconcile_task_stats(fix: bool = False) -> list[StatsDrift]:
+    """Report counter drift; with fix=True, rebuild the table when any is found."""
+    from backend.db.engine_async import AsyncSessionLocal
+
+    async with AsyncSessionLocal() as db_session:
+        drift = await find_stats_drift(db_session)
+        if drift and fix:
+            await rebuild_task_stats(db_session)
+            await db_session.commit()
+    return drift
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--fix", action="store_true", help="rebuild the counters if they drifted"
+    )
+    args = parser.parse_args(argv)
+
+    drift = asyncio.run(reconcile_task_stats(fix=args.fix))
+    for item in drift:
+        print(
+            f"user {item.user_id} status {item.status_id}: "
+            f"stored {dict(zip(_COUNTERS, item.stored))} "
+            f"actual {dict(zip(_COUNTERS, item.actual))}"
+        )
+    if not drift:
+        print("user_task_stats is consistent with task")
+        return 0
+    if args.fix:
+        print(f"Rebuilt user_task_stats ({len(drift)} rows had drifted)")
+        return 0
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
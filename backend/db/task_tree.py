@@ -0,0 +1,134 @@
+"""
+Subtask trees loaded with a single WITH RECURSIVE query.
+
+The recursive CTE walks task.parent_id (ix_task_parent_id) from one or
+more roots, and the task columns come back in the same statement, so a
+nested checklist costs one query plus the batched tag lookup no matter how
+deep it is. Child and done counts are rolled up over the whole subtree,
+including levels cut off by the depth limit.
+"""
+
+from collections.abc import Iterable
+
+from sqlalchemy import and_, literal, select
+from sqlalchemy.orm import aliased
+
+from backend.db.models import Task
+from backend.db.projections import fetch_tag_names, task_projection, task_row_to_dict
+
+# Largest depth a client may ask for
+MAX_TREE_DEPTH = 20
+# Hard stop for the recursive walk, even if bad data ever formed a cycle
+_WALK_LIMIT = 64
+
+
+def _subtree_cte(user_id: int, root_ids: Iterable[int]):
+    subtree = (
+        select(Task.id.label("id"), literal(0).label("depth"))
+        .where(and_(Task.id.in_(list(root_ids)), Task.created_by == user_id))
+        .cte("subtree", recursive=True)
+    )
+    child = aliased(Task)
+    return subtree.union_all(
+        select(child.id, subtree.c.depth + 1)
+        .join(subtree, child.parent_id == subtree.c.id)
+        .where(and_(child.archived == False, subtree.c.depth < _WALK_LIMIT))
+    )
+
+
+async def load_task_trees(
+    db_session, user_id: int, root_ids: Iterable[int], depth: int
+) -> dict[int, dict]:
+    """Load the subtrees under root_ids, keyed by root id.
+
+    Each node is a task dict plus:
+        subtasks: child nodes (empty past the depth limit)
+        child_count / done_child_count: direct, non-archived children
+        descendant_count / done_descendant_count: the whole subtree
+        truncated: True when children exist beyond the depth limit
+    """
+    root_ids = list(root_ids)
+    if not root_ids:
+        return {}
+
+    subtree = _subtree_cte(user_id, root_ids)
+    result = await db_session.execute(
+        task_projection()
+        .add_columns(subtree.c.depth)
+        .join(subtree, subtree.c.id == Task.id)
+        .order_by(subtree.c.depth, Task.position, Task.id)
+    )
+    rows = {}
+    for row in result.all():
+        # A node reachable from two roots keeps its shallowest depth
+        rows.setdefault(row.id, row)
+
+    children: dict[int, list[int]] = {}
+    for row in rows.values():
+        if row.depth > 0 and row.parent_id in rows:
+            children.setdefault(row.parent_id, []).append(row.id)
+
+    # Roll counts up from the deepest level so every child is final first
+    counts = {task_id: [0, 0, 0, 0] for task_id in rows}
+    for row in sorted(rows.values(), key=lambda r: r.depth, reverse=True):
+        if row.depth == 0 or row.parent_id not in counts:
+            continue
+        own, parent = counts[row.id], counts[row.parent_id]
+        parent[0] += 1
+        parent[1] += 1 if row.done else 0
+        parent[2] += 1 + own[2]
+        parent[3] += (1 if row.done else 0) + own[3]
+
+    kept = [task_id for task_id, row in rows.items() if row.depth <= depth]
+    tags_by_task = await fetch_tag_names(db_session, kept)
+
+    def build(task_id: int) -> dict:
+        row = rows[task_id]
+        child_count, done_children, descendants, done_descendants = counts[task_id]
+        node = task_row_to_dict(row, tags_by_task.get(task_id))
+        within = row.depth < depth
+        node.update(
+            {
+                "depth": row.depth,
+                "child_count": child_count,
+                "done_child_count": done_children,
+                "descendant_count": descendants,
+                "done_descendant_count": done_descendants,
+                "truncated": bool(child_count) and not within,
+                "subtasks": (
+                    [build(child) for child in children.get(task_id, [])]
+                    if within
+                    else []
+                ),
+            }
+        )
+        return node
+
+    return {
+        task_id: build(task_id)
+        for task_id in root_ids
+        if task_id in rows and rows[task_id].depth == 0
+    }
+
+
+async def is_in_subtree(db_session, root_id: int, candidate_id: int) -> bool:
+    """True when candidate_id is root_id or one of its descendants."""
+    ancestors = (
+        select(
+            Task.id.label("id"),
+            Task.parent_id.label("parent_id"),
+            literal(0).label("hops"),
+        )
+        .where(Task.id == candidate_id)
+        .cte("ancestors", recursive=True)
+    )
+    parent = aliased(Task)
+    ancestors = ancestors.union_all(
+        select(parent.id, parent.parent_id, ancestors.c.hops + 1)
+        .join(ancestors, parent.id == ancestors.c.parent_id)
+        .where(ancestors.c.hops < _WALK_LIMIT)
+    )
+    found = await db_session.scalar(
+        select(ancestors.c.id).where(ancestors.c.id == root_id).limit(1)
+    )
+    return found is not None
@@ -90,6 +90,13 @@ class ConflictError(APIError):
         super().__init__(message, status_code=409, details=details)
 
 
+class ServiceUnavailableError(APIError):
+    """Raised when the server is temporarily overloaded (503 Service Unavailable)"""
+    
+    def __init__(self, message: str = "Service temporarily unavailable", details: Optional[Dict[str, Any]] = None):
+        super().__init__(message, status_code=503, details=details)
+
+
 class DatabaseError(APIError):
     """Raised when database operations fail (500 Internal Server Error)"""
     
@@ -7,6 +7,86 @@ from datetime import datetime
 """Decorator to require authentication for routes and functions."""
 
 
+async def _validate_session_in_db(session_id):
+    """Check a session against user_sessions and cache it when valid."""
+    # Lazy imports to avoid circular references
+    from backend.db.engine_async import AsyncSessionLocal
+    from backend.db.models import UserSession
+    from backend.errors import AuthenticationError
+    from backend.security.session_cache import session_cache
+    from sqlalchemy import select, and_
+
+    logging.debug(f"Validating session {session_id} for user {session.get('user_id')}")
+
+    async with AsyncSessionLocal() as db_session:
+        result = await db_session.execute(
+            select(UserSession).where(
+                and_(
+                    UserSession.session_id == session_id,
+                    UserSession.is_active.is_(True),
+                )
+            )
+        )
+        user_session = result.scalar_one_or_none()
+
+        # Session not found or inactive
+        if not user_session:
+            session.clear()
+            logging.warning(
+                f"Invalid session attempt: {session_id} - not found in database or inactive"
+            )
+            raise AuthenticationError("Session expired or invalid")
+
+        # Expired session
+        if user_session.expires_at and datetime.now() > user_session.expires_at:
+            user_session.is_active = False
+            await db_session.commit()
+            session.clear()
+            logging.info(
+                f"Session expired for user {user_session.user_id} - expired at {user_session.expires_at}"
+            )
+            raise AuthenticationError("Session has expired")
+
+        session_cache.put(session_id, user_session.user_id, user_session.expires_at)
+        logging.debug(
+            f"Session validated for user {user_session.user_id}, expires at {user_session.expires_at}"
+        )
+
+
+async def session_is_active(session_id) -> bool:
+    """Whether a login session is still valid, outside any request context.
+
+    For responses that outlive the request's auth check, such as the change
+    stream. Uses the session cache, falling back to user_sessions.
+    """
+    from backend.db.engine_async import AsyncSessionLocal
+    from backend.db.models import UserSession
+    from backend.security.session_cache import session_cache
+    from sqlalchemy import select, and_
+
+    if not session_id:
+        return False
+    cached = session_cache.get(session_id)
+    if cached is not None:
+        expires_at = cached.expires_at
+    else:
+        async with AsyncSessionLocal() as db_session:
+            result = await db_session.execute(
+                select(UserSession.user_id, UserSession.expires_at).where(
+                    and_(
+                        UserSession.session_id == session_id,
+                        UserSession.is_active.is_(True),
+                    )
+                )
+            )
+            row = result.one_or_none()
+        if row is None:
+            return False
+        session_cache.put(session_id, row.user_id, row.expires_at)
+        expires_at = row.expires_at
+    return not (expires_at and datetime.now() > expires_at)
+
+
 def auth_required(f):
     @wraps(f)
     async def decorated_function(*args, **kwargs):
@@ -24,51 +104,24 @@ def auth_required(f):
         # Must have session_id (added after login)
         session_id = session.get("session_id")
         if session_id:
-            # Lazy imports to avoid circular references
-            from backend.db.engine_async import AsyncSessionLocal
-            from backend.db.models import UserSession
-            from backend.errors import AuthenticationError
-            from sqlalchemy import select, and_
+            from backend.security.session_cache import session_cache
 
-            logging.debug(
-                f"Validating session {session_id} for user {session.get('user_id')}"
-            )
+            cached = session_cache.get(session_id)
+            if (
+                cached is not None
+                and cached.expires_at
+                and datetime.now() > cached.expires_at
+            ):
+                # Let the database path below mark it inactive
+                session_cache.invalidate(session_id)
+                cached = None
 
-            async with AsyncSessionLocal() as db_session:
-                result = await db_session.execute(
-                    select(UserSession).where(
-                        and_(
-                            UserSession.session_id == session_id,
-                            UserSession.is_active.is_(True),
-                        )
-                    )
-                )
-                user_session = result.scalar_one_or_none()
+            if cached is None:
+                await _validate_session_in_db(session_id)
 
-                # Session not found or inactive
-                if not user_session:
-                    session.clear()
-                    logging.warning(
-                        f"Invalid session attempt: {session_id} - not found in database or inactive"
-                    )
-                    raise AuthenticationError("Session expired or invalid")
-
-                # Expired session
-                if user_session.expires_at and datetime.now() > user_session.expires_at:
-                    user_session.is_active = False
-                    await db_session.commit()
-                    session.clear()
-                    logging.info(
-                        f"Session expired for user {user_session.user_id} - expired at {user_session.expires_at}"
-                    )
-                    raise AuthenticationError("Session has expired")
-
-                # Update last activity timestamp
-                user_session.last_activity = datetime.now()
-                await db_session.commit()
-                logging.debug(
-                    f"Session activity updated for user {user_session.user_id}, expires at {user_session.expires_at}"
-                )
+            # Buffer the activity timestamp instead of committing per request
+            session_cache.touch(session_id)
+            await session_cache.flush_if_due()
 
         else:
             logging.warning(
@@ -0,0 +1,100 @@
+"""
+Bounded worker pool for PIN hashing and verification.
+
+pbkdf2_sha256 takes tens of milliseconds per call. Running it directly in an
+async route handler stalls every other in-flight request, so the auth and
+account routes hand the work to a small thread pool instead (hashlib releases
+the GIL while it runs PBKDF2). When too many calls are already waiting the
+caller gets a fast 503 rather than queueing behind them.
+"""
+
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from backend.config import PIN_HASH_MAX_PENDING, PIN_HASH_WORKERS
+from backend.db.models import hash_pin, verify_and_migrate_pin
+from backend.errors import ServiceUnavailableError
+
+
+class PinHashExecutor:
+    """Runs KDF work off the event loop and keeps simple metrics"""
+
+    def __init__(
+        self, max_workers: int = PIN_HASH_WORKERS, max_pending: int = PIN_HASH_MAX_PENDING
+    ):
+        self.max_workers = max(1, max_workers)
+        self.max_pending = max(1, max_pending)
+        self._executor: ThreadPoolExecutor | None = None
+        # Only touched from the event loop thread, so no lock is needed
+        self._pending = 0
+        self._peak_pending = 0
+        self._completed = 0
+        self._rejected = 0
+        self._total_ms = 0.0
+        self._max_ms = 0.0
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix="pin-hash"
+            )
+        return self._executor
+
+    async def run(self, fn, *args):
+        """Run fn(*args) on the pool, or raise a 503 if the queue is full"""
+        if self._pending >= self.max_pending:
+            self._rejected += 1
+            raise ServiceUnavailableError(
+                "Server is busy, please try again shortly",
+                details={"reason": "pin_hash_queue_full"},
+            )
+
+        self._pending += 1
+        self._peak_pending = max(self._peak_pending, self._pending)
+        start = time.perf_counter()
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._get_executor(), fn, *args)
+        finally:
+            self._pending -= 1
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            self._completed += 1
+            self._total_ms += elapsed_ms
+            self._max_ms = max(self._max_ms, elapsed_ms)
+
+    def stats(self) -> dict:
+        """Queue depth and latency numbers for the health endpoint"""
+        return {
+            "workers": self.max_workers,
+            "max_pending": self.max_pending,
+            "queue_depth": self._pending,
+            "peak_queue_depth": self._peak_pending,
+            "completed": self._completed,
+            "rejected": self._rejected,
+            "avg_latency_ms": (
+                round(self._total_ms / self._completed, 2) if self._completed else 0.0
+            ),
+            "max_latency_ms": round(self._max_ms, 2),
+        }
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+
+# One shared pool per process
+pin_executor = PinHashExecutor()
+
+
+async def hash_pin_async(pin: str) -> str:
+    """hash_pin() on the worker pool"""
+    return await pin_executor.run(hash_pin, pin)
+
+
+async def verify_and_migrate_pin_async(
+    pin: str, stored_hash: str
+) -> tuple[bool, str | None]:
+    """verify_and_migrate_pin() on the worker pool"""
+    return await pin_executor.run(verify_and_migrate_pin, pin, stored_hash)
@@ -0,0 +1,145 @@
+"""
+In-process cache of validated login sessions.
+
+auth_required used to SELECT the user_sessions row and COMMIT a last_activity
+update on every request. Validated sessions are now remembered for a short
+TTL, and last_activity updates are merged in memory and written back in one
+batched UPDATE per flush interval.
+
+Anything that revokes a session (logout, force logout, account deletion)
+must call invalidate() so the next request goes back to the database.
+"""
+
+import logging
+import time
+from dataclasses import dataclass
+from datetime import datetime
+
+from sqlalchemy import bindparam, update
+
+from backend.config import SESSION_ACTIVITY_FLUSH_SECONDS, SESSION_CACHE_TTL_SECONDS
+
+
+@dataclass(frozen=True)
+class CachedSession:
+    """The parts of a UserSession row needed to authorize a request"""
+
+    user_id: int
+    expires_at: datetime | None
+    cached_until: float
+
+
+class SessionCache:
+    """Remembers validated sessions and buffers their activity timestamps"""
+
+    def __init__(
+        self,
+        ttl_seconds: int = SESSION_CACHE_TTL_SECONDS,
+        flush_interval_seconds: int = SESSION_ACTIVITY_FLUSH_SECONDS,
+    ):
+        self.ttl_seconds = ttl_seconds
+        self.flush_interval_seconds = flush_interval_seconds
+        self._sessions: dict[str, CachedSession] = {}
+        self._pending_activity: dict[str, datetime] = {}
+        self._last_flush = time.monotonic()
+
+    def get(self, session_id: str) -> CachedSession | None:
+        """Return the cached session if it is still fresh"""
+        entry = self._sessions.get(session_id)
+        if entry is None:
+            return None
+        if time.monotonic() >= entry.cached_until:
+            # Too old, make the caller re-check the database
+            self._sessions.pop(session_id, None)
+            return None
+        return entry
+
+    def put(self, session_id: str, user_id: int, expires_at: datetime | None):
+        """Remember a session that was just validated against the database"""
+        if self.ttl_seconds <= 0:
+            return
+        self._sessions[session_id] = CachedSession(
+            user_id=user_id,
+            expires_at=expires_at,
+            cached_until=time.monotonic() + self.ttl_seconds,
+        )
+
+    def invalidate(self, *session_ids: str):
+        """Forget sessions so the next request re-validates them"""
+        for session_id in session_ids:
+            if session_id:
+                self._sessions.pop(session_id, None)
+
+    def invalidate_user(self, user_id: int):
+        """Forget every cached session that belongs to a user"""
+        stale = [sid for sid, entry in self._sessions.items() if entry.user_id == user_id]
+        self.invalidate(*stale)
+
+    def clear(self):
+        """Drop all cached sessions (pending activity is kept)"""
+        self._sessions.clear()
+
+    def touch(self, session_id: str, when: datetime | None = None):
+        """Record activity for a session; only the latest timestamp is kept"""
+        self._pending_activity[session_id] = when or datetime.now()
+
+    @property
+    def pending_count(self) -> int:
+        return len(self._pending_activity)
+
+    def flush_due(self) -> bool:
+        """True when buffered activity should be written back"""
+        if not self._pending_activity:
+            return False
+        return time.monotonic() - self._last_flush >= self.flush_interval_seconds
+
+    async def flush(self) -> int:
+        """Write buffered last_activity values in one executemany UPDATE.
+
+        Returns the number of sessions written. On failure the updates are
+        put back into the buffer so the next flush retries them.
+        """
+        self._last_flush = time.monotonic()
+        if not self._pending_activity:
+            return 0
+
+        pending, self._pending_activity = self._pending_activity, {}
+
+        # Lazy imports so the engine configured at app start-up is used
+        from backend.db.engine_async import AsyncSessionLocal
+        from backend.db.models import UserSession
+
+        table = UserSession.__table__
+        stmt = (
+            update(table)
+            .where(table.c.session_id == bindparam("b_session_id"))
+            .values(last_activity=bindparam("b_last_activity"))
+        )
+        params = [
+            {"b_session_id": sid, "b_last_activity": ts} for sid, ts in pending.items()
+        ]
+
+        try:
+            async with AsyncSessionLocal() as db_session:
+                await db_session.execute(stmt, params)
+                await db_session.commit()
+        except Exception:
+            logging.exception("Failed to flush session activity")
+            # Keep whichever timestamp is newer for each session
+            for sid, ts in pending.items():
+                current = self._pending_activity.get(sid)
+                if current is None or current < ts:
+                    self._pending_activity[sid] = ts
+            return 0
+
+        logging.debug(f"Flushed activity for {len(pending)} sessions")
+        return len(pending)
+
+    async def flush_if_due(self) -> int:
+        if self.flush_due():
+            return await self.flush()
+        return 0
+
+
+# One shared cache per process
+session_cache = SessionCache()
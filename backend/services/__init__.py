@@ -2,8 +2,15 @@
 
 from backend.services.llm_service import LLMService
 from backend.services.context_builder import ContextBuilder
+from backend.services.scheduler import reap_sessions, start_scheduler, shutdown_scheduler
+from backend.services.title_index import TitleIndex, title_indexes
 
 __all__ = [
     "LLMService",
     "ContextBuilder",
+    "reap_sessions",
+    "start_scheduler",
+    "shutdown_scheduler",
+    "TitleIndex",
+    "title_indexes",
 ]
@@ -0,0 +1,92 @@
+"""
+In-process pub/sub for per-user change events.
+
+bump_data_version() queues an event on the writing session, and it is
+published here once that transaction commits. Each open /api/events stream
+holds a Subscription with a bounded queue. A subscriber that falls behind
+has its backlog replaced by a single "resync" event instead of growing
+without bound or slowing down writers.
+
+Events only reach streams connected to this process; with several worker
+processes, clients still catch up through /api/sync on reconnect.
+"""
+
+import asyncio
+from dataclasses import dataclass, field
+
+from backend.config import CHANGE_STREAM_QUEUE_SIZE
+
+# What a change event can name in "changed"
+CHANGE_KINDS = ("task", "journal", "category", "settings")
+
+
+@dataclass(frozen=True)
+class ChangeEvent:
+    """One committed write: the user's new data version and what it touched."""
+
+    version: int
+    changed: tuple[str, ...] = ()
+    # "change", or "resync" when the subscriber missed events
+    type: str = "change"
+
+    def to_dict(self) -> dict:
+        return {"version": self.version, "changed": list(self.changed)}
+
+
+@dataclass(eq=False)
+class Subscription:
+    user_id: int
+    queue: asyncio.Queue = field(
+        default_factory=lambda: asyncio.Queue(maxsize=CHANGE_STREAM_QUEUE_SIZE)
+    )
+
+    def offer(self, event: ChangeEvent):
+        try:
+            self.queue.put_nowait(event)
+        except asyncio.QueueFull:
+            # Too slow to keep up: drop the backlog and ask for a resync
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            self.queue.put_nowait(ChangeEvent(event.version, CHANGE_KINDS, "resync"))
+
+    async def get(self, timeout: float) -> ChangeEvent | None:
+        """Next event, or None if none arrived within timeout seconds."""
+        try:
+            return await asyncio.wait_for(self.queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+
+class ChangeHub:
+    """Fans committed change events out to each user's open streams."""
+
+    def __init__(self):
+        self._subscribers: dict[int, set[Subscription]] = {}
+
+    def subscribe(self, user_id: int) -> Subscription:
+        subscription = Subscription(user_id)
+        self._subscribers.setdefault(user_id, set()).add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription):
+        subscribers = self._subscribers.get(subscription.user_id)
+        if subscribers is not None:
+            subscribers.discard(subscription)
+            if not subscribers:
+                del self._subscribers[subscription.user_id]
+
+    def subscriber_count(self, user_id: int | None = None) -> int:
+        if user_id is not None:
+            return len(self._subscribers.get(user_id, ()))
+        return sum(len(subs) for subs in self._subscribers.values())
+
+    def publish(self, user_id: int, event: ChangeEvent):
+        """Deliver to every stream of user_id without blocking."""
+        for subscription in tuple(self._subscribers.get(user_id, ())):
+            subscription.offer(event)
+
+    def clear(self):
+        self._subscribers.clear()
+
+
+change_hub = ChangeHub()
@@ -3,7 +3,7 @@
 import json
 import logging
 from datetime import datetime
-from sqlalchemy import select, func, and_
+from sqlalchemy import select, and_
 
 logger = logging.getLogger(__name__)
 
@@ -24,26 +24,13 @@ class ContextBuilder:
         """
         try:
             from backend.db.models import Task, JournalEntry
+            from backend.db.statuses import get_status_registry
+            from backend.db.task_stats import get_task_stats
 
-            # Get total task count
-            total_result = await db_session.execute(
-                select(func.count(Task.id)).where(
-                    and_(Task.created_by == user_id, Task.archived == False)
-                )
-            )
-            total_tasks = total_result.scalar_one()
-
-            # Get completed task count
-            completed_result = await db_session.execute(
-                select(func.count(Task.id)).where(
-                    and_(
-                        Task.created_by == user_id,
-                        Task.done == True,
-                        Task.archived == False
-                    )
-                )
-            )
-            completed_tasks = completed_result.scalar_one()
+            # Total and completed task counts (non-archived)
+            stats = await get_task_stats(db_session, user_id)
+            total_tasks = stats.active
+            completed_tasks = stats.done
 
             # Calculate completion rate
             completion_rate = (
@@ -86,11 +73,14 @@ class ContextBuilder:
             )
             recent_tasks_list = recent_result.scalars().all()
 
+            statuses = await get_status_registry(db_session)
             recent_tasks = []
             for task in recent_tasks_list:
+                status = statuses.get(task.status_id)
                 recent_tasks.append({
                     "title": task.title,
                     "done": task.done,
+                    "status": status.title if status else None,
                     "due_date": task.due_date.strftime("%Y-%m-%d") if task.due_date else None
                 })
 
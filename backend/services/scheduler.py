@@ -0,0 +1,130 @@
+"""Background maintenance scheduler for Task Line backend."""
+
+import asyncio
+import logging
+from datetime import datetime, timedelta
+
+from apscheduler.schedulers.asyncio import AsyncIOScheduler
+from sqlalchemy import and_, delete, or_, select
+
+from backend.config import (
+    MAINTENANCE_SCHEDULER_ENABLED,
+    SESSION_ACTIVITY_FLUSH_SECONDS,
+    SESSION_INACTIVE_DAYS,
+    SESSION_REAP_BATCH_SIZE,
+    SESSION_REAP_INTERVAL_MINUTES,
+)
+
+logger = logging.getLogger(__name__)
+
+_scheduler: AsyncIOScheduler | None = None
+
+
+async def reap_sessions(
+    inactive_days: int | None = SESSION_INACTIVE_DAYS,
+    batch_size: int = SESSION_REAP_BATCH_SIZE,
+    now: datetime | None = None,
+) -> int:
+    """
+    Delete expired and long-inactive user_sessions rows.
+
+    Rows go in batches of at most batch_size, each a single
+    DELETE ... WHERE id IN (SELECT id ... LIMIT n) in its own transaction,
+    so the SQLite write lock is released between batches.
+
+    Args:
+        inactive_days: Also delete sessions idle for this many days
+            (None only deletes sessions past expires_at)
+        batch_size: Maximum rows removed per statement
+        now: Reference time (defaults to datetime.now())
+
+    Returns:
+        int: Total number of rows deleted
+    """
+    # Lazy imports so the engine configured at app start-up is used
+    from backend.db.engine_async import AsyncSessionLocal
+    from backend.db.models import UserSession
+
+    now = now or datetime.now()
+    stale = and_(UserSession.expires_at.isnot(None), UserSession.expires_at < now)
+    if inactive_days is not None:
+        stale = or_(
+            stale, UserSession.last_activity < now - timedelta(days=inactive_days)
+        )
+
+    # Cached validations don't need evicting here: auth_required checks the
+    # cached expires_at on every hit, and an idle session can't be cached.
+    total = 0
+    while True:
+        batch_ids = select(UserSession.id).where(stale).limit(batch_size)
+        async with AsyncSessionLocal() as db_session:
+            result = await db_session.execute(
+                delete(UserSession)
+                .where(UserSession.id.in_(batch_ids))
+                .execution_options(synchronize_session=False)
+            )
+            await db_session.commit()
+
+        deleted = result.rowcount or 0
+        total += deleted
+        if deleted < batch_size:
+            break
+        # Let request handlers in between batches
+        await asyncio.sleep(0)
+
+    return total
+
+
+async def _reap_sessions_job():
+    deleted = await reap_sessions()
+    if deleted:
+        logger.info(f"Session reaper deleted {deleted} expired or inactive sessions")
+
+
+async def _flush_session_activity_job():
+    from backend.security.session_cache import session_cache
+
+    await session_cache.flush()
+
+
+def start_scheduler() -> AsyncIOScheduler | None:
+    """Start the maintenance scheduler on the running event loop."""
+    global _scheduler
+
+    if not MAINTENANCE_SCHEDULER_ENABLED:
+        logger.info("Maintenance scheduler disabled")
+        return None
+    if _scheduler is not None and _scheduler.running:
+        return _scheduler
+
+    _scheduler = AsyncIOScheduler()
+    _scheduler.add_job(
+        _reap_sessions_job,
+        "interval",
+        minutes=SESSION_REAP_INTERVAL_MINUTES,
+        id="reap_sessions",
+        max_instances=1,
+        coalesce=True,
+        next_run_time=datetime.now(),
+    )
+    # Write buffered last_activity even when no requests are coming in
+    _scheduler.add_job(
+        _flush_session_activity_job,
+        "interval",
+        seconds=SESSION_ACTIVITY_FLUSH_SECONDS,
+        id="flush_session_activity",
+        max_instances=1,
+        coalesce=True,
+    )
+    _scheduler.start()
+    logger.info("Maintenance scheduler started")
+    return _scheduler
+
+
+def shutdown_scheduler():
+    """Stop the maintenance scheduler if it is running."""
+    global _scheduler
+
+    if _scheduler is not None and _scheduler.running:
+        _scheduler.shutdown(wait=False)
+    _scheduler = None
@@ -0,0 +1,166 @@
+"""In-memory trigram index for resolving task titles named by the AI assistant."""
+
+import re
+from collections import Counter, OrderedDict
+from collections.abc import Iterable
+from itertools import chain
+from typing import NamedTuple
+
+from sqlalchemy import and_, select
+
+# Matches scoring below this are treated as "no such task". Resolved titles
+# complete, update and archive tasks, so near misses ("call dad" against
+# "Call mom") must not count.
+MIN_TITLE_SCORE = 0.7
+
+# A fuzzy match is ambiguous, and rejected, unless it beats the best other
+# title by at least this much
+MIN_SCORE_MARGIN = 0.1
+
+_NON_WORD = re.compile(r"[^\w]+", re.UNICODE)
+
+
+class TitleMatch(NamedTuple):
+    task_id: int
+    title: str
+    score: float
+
+
+def _normalize(title: str) -> str:
+    return _NON_WORD.sub(" ", title.lower()).strip()
+
+
+def _trigrams(normalized: str) -> frozenset[str]:
+    padded = f"  {normalized} "
+    return frozenset(padded[i : i + 3] for i in range(len(padded) - 2))
+
+
+class TitleIndex:
+    """Trigram index over one user's active task titles.
+
+    Scores are the Dice coefficient of the title trigram sets (1.0 for an
+    exact, case-insensitive match). Candidates come from an inverted index,
+    so a lookup only touches titles that share at least one trigram.
+    """
+
+    def __init__(self, titles: Iterable[tuple[int, str]]):
+        # Input order breaks ties, so pass the most relevant tasks first
+        self._titles: list[tuple[int, str, str, frozenset[str]]] = []
+        self._exact: dict[str, int] = {}
+        self._postings: dict[str, list[int]] = {}
+        for task_id, title in titles:
+            normalized = _normalize(title)
+            grams = _trigrams(normalized)
+            position = len(self._titles)
+            self._titles.append((task_id, title, normalized, grams))
+            self._exact.setdefault(normalized, position)
+            for gram in grams:
+                self._postings.setdefault(gram, []).append(position)
+
+    def __len__(self) -> int:
+        return len(self._titles)
+
+    def resolve(
+        self,
+        query: str,
+        min_score: float = MIN_TITLE_SCORE,
+        margin: float = MIN_SCORE_MARGIN,
+    ) -> TitleMatch | None:
+        """Best matching task for query.
+
+        An exact (normalized) title always wins. Otherwise returns None
+        below min_score, or when another title scores within margin of the
+        best one.
+        """
+        normalized = _normalize(query or "")
+        if not normalized:
+            return None
+
+        exact = self._exact.get(normalized)
+        if exact is not None:
+            task_id, title, _, _ = self._titles[exact]
+            return TitleMatch(task_id, title, 1.0)
+
+        query_grams = _trigrams(normalized)
+        shared = Counter(
+            chain.from_iterable(self._postings.get(gram, ()) for gram in query_grams)
+        )
+        if not shared:
+            return None
+
+        # Highest score wins; ties go to the earliest position
+        size = len(query_grams)
+        titles = self._titles
+        ranked = sorted(
+            (-2 * count / (size + len(titles[position][3])), position)
+            for position, count in shared.items()
+        )
+        best_score, best_position = -ranked[0][0], ranked[0][1]
+        if best_score < min_score:
+            return None
+        task_id, title, normalized, _ = titles[best_position]
+        # Tasks with the same title are one candidate, as for exact matches
+        runner_up = next(
+            (-score for score, position in ranked if titles[position][2] != normalized),
+            0.0,
+        )
+        if best_score - runner_up < margin:
+            return None
+        return TitleMatch(task_id, title, best_score)
+
+    def resolve_many(
+        self,
+        queries: Iterable[str],
+        min_score: float = MIN_TITLE_SCORE,
+        margin: float = MIN_SCORE_MARGIN,
+    ) -> dict[str, TitleMatch | None]:
+        """Resolve several titles against the same snapshot in one pass."""
+        return {
+            query: self.resolve(query, min_score, margin) for query in set(queries)
+        }
+
+
+class TitleIndexCache:
+    """Per-user TitleIndex snapshots keyed on the user's data_version.
+
+    Any task write bumps data_version, so a cached index is only reused
+    while it still describes the committed titles. The least recently used
+    users are evicted beyond max_users.
+    """
+
+    def __init__(self, max_users: int = 256):
+        self.max_users = max_users
+        self._entries: OrderedDict[int, tuple[int, TitleIndex]] = OrderedDict()
+
+    async def get(self, db_session, user_id: int) -> TitleIndex:
+        from backend.db.models import Task, User
+
+        version = await db_session.scalar(
+            select(User.data_version).where(User.id == user_id)
+        )
+        entry = self._entries.get(user_id)
+        if entry is not None and entry[0] == version:
+            self._entries.move_to_end(user_id)
+            return entry[1]
+
+        result = await db_session.execute(
+            select(Task.id, Task.title)
+            .where(and_(Task.created_by == user_id, Task.archived == False))
+            .order_by(Task.updated_on.desc(), Task.id.desc())
+        )
+        index = TitleIndex(result.all())
+        self._entries[user_id] = (version, index)
+        self._entries.move_to_end(user_id)
+        while len(self._entries) > self.max_users:
+            self._entries.popitem(last=False)
+        return index
+
+    def invalidate(self, user_id: int | None = None):
+        """Drop one user's index, or every index when user_id is None."""
+        if user_id is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(user_id, None)
+
+
+title_indexes = TitleIndexCache()
@@ -72,6 +72,17 @@ class TaskValidator:
         
         return estimate_int
     
+    @staticmethod
+    def validate_parent_id(parent_id: Any) -> Optional[int]:
+        """Validate a parent task reference (None detaches the task)"""
+        if parent_id is None:
+            return None
+        
+        try:
+            return int(parent_id)
+        except (ValueError, TypeError):
+            raise ValidationError("Parent ID must be a valid number")
+    
     @staticmethod
     def validate_task_data(data: Dict[str, Any]) -> Dict[str, Any]:
         """Validate all task fields and return cleaned data"""
@@ -98,6 +109,9 @@ class TaskValidator:
         if 'category' in data:
             validated['category'] = data['category']
         
+        if data.get('parent_id') is not None:
+            validated['parent_id'] = TaskValidator.validate_parent_id(data['parent_id'])
+        
         return validated
 
 
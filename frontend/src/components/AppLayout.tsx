@@ -12,6 +12,7 @@ import {
   LayoutDashboard
 } from 'lucide-react'
 import { useAuth } from '../contexts/AuthContext'
+import { useChangeStream } from '../lib/hooks'
 import { ChatWidget } from './ChatWidget'
 import { TutorialOverlay } from './TutorialOverlay'
 
@@ -27,6 +28,7 @@ const navigation = [
 export const AppLayout: React.FC = () => {
   const { user, logout } = useAuth()
   const location = useLocation()
+  useChangeStream(Boolean(user))
 
   const handleLogout = async () => {
     try {
@@ -1,8 +1,8 @@
 import React, { useState, useRef } from 'react'
 import { Plus, GripVertical, Archive } from 'lucide-react'
-import { useKanbanTasks, useUpdateTask, useDeleteTask, useArchiveCompletedTasks } from '../../lib/hooks'
+import { useKanbanTasks, useKanbanColumnPages, useUpdateTask, useDeleteTask, useArchiveCompletedTasks } from '../../lib/hooks'
 import { TaskItem, TaskModal, DeleteConfirmation, CompletionNotesModal } from '../tasks'
-import type { Task } from '../../lib/api'
+import type { KanbanColumn, Task } from '../../lib/api'
 
 type ColumnType = 'todo' | 'in-progress' | 'done'
 
@@ -20,6 +20,9 @@ interface ColumnProps {
   onDragLeave: () => void
   onDrop: (e: React.DragEvent, targetColumn: ColumnType) => void
   isDragOver: boolean
+  hasMore: boolean
+  isLoadingMore: boolean
+  onLoadMore: () => void
 }
 
 const Column: React.FC<ColumnProps> = ({
@@ -35,7 +38,10 @@ const Column: React.FC<ColumnProps> = ({
   onDragOver,
   onDragLeave,
   onDrop,
-  isDragOver
+  isDragOver,
+  hasMore,
+  isLoadingMore,
+  onLoadMore
 }) => {
   const getNextStatus = (currentType: ColumnType): ColumnType | null => {
     switch (currentType) {
@@ -95,7 +101,7 @@ const Column: React.FC<ColumnProps> = ({
         <div className="flex items-center justify-between">
           <h3 className="font-semibold text-lg">{title}</h3>
           <span className="bg-white dark:bg-gray-700 bg-opacity-50 dark:bg-opacity-50 px-2 py-1 rounded-full text-sm font-medium">
-            {tasks.length}
+            {tasks.length}{hasMore ? '+' : ''}
           </span>
         </div>
       </div>
@@ -165,11 +171,32 @@ const Column: React.FC<ColumnProps> = ({
             </div>
           ))
         )}
+
+        {hasMore && (
+          <button
+            onClick={onLoadMore}
+            disabled={isLoadingMore}
+            className="w-full py-2 text-sm font-medium text-purple-600 hover:text-purple-800 dark:text-purple-400 dark:hover:text-purple-200 disabled:opacity-50 disabled:cursor-not-allowed"
+          >
+            {isLoadingMore ? 'Loading...' : 'Load more'}
+          </button>
+        )}
       </div>
     </div>
   )
 }
 
+// First page from the board plus any loaded pages, without duplicates
+// (a task edited meanwhile can show up in both)
+const columnTasks = (column: KanbanColumn | undefined, more: Task[]): Task[] => {
+  const seen = new Set<number>()
+  return [...(column?.tasks || []), ...more].filter(task => {
+    if (seen.has(task.id)) return false
+    seen.add(task.id)
+    return true
+  })
+}
+
 export const TaskBoard: React.FC = () => {
   const [showCreateModal, setShowCreateModal] = useState(false)
   const [editingTask, setEditingTask] = useState<Task | null>(null)
@@ -194,6 +221,18 @@ export const TaskBoard: React.FC = () => {
   const boardRef = useRef<HTMLDivElement>(null)
 
   const { data: kanbanData, isLoading, error } = useKanbanTasks()
+
+  // Extra pages loaded per column via "Load more"
+  const [extraPages, setExtraPages] = useState<Record<ColumnType, number>>({
+    'todo': 0,
+    'in-progress': 0,
+    'done': 0,
+  })
+  const loadMore = (type: ColumnType) =>
+    setExtraPages(pages => ({ ...pages, [type]: pages[type] + 1 }))
+  const todoMore = useKanbanColumnPages(kanbanData?.todo, extraPages['todo'])
+  const inProgressMore = useKanbanColumnPages(kanbanData?.in_progress, extraPages['in-progress'])
+  const doneMore = useKanbanColumnPages(kanbanData?.done, extraPages['done'])
   const updateTask = useUpdateTask()
   const deleteTask = useDeleteTask()
   const archiveCompletedTasks = useArchiveCompletedTasks()
@@ -369,13 +408,9 @@ export const TaskBoard: React.FC = () => {
   }
 
   // Extract tasks from the kanban data structure
-  const todoData = kanbanData?.todo
-  const inProgressData = kanbanData?.in_progress
-  const doneData = kanbanData?.done
-
-  const todo = todoData?.tasks || []
-  const inProgress = inProgressData?.tasks || []
-  const done = doneData?.tasks || []
+  const todo = columnTasks(kanbanData?.todo, todoMore.tasks)
+  const inProgress = columnTasks(kanbanData?.in_progress, inProgressMore.tasks)
+  const done = columnTasks(kanbanData?.done, doneMore.tasks)
 
   return (
     <div className="max-w-7xl mx-auto px-4 sm:px-6 lg:px-8">
@@ -437,6 +472,9 @@ export const TaskBoard: React.FC = () => {
           onDragLeave={handleDragLeave}
           onDrop={handleDrop}
           isDragOver={dragOverColumn === 'todo'}
+          hasMore={todoMore.hasMore}
+          isLoadingMore={todoMore.isLoading}
+          onLoadMore={() => loadMore('todo')}
         />
         <Column
           title="In Progress"
@@ -452,6 +490,9 @@ export const TaskBoard: React.FC = () => {
           onDragLeave={handleDragLeave}
           onDrop={handleDrop}
           isDragOver={dragOverColumn === 'in-progress'}
+          hasMore={inProgressMore.hasMore}
+          isLoadingMore={inProgressMore.isLoading}
+          onLoadMore={() => loadMore('in-progress')}
         />
         <Column
           title="Done"
@@ -467,6 +508,9 @@ export const TaskBoard: React.FC = () => {
           onDragLeave={handleDragLeave}
           onDrop={handleDrop}
           isDragOver={dragOverColumn === 'done'}
+          hasMore={doneMore.hasMore}
+          isLoadingMore={doneMore.isLoading}
+          onLoadMore={() => loadMore('done')}
         />
       </div>
 
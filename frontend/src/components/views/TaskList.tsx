@@ -1,18 +1,18 @@
 import React, { useState, useRef } from 'react'
 import { Plus, Search, SortAsc, SortDesc, GripVertical, Archive } from 'lucide-react'
-import { useTasks, useUpdateTask, useDeleteTask, useArchiveCompletedTasks } from '../../lib/hooks'
+import { useTasks, useUpdateTask, useDeleteTask, useArchiveCompletedTasks, useReorderTask } from '../../lib/hooks'
 import { TaskItem, TaskModal, DeleteConfirmation, CompletionNotesModal } from '../tasks'
 import type { Task } from '../../lib/api'
 
-type SortField = 'created_at' | 'due_date' | 'priority' | 'title'
+type SortField = 'position' | 'created_at' | 'due_date' | 'priority' | 'title'
 type SortOrder = 'asc' | 'desc'
 
 export const TaskList: React.FC = () => {
   const [searchQuery, setSearchQuery] = useState('')
   const [statusFilter, setStatusFilter] = useState<'all' | 'pending' | 'completed'>('all')
   const [categoryFilter, setCategoryFilter] = useState<string>('all')
-  const [sortField, setSortField] = useState<SortField>('created_at')
-  const [sortOrder, setSortOrder] = useState<SortOrder>('desc')
+  const [sortField, setSortField] = useState<SortField>('position')
+  const [sortOrder, setSortOrder] = useState<SortOrder>('asc')
   const [showCreateModal, setShowCreateModal] = useState(false)
   const [editingTask, setEditingTask] = useState<Task | null>(null)
   const [deletingTask, setDeletingTask] = useState<Task | null>(null)
@@ -28,6 +28,7 @@ export const TaskList: React.FC = () => {
 
   const { data: tasks = [], isLoading, error } = useTasks()
   const updateTask = useUpdateTask()
+  const reorderTask = useReorderTask()
   const deleteTask = useDeleteTask()
   const archiveCompletedTasks = useArchiveCompletedTasks()
 
@@ -76,6 +77,9 @@ export const TaskList: React.FC = () => {
     return filtered
   }, [tasks, searchQuery, statusFilter, categoryFilter, sortField, sortOrder])
 
+  // Drag to reorder only in the manual (position) order, the order it edits
+  const canReorder = sortField === 'position'
+
   // Get unique categories for filter dropdown
   const categories = React.useMemo(() => {
     const uniqueCategories = new Set(tasks.map(task => task.category).filter(Boolean))
@@ -186,31 +190,29 @@ export const TaskList: React.FC = () => {
     e.preventDefault()
     setDragOverIndex(-1)
 
-    if (!draggedTask) return
+    if (!draggedTask || !canReorder) return
 
     const draggedIndex = filteredAndSortedTasks.findIndex(task => task.id === draggedTask.id)
     if (draggedIndex === -1 || draggedIndex === dropIndex) return
 
-    // Calculate new order values
+    // Only the moved task changes: the server places it between its new neighbours
     const tasks = [...filteredAndSortedTasks]
     const [removed] = tasks.splice(draggedIndex, 1)
     tasks.splice(dropIndex, 0, removed)
-
-    // Update order for affected tasks
-    const updates = tasks.map((task, index) => ({
-      id: task.id,
-      order: index
-    }))
+    const above = tasks[dropIndex - 1]?.id ?? null
+    const below = tasks[dropIndex + 1]?.id ?? null
 
     try {
-      // Update all affected tasks' order
-      await Promise.all(
-        updates.map(update =>
-          updateTask.mutateAsync({ id: update.id, data: { order: update.order } })
-        )
-      )
+      await reorderTask.mutateAsync({
+        id: removed.id,
+        // prev/next are in ascending position order
+        data: sortOrder === 'asc'
+          ? { prev_id: above, next_id: below }
+          : { prev_id: below, next_id: above },
+      })
     } catch (error) {
       console.error('Failed to reorder tasks:', error)
+      alert('Failed to move task. Please try again.')
     }
   }
 
@@ -219,7 +221,7 @@ export const TaskList: React.FC = () => {
       setSortOrder(sortOrder === 'asc' ? 'desc' : 'asc')
     } else {
       setSortField(field)
-      setSortOrder('desc')
+      setSortOrder(field === 'position' ? 'asc' : 'desc')
     }
   }
 
@@ -341,6 +343,15 @@ export const TaskList: React.FC = () => {
         <div className="flex items-center justify-between">
           <div className="flex items-center space-x-4 text-sm text-gray-600 dark:text-gray-400">
             <span className="font-medium">Sort by:</span>
+            <button
+              onClick={() => handleSort('position')}
+              className={`flex items-center space-x-1 hover:text-gray-900 dark:hover:text-gray-100 transition-colors ${
+                sortField === 'position' ? 'text-purple-600 dark:text-purple-400 font-medium' : ''
+              }`}
+            >
+              <span>Manual</span>
+              {getSortIcon('position')}
+            </button>
             <button
               onClick={() => handleSort('created_at')}
               className={`flex items-center space-x-1 hover:text-gray-900 dark:hover:text-gray-100 transition-colors ${
@@ -407,18 +418,20 @@ export const TaskList: React.FC = () => {
               key={task.id}
               data-tutorial={index === 0 ? "task-item" : undefined}
               className={`relative group ${dragOverIndex === index ? 'border-t-2 border-purple-500' : ''}`}
-              draggable
-              onDragStart={(e) => handleDragStart(e, task, index)}
-              onDragEnd={handleDragEnd}
-              onDragOver={(e) => handleDragOver(e, index)}
-              onDragLeave={handleDragLeave}
-              onDrop={(e) => handleDrop(e, index)}
+              draggable={canReorder}
+              onDragStart={canReorder ? (e) => handleDragStart(e, task, index) : undefined}
+              onDragEnd={canReorder ? handleDragEnd : undefined}
+              onDragOver={canReorder ? (e) => handleDragOver(e, index) : undefined}
+              onDragLeave={canReorder ? handleDragLeave : undefined}
+              onDrop={canReorder ? (e) => handleDrop(e, index) : undefined}
               role="listitem"
             >
-              {/* Drag handle */}
-              <div className="absolute left-2 top-4 opacity-0 group-hover:opacity-100 transition-opacity cursor-grab active:cursor-grabbing">
-                <GripVertical className="w-4 h-4 text-gray-400" />
-              </div>
+              {/* Drag handle, only while sorted by manual order */}
+              {canReorder && (
+                <div className="absolute left-2 top-4 opacity-0 group-hover:opacity-100 transition-opacity cursor-grab active:cursor-grabbing">
+                  <GripVertical className="w-4 h-4 text-gray-400" />
+                </div>
+              )}
 
               {/* Task item with left padding for drag handle */}
               <div className="pl-8">
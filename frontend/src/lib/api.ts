@@ -209,6 +209,7 @@ export interface Task {
   due_date?: string
   estimate_minutes?: number
   order: number
+  position: number
   status: {
     id: number
     name: string
@@ -220,6 +221,16 @@ export interface Task {
   created_by: number
 }
 
+// One kanban column; has_more / next_cursor page through the rest with
+// getKanbanColumn
+export interface KanbanColumn {
+  status_id: number
+  name: string
+  tasks: Task[]
+  has_more: boolean
+  next_cursor: string | null
+}
+
 export const tasksApi = {
   getAll: (params?: { status?: string; category?: string; page?: number }) => {
     const searchParams = new URLSearchParams()
@@ -241,11 +252,16 @@ export const tasksApi = {
 
   getKanban: () =>
     apiRequest<{
-      todo?: { status_id: number; name: string; tasks: Task[] };
-      in_progress?: { status_id: number; name: string; tasks: Task[] };
-      done?: { status_id: number; name: string; tasks: Task[] };
+      todo?: KanbanColumn;
+      in_progress?: KanbanColumn;
+      done?: KanbanColumn;
     }>('/api/tasks/kanban'),
 
+  getKanbanColumn: (statusId: number, cursor: string) =>
+    apiRequest<KanbanColumn>(
+      `/api/tasks/kanban/${statusId}?cursor=${encodeURIComponent(cursor)}`
+    ),
+
   getCalendar: () =>
     apiRequest<{ [date: string]: Task[] }>('/api/tasks/calendar'),
 
@@ -288,6 +304,12 @@ export const tasksApi = {
       method: 'DELETE',
     }),
 
+  reorder: (id: number, data: { prev_id: number | null; next_id: number | null; status_id?: number }) =>
+    apiRequest<{ task_id: number; position: number; status_id?: number }>(`/api/tasks/${id}/reorder`, {
+      method: 'POST',
+      body: JSON.stringify(data),
+    }),
+
   getCategories: () =>
     apiRequest<string[]>('/api/tasks/categories'),
 
@@ -328,11 +350,17 @@ export const reviewApi = {
   getDailySummary: () =>
     apiRequest<any>('/api/review/summary/daily'),
 
-  getWeeklySummary: () =>
-    apiRequest<any>('/api/review/summary/weekly'),
+  // weekStart (YYYY-MM-DD) selects the 7 days from that date; default is this week
+  getWeeklySummary: (weekStart?: string) =>
+    apiRequest<any>(
+      weekStart
+        ? `/api/review/summary/weekly?week_start=${weekStart}`
+        : '/api/review/summary/weekly'
+    ),
 
-  getInsights: () =>
-    apiRequest<any>('/api/review/insights'),
+  // weeks sets the performance trend horizon (default 4)
+  getInsights: (weeks?: number) =>
+    apiRequest<any>(weeks ? `/api/review/insights?weeks=${weeks}` : '/api/review/insights'),
 }
 
 // Settings API
@@ -514,3 +542,26 @@ export const categoriesApi = {
 }
 
 
+
+// Delta sync API
+export interface SyncChanges {
+  tasks: Task[]
+  journal_entries: JournalEntry[]
+  categories: Category[]
+  deleted: {
+    tasks: number[]
+    journal_entries: number[]
+    categories: number[]
+  }
+  token: number
+  has_more: boolean
+}
+
+export const syncApi = {
+  // Omit since for a full snapshot; follow has_more with the returned token
+  changes: (since?: number) =>
+    apiRequest<SyncChanges>(since ? `/api/sync?since=${since}` : '/api/sync'),
+}
+
+// Server-sent change events for the logged-in user (see useChangeStream)
+export const changeStreamUrl = `${API_BASE_URL}/api/events`
@@ -1,11 +1,14 @@
-import { useMutation, useQuery, useQueryClient } from '@tanstack/react-query'
-import { authApi, tasksApi, reviewApi, settingsApi, healthApi, dataApi, accountApi, categoriesApi, type Task } from './api'
+import { useEffect } from 'react'
+import { useInfiniteQuery, useMutation, useQuery, useQueryClient } from '@tanstack/react-query'
+import { authApi, tasksApi, reviewApi, settingsApi, healthApi, dataApi, accountApi, categoriesApi, changeStreamUrl, type KanbanColumn, type Task } from './api'
 
 // Query keys for consistent caching
 export const queryKeys = {
   tasks: ['tasks'] as const,
   task: (id: number) => ['tasks', id] as const,
   kanban: ['tasks', 'kanban'] as const,
+  kanbanColumn: (statusId: number, cursor: string | null) =>
+    ['tasks', 'kanban', statusId, cursor] as const,
   calendar: ['tasks', 'calendar'] as const,
   categories: ['tasks', 'categories'] as const,
   category: (id: number) => ['categories', id] as const,
@@ -102,6 +105,36 @@ export const useKanbanTasks = () => {
   })
 }
 
+// Tasks past the first page of a board column. `pages` extra pages are
+// loaded after the column's next_cursor; when the board reloads with a new
+// cursor they are fetched again from there, so loaded depth is kept.
+export const useKanbanColumnPages = (column: KanbanColumn | undefined, pages: number) => {
+  const cursor = column?.next_cursor ?? null
+  const { data, hasNextPage, isFetching, fetchNextPage } = useInfiniteQuery({
+    queryKey: queryKeys.kanbanColumn(column?.status_id ?? 0, cursor),
+    queryFn: ({ pageParam }) => tasksApi.getKanbanColumn(column!.status_id, pageParam),
+    initialPageParam: cursor ?? '',
+    getNextPageParam: (last: KanbanColumn) =>
+      last.has_more && last.next_cursor ? last.next_cursor : undefined,
+    enabled: pages > 0 && !!cursor,
+  })
+
+  const loaded = data?.pages.length ?? 0
+  useEffect(() => {
+    if (loaded > 0 && loaded < pages && hasNextPage && !isFetching) {
+      fetchNextPage()
+    }
+  }, [loaded, pages, hasNextPage, isFetching, fetchNextPage])
+
+  const shown = data?.pages.slice(0, pages) ?? []
+  const lastPage = shown[shown.length - 1]
+  return {
+    tasks: shown.flatMap(page => page.tasks),
+    hasMore: pages === 0 || !lastPage ? !!cursor : lastPage.has_more,
+    isLoading: isFetching,
+  }
+}
+
 export const useCalendarTasks = () => {
   return useQuery({
     queryKey: queryKeys.calendar,
@@ -255,7 +288,10 @@ export const useUpdateTask = () => {
 
           // Remove from current column
           Object.keys(newData).forEach(key => {
-            newData[key] = newData[key].filter((task: Task) => task.id !== id)
+            newData[key] = {
+              ...newData[key],
+              tasks: newData[key].tasks.filter((task: Task) => task.id !== id),
+            }
           })
 
           // Add to appropriate column based on status_id or done flag
@@ -272,7 +308,10 @@ export const useUpdateTask = () => {
           }
 
           if (newData[status]) {
-            newData[status] = [...newData[status], updatedTask]
+            newData[status] = {
+              ...newData[status],
+              tasks: [updatedTask, ...newData[status].tasks],
+            }
           }
 
           return newData
@@ -358,6 +397,19 @@ export const useDeleteTask = () => {
   })
 }
 
+export const useReorderTask = () => {
+  const queryClient = useQueryClient()
+
+  return useMutation({
+    mutationFn: ({ id, data }: { id: number; data: Parameters<typeof tasksApi.reorder>[1] }) =>
+      tasksApi.reorder(id, data),
+    onSuccess: () => {
+      queryClient.invalidateQueries({ queryKey: queryKeys.tasks })
+      queryClient.invalidateQueries({ queryKey: queryKeys.kanban })
+    },
+  })
+}
+
 export const useArchiveCompletedTasks = () => {
   const queryClient = useQueryClient()
 
@@ -422,17 +474,17 @@ export const useDailySummary = () => {
   })
 }
 
-export const useWeeklySummary = () => {
+export const useWeeklySummary = (weekStart?: string) => {
   return useQuery({
-    queryKey: queryKeys.weeklySummary,
-    queryFn: reviewApi.getWeeklySummary,
+    queryKey: [...queryKeys.weeklySummary, weekStart],
+    queryFn: () => reviewApi.getWeeklySummary(weekStart),
   })
 }
 
-export const useInsights = () => {
+export const useInsights = (weeks?: number) => {
   return useQuery({
-    queryKey: queryKeys.insights,
-    queryFn: reviewApi.getInsights,
+    queryKey: [...queryKeys.insights, weeks],
+    queryFn: () => reviewApi.getInsights(weeks),
   })
 }
 
@@ -539,3 +591,43 @@ export const useDeleteAccount = () => {
     },
   })
 }
+
+// Live updates: queries each change kind from /api/events invalidates
+const changeQueryKeys: Record<string, readonly (readonly unknown[])[]> = {
+  task: [queryKeys.tasks, ['review'], ['categories']],
+  journal: [['review']],
+  category: [queryKeys.tasks, ['categories']],
+  settings: [queryKeys.settings],
+}
+
+export const useChangeStream = (enabled = true) => {
+  const queryClient = useQueryClient()
+
+  useEffect(() => {
+    if (!enabled || typeof EventSource === 'undefined') return
+
+    const invalidate = (kinds: string[]) => {
+      for (const kind of kinds) {
+        for (const queryKey of changeQueryKeys[kind] ?? []) {
+          queryClient.invalidateQueries({ queryKey })
+        }
+      }
+    }
+    const onChange = (event: MessageEvent) => {
+      invalidate((JSON.parse(event.data) as { changed: string[] }).changed)
+    }
+
+    let connected = false
+    const onReady = () => {
+      // After a reconnect, events sent while disconnected are lost
+      if (connected) invalidate(Object.keys(changeQueryKeys))
+      connected = true
+    }
+
+    const source = new EventSource(changeStreamUrl, { withCredentials: true })
+    source.addEventListener('ready', onReady)
+    source.addEventListener('change', onChange)
+    source.addEventListener('resync', onChange)
+    return () => source.close()
+  }, [enabled, queryClient])
+}
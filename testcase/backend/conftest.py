@@ -86,11 +86,17 @@ def app(test_db_path, monkeypatch):
         'backend.app',
         'backend.blueprints.auth.routes',
         'backend.blueprints.tasks.routes',
+        'backend.blueprints.categories',
+        'backend.blueprints.categories.routes',
         'backend.blueprints.review.routes',
         'backend.blueprints.settings.routes',
         'backend.blueprints.chat.routes',
         'backend.blueprints.sessions.routes',
         'backend.blueprints.account_deletion.routes',
+        'backend.blueprints.sync',
+        'backend.blueprints.sync.routes',
+        'backend.blueprints.events',
+        'backend.blueprints.events.routes',
     ]
     for module in modules_to_reload:
         if module in sys.modules:
@@ -98,6 +104,20 @@ def app(test_db_path, monkeypatch):
     
     # Now import the engine module - it will create engine with test DB
     from backend.db import engine_async
+
+    # Process-wide caches outlive the per-test database; start each test empty
+    from backend.cache_utils import cache
+    from backend.security.session_cache import session_cache
+    from backend.services.title_index import title_indexes
+    from backend.db.statuses import reset_status_registry
+    from backend.db.categories import category_ids
+    from backend.services.change_hub import change_hub
+    cache.clear()
+    session_cache.clear()
+    title_indexes.invalidate()
+    reset_status_registry()
+    category_ids.invalidate()
+    change_hub.clear()
     
     # Run migrations on test database
     _alembic_upgrade_head(test_db_path)
@@ -0,0 +1,94 @@
+from contextlib import contextmanager
+
+import pytest
+from sqlalchemy import event, func, select
+
+
+@contextmanager
+def _statements(engine):
+    """Collect every statement the engine runs (QueryRecorder skips INSERTs)."""
+    seen = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        seen.append(statement)
+
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        yield seen
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+
+
+@pytest.mark.asyncio
+async def test_resolve_caches_after_commit(app):
+    from backend.db.categories import category_ids, resolve_category_id
+    from backend.db.engine_async import AsyncSessionLocal, async_engine
+    from backend.db.models import Category
+
+    async with AsyncSessionLocal() as s:
+        with _statements(async_engine.sync_engine) as statements:
+            created = await resolve_category_id(s, 0, "  Errands ")
+        assert len(statements) == 1
+        # Not cached until the transaction commits
+        assert category_ids.get(0, "Errands") is None
+        await s.commit()
+    assert category_ids.get(0, "Errands") == created
+
+    async with AsyncSessionLocal() as s:
+        with _statements(async_engine.sync_engine) as statements:
+            assert await resolve_category_id(s, 0, "Errands") == created
+        assert statements == []
+        assert await resolve_category_id(s, 0, "   ") is None
+
+    # A cold cache still finds the existing row in one statement
+    category_ids.invalidate()
+    async with AsyncSessionLocal() as s:
+        with _statements(async_engine.sync_engine) as statements:
+            assert await resolve_category_id(s, 0, "Errands") == created
+        assert len(statements) == 1
+        await s.commit()
+        count = await s.scalar(
+            select(func.count()).select_from(Category).where(Category.name == "Errands")
+        )
+    assert count == 1
+
+
+@pytest.mark.asyncio
+async def test_rolled_back_category_is_not_cached(app):
+    from backend.db.categories import category_ids, resolve_category_id
+    from backend.db.engine_async import AsyncSessionLocal
+
+    async with AsyncSessionLocal() as s:
+        await resolve_category_id(s, 0, "Ghost")
+        await s.rollback()
+    assert category_ids.get(0, "Ghost") is None
+
+
+@pytest.mark.asyncio
+async def test_category_names_are_unique_per_user(logged_in_client):
+    payload = {"name": "Home", "color_hex": "00ff00"}
+    resp = await logged_in_client.post("/api/categories", json=payload)
+    assert resp.status_code == 201
+    home_id = (await resp.get_json())["id"]
+
+    resp = await logged_in_client.post("/api/categories", json=payload)
+    assert resp.status_code == 409
+
+    resp = await logged_in_client.post(
+        "/api/tasks", json={"title": "Sweep", "category": "Home"}
+    )
+    task_id = (await resp.get_json())["data"]["task_id"]
+    resp = await logged_in_client.get("/api/categories")
+    assert [c["name"] for c in await resp.get_json()] == ["Home"]
+
+    # Renaming drops the cached id, so the old name gets a new category
+    resp = await logged_in_client.put(
+        f"/api/categories/{home_id}", json={"name": "House"}
+    )
+    assert resp.status_code == 200
+    resp = await logged_in_client.put(f"/api/tasks/{task_id}", json={"category": "Home"})
+    assert resp.status_code == 200
+    resp = await logged_in_client.get("/api/categories")
+    categories = {c["name"]: c["id"] for c in await resp.get_json()}
+    assert categories["House"] == home_id
+    assert categories["Home"] != home_id
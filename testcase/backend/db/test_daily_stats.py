@@ -0,0 +1,135 @@
+from datetime import date
+
+import pytest
+from sqlalchemy import text
+
+
+async def _days(start="2030-01-01", end="2030-02-01", user_id=1):
+    from backend.db.daily_stats import find_daily_stats_drift, get_daily_stats
+    from backend.db.engine_async import AsyncSessionLocal
+
+    async with AsyncSessionLocal() as s:
+        assert await find_daily_stats_drift(s) == []
+        rows = await get_daily_stats(
+            s, user_id, date.fromisoformat(start), date.fromisoformat(end)
+        )
+    return {
+        (row.day.isoformat(), row.category_name): (
+            row.created,
+            row.created_done,
+            row.completed,
+            row.completed_late,
+        )
+        for row in rows
+        if any((row.created, row.created_done, row.completed, row.completed_late))
+    }
+
+
+async def _set(task_id, **columns):
+    from backend.db.engine_async import AsyncSessionLocal
+
+    assignments = ", ".join(f"{name} = :{name}" for name in columns)
+    async with AsyncSessionLocal() as s:
+        await s.execute(
+            text(f"UPDATE task SET {assignments} WHERE id = :id"),
+            {**columns, "id": task_id},
+        )
+        await s.commit()
+
+
+async def _task_id(resp):
+    assert resp.status_code == 201, await resp.get_json()
+    return (await resp.get_json())["data"]["task_id"]
+
+
+@pytest.mark.asyncio
+async def test_triggers_track_created_and_completed_days(logged_in_client):
+    post = logged_in_client.post
+    a = await _task_id(await post("/api/tasks", json={"title": "A", "category": "Work"}))
+    b = await _task_id(await post("/api/tasks", json={"title": "B"}))
+    await _set(a, created_on="2030-01-07 09:00:00.000000")
+    await _set(b, created_on="2030-01-07 10:00:00.000000")
+    assert await _days() == {
+        ("2030-01-07", "Work"): (1, 0, 0, 0),
+        ("2030-01-07", None): (1, 0, 0, 0),
+    }
+
+    # Completed after its due date, on a later day
+    await _set(
+        a,
+        done=True,
+        due_date="2030-01-08 00:00:00.000000",
+        closed_on="2030-01-09 12:00:00.000000",
+    )
+    assert await _days() == {
+        ("2030-01-07", "Work"): (1, 1, 0, 0),
+        ("2030-01-07", None): (1, 0, 0, 0),
+        ("2030-01-09", "Work"): (0, 0, 1, 1),
+    }
+
+    # Archiving drops a task from the rollup, deleting removes it for good
+    await _set(a, archived=True)
+    await logged_in_client.delete(f"/api/tasks/{b}")
+    assert await _days() == {}
+
+    await _set(a, archived=False, category_id=None)
+    assert await _days() == {
+        ("2030-01-07", None): (1, 1, 0, 0),
+        ("2030-01-09", None): (0, 0, 1, 1),
+    }
+    assert await _days(start="2030-01-08", end="2030-01-09") == {}
+
+
+@pytest.mark.asyncio
+async def test_review_summaries_read_the_rollup(logged_in_client):
+    from backend.db.engine_async import async_engine
+    from backend.db.query_plan import QueryRecorder
+
+    task_id = await _task_id(
+        await logged_in_client.post("/api/tasks", json={"title": "Today", "category": "Work"})
+    )
+    await logged_in_client.put(f"/api/tasks/{task_id}", json={"done": True})
+
+    with QueryRecorder(async_engine.sync_engine) as recorder:
+        resp = await logged_in_client.get("/api/review/summary/daily")
+    data = (await resp.get_json())["data"]
+    assert (data["created_tasks"], data["completed_tasks"]) == (1, 1)
+    assert data["categories"] == {"Work": 1}
+    # No statement reads the task table except the overdue count
+    task_reads = [
+        q.statement
+        for q in recorder.queries
+        if " task " in q.statement or "FROM task" in q.statement
+    ]
+    assert len(task_reads) == 1, task_reads
+
+    resp = await logged_in_client.get("/api/review/insights")
+    assert (await resp.get_json())["performance_trends"][-1]["completed"] == 1
+
+
+@pytest.mark.asyncio
+async def test_reconcile_reports_and_fixes_drift(logged_in_client):
+    from backend.db.daily_stats import reconcile_daily_stats
+    from backend.db.engine_async import AsyncSessionLocal
+
+    task_id = await _task_id(await logged_in_client.post("/api/tasks", json={"title": "Counted"}))
+    await _set(task_id, created_on="2030-01-07 09:00:00.000000")
+    async with AsyncSessionLocal() as s:
+        await s.execute(
+            text("UPDATE user_daily_stats SET created_count = 5 WHERE day = '2030-01-07'")
+        )
+        await s.execute(
+            text("INSERT INTO user_daily_stats VALUES (1, '2030-01-08', 0, 0, 0, 2, 0)")
+        )
+        await s.commit()
+
+    drift = await reconcile_daily_stats()
+    assert {(d.day, d.category_id) for d in drift} == {
+        ("2030-01-07", 0),
+        ("2030-01-08", 0),
+    }
+    assert drift[0].actual == (1, 0, 0, 0)
+
+    assert await reconcile_daily_stats(fix=True)
+    assert await reconcile_daily_stats() == []
+    assert await _days() == {("2030-01-07", None): (1, 0, 0, 0)}
@@ -0,0 +1,132 @@
+import pytest
+from sqlalchemy import select
+from sqlalchemy.orm import selectinload
+
+from backend.db.models import Tag, Task, task_tag
+
+
+async def _seed_tasks(client):
+    ids = []
+    for title, category in (("Alpha", "Work"), ("Beta", None), ("Gamma", "Home")):
+        payload = {"title": title, "due_date": "2030-01-02"}
+        if category:
+            payload["category"] = category
+        resp = await client.post("/api/tasks", json=payload)
+        ids.append((await resp.get_json())["data"]["task_id"])
+    return ids
+
+
+@pytest.mark.asyncio
+async def test_projection_matches_task_to_dict(logged_in_client, seed_ai_config):
+    from backend.db.engine_async import AsyncSessionLocal
+    from backend.db.projections import fetch_task_dicts, task_projection
+
+    user_id = seed_ai_config["user_id"]
+    alpha, beta, _ = await _seed_tasks(logged_in_client)
+
+    async with AsyncSessionLocal() as s:
+        urgent = Tag(name="urgent", color_hex="ff0000", created_by=user_id)
+        later = Tag(name="later", color_hex="00ff00", created_by=user_id)
+        s.add_all([urgent, later])
+        await s.flush()
+        await s.execute(
+            task_tag.insert(),
+            [
+                {"task_id": alpha, "tag_id": urgent.id},
+                {"task_id": alpha, "tag_id": later.id},
+                {"task_id": beta, "tag_id": later.id},
+            ],
+        )
+        await s.commit()
+
+    async with AsyncSessionLocal() as s:
+        projected = await fetch_task_dicts(
+            s, task_projection().where(Task.created_by == user_id).order_by(Task.id)
+        )
+        orm_tasks = (
+            await s.execute(
+                select(Task)
+                .options(
+                    selectinload(Task.status),
+                    selectinload(Task.tags),
+                    selectinload(Task.category),
+                )
+                .where(Task.created_by == user_id)
+                .order_by(Task.id)
+            )
+        ).scalars().all()
+        expected = [task.to_dict() for task in orm_tasks]
+
+    for row in projected + expected:
+        row["tags"] = sorted(row["tags"])
+    assert projected == expected
+    assert projected[0]["tags"] == ["later", "urgent"]
+    assert projected[1]["category"] is None
+
+
+@pytest.mark.asyncio
+async def test_list_endpoints_serialize_projected_rows(logged_in_client):
+    await _seed_tasks(logged_in_client)
+
+    resp = await logged_in_client.get("/api/tasks/?cursor=&per_page=2")
+    data = (await resp.get_json())["data"]
+    assert [t["title"] for t in data["tasks"]] == ["Gamma", "Beta"]
+    assert data["tasks"][0]["category"] == "Home"
+    assert data["tasks"][0]["status"]["name"]
+
+    resp = await logged_in_client.get(
+        f"/api/tasks/?cursor={data['pagination']['next_cursor']}&per_page=2"
+    )
+    assert [t["title"] for t in (await resp.get_json())["data"]["tasks"]] == ["Alpha"]
+
+    calendar = await (await logged_in_client.get("/api/tasks/calendar")).get_json()
+    assert [t["title"] for t in calendar["2030-01-02"]] == ["Gamma", "Beta", "Alpha"]
+
+    export = await (await logged_in_client.get("/api/export")).get_json()
+    assert [t["category"] for t in export["tasks"]] == ["Work", None, "Home"]
+
+
+
+async def _data(client, url):
+    resp = await client.get(url)
+    assert resp.status_code == 200, await resp.get_json()
+    body = await resp.get_json()
+    return body.get("data", body)
+
+
+@pytest.mark.asyncio
+async def test_fields_select_only_requested_columns(logged_in_client):
+    from backend.db.engine_async import async_engine
+    from backend.db.query_plan import QueryRecorder
+
+    await _seed_tasks(logged_in_client)
+
+    with QueryRecorder(async_engine.sync_engine) as recorder:
+        data = await _data(logged_in_client, "/api/tasks/?cursor=&per_page=2&fields=title")
+    assert [set(t) for t in data["tasks"]] == [{"id", "title"}] * 2
+    task_selects = [q.statement for q in recorder.queries if "task.title" in q.statement]
+    assert len(task_selects) == 1
+    assert "description" not in task_selects[0] and "JOIN" not in task_selects[0]
+    assert not any("task_tag" in q.statement for q in recorder.queries)
+
+    cursor = data["pagination"]["next_cursor"]
+    data = await _data(logged_in_client, f"/api/tasks/?cursor={cursor}&fields=title")
+    assert data["tasks"] == [{"id": data["tasks"][0]["id"], "title": "Alpha"}]
+
+    board = await _data(logged_in_client, "/api/tasks/kanban?fields=status,tags")
+    column = next(c for c in board.values() if c["tasks"])
+    assert set(column["tasks"][0]) == {"id", "status", "tags"}
+
+    calendar = await _data(logged_in_client, "/api/tasks/calendar?fields=title")
+    assert [t["title"] for t in calendar["2030-01-02"]] == ["Gamma", "Beta", "Alpha"]
+    assert set(calendar["2030-01-02"][0]) == {"id", "title"}
+
+    done_id = column["tasks"][0]["id"]
+    await logged_in_client.put(f"/api/tasks/{done_id}", json={"done": True})
+    await logged_in_client.post("/api/tasks/archive-completed")
+    archived = await _data(logged_in_client, "/api/tasks/archived?fields=done")
+    assert archived == [{"id": done_id, "done": True}]
+
+    resp = await logged_in_client.get("/api/tasks/kanban?fields=title,secret")
+    assert resp.status_code == 400
+    assert "secret" in (await resp.get_json())["error"]["message"]
@@ -0,0 +1,167 @@
+"""
+Query plan check for the blueprint endpoints.
+
+Drives every blueprint through the test client while recording the SQL the
+app runs, then EXPLAINs each statement against the migrated test database.
+Any plan that reads a table without an index (a plain "SCAN <table>") fails
+the test, so a new query shape needs a matching index.
+"""
+
+import re
+
+import pytest
+
+from testcase.backend.chat import fake_llm_service
+from testcase.backend.conftest import create_user_and_login
+from backend.db.query_plan import find_full_scans, full_table_scans
+
+
+def test_full_table_scans_parses_plan_details():
+    plan = [
+        "SEARCH task USING INDEX ix_task_created_by (created_by=?)",
+        "SCAN task USING INDEX ix_task_created_on",
+        "SCAN message",
+        "SCAN category LEFT-JOIN",
+        "SCAN status",
+        "USE TEMP B-TREE FOR ORDER BY",
+    ]
+    assert full_table_scans(plan) == ["message", "category"]
+
+
+def test_find_full_scans_resolves_table_aliases(tmp_path):
+    import sqlite3
+
+    from backend.db.query_plan import CapturedQuery
+
+    db_path = tmp_path / "plans.db"
+    conn = sqlite3.connect(db_path)
+    conn.execute("CREATE TABLE task (id INTEGER PRIMARY KEY, created_by INTEGER)")
+    conn.close()
+
+    statement = "SELECT task_1.id FROM task AS task_1 WHERE task_1.created_by = ?"
+    problems = find_full_scans(str(db_path), [CapturedQuery(statement, (1,))])
+    assert problems == {statement: ["task"]}
+
+
+@pytest.mark.asyncio
+async def test_blueprint_queries_use_indexes(
+    app, client, test_db_path, seed_ai_config, patch_llm
+):
+    from backend.db.engine_async import async_engine
+    from backend.db.query_plan import QueryRecorder
+
+    patch_llm(fake_llm_service.FakeLLMServiceCreate)
+
+    async def call(method, url, **kwargs):
+        # A failing endpoint may return before its main query runs
+        resp = await getattr(client, method)(url, **kwargs)
+        assert 200 <= resp.status_code < 300, (method, url, resp.status_code)
+        return resp
+
+    with QueryRecorder(async_engine.sync_engine) as recorder:
+        # Tasks
+        r = await call(
+            "post",
+            "/api/tasks",
+            json={"title": "Plan", "due_date": "2030-01-01", "category": "Work"},
+        )
+        task_id = (await r.get_json())["data"]["task_id"]
+        await call("get", "/api/tasks/")
+        await call("get", "/api/tasks/?cursor=&include_total=1")
+        await call("get", "/api/tasks/?cursor=&fields=title,tags")
+        await call("get", f"/api/tasks/{task_id}")
+        await call("get", "/api/tasks/search?q=plan")
+        await call("get", f"/api/tasks/{task_id}/tree")
+        await call("get", "/api/tasks/?subtasks=2")
+        r = await call("post", "/api/tasks", json={"title": "Second"})
+        second_id = (await r.get_json())["data"]["task_id"]
+        await call("post", f"/api/tasks/{second_id}/reorder", json={"next_id": task_id})
+        await call("put", f"/api/tasks/{task_id}", json={"done": True, "category": "Work"})
+        await call("get", "/api/tasks/kanban")
+        await call("get", "/api/tasks/kanban/1")
+        await call("get", "/api/tasks/kanban?fields=title,status")
+        await call("get", "/api/tasks/calendar")
+        await call("get", "/api/tasks/calendar?from=2030-01-01&to=2030-01-31")
+        await call("get", "/api/tasks/calendar?counts=1")
+        await call("get", "/api/tasks/categories")
+        await call("post", "/api/tasks/archive-completed")
+        await call(
+            "post",
+            "/api/tasks/bulk",
+            json={"operations": [{"op": "update", "id": task_id, "data": {"priority": True}}]},
+        )
+        await call("get", "/api/tasks/archived")
+
+        # Categories
+        await call("get", "/api/categories")
+        await call("get", "/api/categories/usage")
+
+        # Review
+        await call("post", "/api/review/journal", json={"content": "Note"})
+        await call("get", "/api/review/journal")
+        await call("get", "/api/review/summary/daily")
+        await call("get", "/api/review/summary/weekly")
+        await call("get", "/api/review/summary/weekly?week_start=2030-01-01")
+        await call("get", "/api/review/insights")
+        await call("get", "/api/review/insights?weeks=52")
+
+        # Settings, sessions, chat, account, export
+        await call("get", "/api/settings")
+        await call("put", "/api/settings", json={"theme": "dark"})
+        await call("get", "/api/sessions/current")
+        await call("post", "/api/sessions/cleanup-expired")
+        await call("post", "/api/chat/message", json={"message": "add a task"})
+        await call("get", "/api/chat/history")
+        await call("get", "/api/account/preview")
+        await call("get", "/api/export")
+        await call("get", "/api/sync")
+        await call("get", "/api/sync?since=1&limit=5")
+        await call("delete", f"/api/tasks/{task_id}")
+
+    assert recorder.queries, "no queries were recorded"
+    problems = find_full_scans(str(test_db_path), recorder.queries)
+    assert not problems, "Full table scans:\n" + "\n\n".join(
+        f"{tables}: {sql}" for sql, tables in problems.items()
+    )
+
+
+@pytest.mark.asyncio
+async def test_date_filters_are_index_ranges(logged_in_client, test_db_path):
+    """Date filters are searched through an index, not applied per row."""
+    import sqlite3
+
+    from backend.db.engine_async import async_engine
+    from backend.db.query_plan import QueryRecorder, explain
+
+    client = logged_in_client
+    await client.post("/api/tasks", json={"title": "Due", "due_date": "2030-01-02"})
+    await client.post("/api/review/journal", json={"content": "Note", "entry_date": "2030-01-02"})
+
+    # (endpoint, table, column whose range must appear in the index search)
+    checks = [
+        ("/api/review/journal?start_date=2030-01-01&end_date=2030-01-31", "journal_entries", "entry_date"),
+        ("/api/review/summary/daily?date=2030-01-02", "journal_entries", "entry_date"),
+        ("/api/review/summary/daily?date=2030-01-02", "task", "due_date"),
+        ("/api/review/summary/daily?date=2030-01-02", "user_daily_stats", "day"),
+        ("/api/review/summary/weekly?week_start=2030-01-01", "user_daily_stats", "day"),
+        ("/api/review/insights", "user_daily_stats", "day"),
+        ("/api/tasks/calendar?from=2030-01-01&to=2030-01-31", "task", "due_date"),
+        ("/api/tasks/calendar?from=2030-01-01&to=2030-01-31&counts=1", "task", "due_date"),
+    ]
+    conn = sqlite3.connect(str(test_db_path))
+    try:
+        for url, table, column in checks:
+            with QueryRecorder(async_engine.sync_engine) as recorder:
+                resp = await client.get(url)
+            assert resp.status_code == 200, url
+            searches = [
+                detail
+                for query in recorder.queries
+                for detail in explain(conn, query.statement, query.parameters)
+                if detail.startswith(f"SEARCH {table} ") and "USING" in detail
+            ]
+            assert any(
+                re.search(rf"\b{column}[<>=]", detail) for detail in searches
+            ), (url, searches)
+    finally:
+        conn.close()
@@ -0,0 +1,70 @@
+import dataclasses
+
+import pytest
+
+from backend.db.statuses import StatusInfo, StatusRegistry
+
+
+def _registry():
+    return StatusRegistry(
+        [
+            StatusInfo(3, "Done"),
+            StatusInfo(1, "Todo"),
+            StatusInfo(2, "In  Progress"),
+        ]
+    )
+
+
+def test_lookup_by_id_and_normalized_title():
+    registry = _registry()
+    assert [status.id for status in registry] == [1, 2, 3]
+    assert registry.get(2).title == "In  Progress"
+    assert registry.get(99) is None
+    assert 3 in registry and 4 not in registry
+    assert registry.by_title("in progress").id == 2
+    assert registry.by_title("missing", " DONE ").id == 3
+    assert (registry.todo_id, registry.in_progress_id, registry.done_id) == (1, 2, 3)
+
+
+def test_fallback_ids_and_default():
+    registry = StatusRegistry([StatusInfo(5, "Backlog"), StatusInfo(3, "Shipped")])
+    # No title matches, so the seed id is used only if it exists
+    assert registry.done_id == 3
+    assert registry.todo_id is None
+    assert registry.default_id == 3
+    assert StatusRegistry([]).default_id is None
+
+
+def test_registry_is_immutable():
+    registry = _registry()
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        registry.get(1).title = "Changed"
+    with pytest.raises(TypeError):
+        registry._by_id[4] = StatusInfo(4, "New")
+
+
+@pytest.mark.asyncio
+async def test_task_writes_do_not_query_statuses(logged_in_client):
+    from backend.db.engine_async import async_engine
+    from backend.db.query_plan import QueryRecorder
+    from backend.db.statuses import load_status_registry
+
+    await load_status_registry()
+
+    with QueryRecorder(async_engine.sync_engine) as recorder:
+        resp = await logged_in_client.post("/api/tasks", json={"title": "Write"})
+        assert resp.status_code == 201
+        task_id = (await resp.get_json())["data"]["task_id"]
+        resp = await logged_in_client.post(
+            "/api/tasks", json={"title": "Bad", "status_id": 999}
+        )
+        assert resp.status_code == 400
+
+    assert not [q for q in recorder.queries if "FROM status" in q.statement]
+
+    # Completing a task resolves "Done" from the registry
+    resp = await logged_in_client.put(f"/api/tasks/{task_id}", json={"done": True})
+    assert resp.status_code == 200
+    resp = await logged_in_client.get(f"/api/tasks/{task_id}")
+    task = (await resp.get_json())["data"]
+    assert task["status"]["name"] == "Done"
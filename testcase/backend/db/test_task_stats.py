@@ -0,0 +1,88 @@
+import pytest
+from sqlalchemy import text
+
+
+async def _stats(user_id=1):
+    from backend.db.engine_async import AsyncSessionLocal
+    from backend.db.task_stats import find_stats_drift, get_task_stats
+
+    async with AsyncSessionLocal() as s:
+        assert await find_stats_drift(s) == []
+        return await get_task_stats(s, user_id)
+
+
+async def _task_id(resp):
+    assert resp.status_code == 201, await resp.get_json()
+    return (await resp.get_json())["data"]["task_id"]
+
+
+@pytest.mark.asyncio
+async def test_triggers_track_every_write_path(logged_in_client):
+    post = logged_in_client.post
+    a = await _task_id(await post("/api/tasks", json={"title": "A"}))
+    b = await _task_id(await post("/api/tasks", json={"title": "B", "status_id": 2}))
+    child = await _task_id(await post("/api/tasks", json={"title": "C", "parent_id": a}))
+    stats = await _stats()
+    assert (stats.tasks, stats.active, stats.done, stats.open) == (3, 3, 0, 3)
+    assert (stats.open_in(1), stats.open_in(2)) == (2, 1)
+
+    # ORM update (done moves the task to the Done status)
+    await logged_in_client.put(f"/api/tasks/{b}", json={"done": True})
+    stats = await _stats()
+    assert (stats.done, stats.open_in(2)) == (1, 0)
+
+    # Set-based UPDATE
+    await post("/api/tasks/archive-completed")
+    stats = await _stats()
+    assert (stats.tasks, stats.archived, stats.active, stats.done) == (3, 1, 2, 0)
+
+    # Bulk create plus FK cascade from deleting a parent
+    resp = await post(
+        "/api/tasks/bulk",
+        json={
+            "operations": [
+                {"op": "create", "data": {"title": "D"}},
+                {"op": "delete", "id": a},
+            ]
+        },
+    )
+    assert resp.status_code == 200
+    assert (await logged_in_client.get(f"/api/tasks/{child}")).status_code == 404
+    stats = await _stats()
+    assert (stats.tasks, stats.active, stats.open_in(1)) == (2, 1, 1)
+
+
+@pytest.mark.asyncio
+async def test_review_and_preview_read_counters(logged_in_client):
+    await logged_in_client.post("/api/tasks", json={"title": "Open"})
+    await logged_in_client.post("/api/tasks", json={"title": "Going", "status_id": 2})
+
+    resp = await logged_in_client.get("/api/review/summary/daily")
+    data = (await resp.get_json())["data"]
+    assert (data["todo_tasks"], data["in_progress_tasks"]) == (1, 1)
+
+    resp = await logged_in_client.get("/api/review/insights")
+    assert (await resp.get_json())["total_tasks"] == 2
+
+    resp = await logged_in_client.get("/api/account/preview")
+    assert (await resp.get_json())["data"]["data_summary"]["tasks"] == 2
+
+
+@pytest.mark.asyncio
+async def test_reconcile_reports_and_fixes_drift(logged_in_client, capsys):
+    from backend.db.engine_async import AsyncSessionLocal
+    from backend.db.task_stats import reconcile_task_stats
+
+    await logged_in_client.post("/api/tasks", json={"title": "Counted"})
+    async with AsyncSessionLocal() as s:
+        await s.execute(text("UPDATE user_task_stats SET open_count = 7"))
+        await s.execute(text("INSERT INTO user_task_stats VALUES (1, 3, 1, 0, 0, 1)"))
+        await s.commit()
+
+    drift = await reconcile_task_stats()
+    assert {(d.user_id, d.status_id) for d in drift} == {(1, 1), (1, 3)}
+    assert drift[0].actual == (1, 0, 0, 1)
+
+    assert await reconcile_task_stats(fix=True)
+    assert await reconcile_task_stats() == []
+    assert (await _stats()).open == 1
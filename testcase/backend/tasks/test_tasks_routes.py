@@ -151,6 +151,44 @@ async def test_tasks_calendar(logged_in_client, create_task):
     titles = [t.get("title") for t in cal["2030-01-01"]]
     assert "Cal A" in titles and "Cal B" in titles
 
+@pytest.mark.asyncio
+async def test_tasks_calendar_window_and_counts(logged_in_client, create_task, assert_error):
+    await create_task(title="Jan 31", due_date="2030-01-31")
+    feb_1 = await create_task(title="Feb 1", due_date="2030-02-01")
+    await create_task(title="Feb 1 again", due_date="2030-02-01")
+    await create_task(title="Feb 28", due_date="2030-02-28")
+    await create_task(title="Mar 1", due_date="2030-03-01")
+    await logged_in_client.put(f"/api/tasks/{feb_1}", json={"done": True})
+
+    resp = await logged_in_client.get("/api/tasks/calendar?from=2030-02-01&to=2030-02-28")
+    cal = await resp.get_json()
+    assert sorted(cal) == ["2030-02-01", "2030-02-28"]
+    assert len(cal["2030-02-01"]) == 2
+
+    resp = await logged_in_client.get(
+        "/api/tasks/calendar?counts=1&from=2030-01-01&to=2030-02-28"
+    )
+    counts = await resp.get_json()
+    assert counts == {
+        "2030-01-31": {"total": 1, "done": 0},
+        "2030-02-01": {"total": 2, "done": 1},
+        "2030-02-28": {"total": 1, "done": 0},
+    }
+
+    # Day detail on demand
+    resp = await logged_in_client.get("/api/tasks/calendar?from=2030-03-01&to=2030-03-01")
+    assert [t["title"] for t in (await resp.get_json())["2030-03-01"]] == ["Mar 1"]
+
+    await assert_error(
+        await logged_in_client.get("/api/tasks/calendar?from=2030-02-01"), 400
+    )
+    await assert_error(
+        await logged_in_client.get("/api/tasks/calendar?from=2030-02-10&to=2030-02-01"), 400
+    )
+    await assert_error(
+        await logged_in_client.get("/api/tasks/calendar?from=nope&to=2030-02-01"), 400
+    )
+
 @pytest.mark.asyncio
 async def test_tasks_archive_completed(logged_in_client, create_task):
     # Create and complete a task
@@ -206,3 +244,323 @@ async def test_update_invalid_due_date_format(logged_in_client, create_task, ass
     task_id = await create_task(title="Upd Date")
     resp = await logged_in_client.put(f"/api/tasks/{task_id}", json={"due_date": "31-12-2030"})
     await assert_error(resp, 400)
+
+
+@pytest.mark.asyncio
+async def test_tasks_cursor_pagination_walks_every_task_once(logged_in_client, create_task, get_data):
+    created = [await create_task(title=f"Scroll {i}") for i in range(5)]
+
+    seen = []
+    cursor = ""
+    while True:
+        resp = await logged_in_client.get(f"/api/tasks/?cursor={cursor}&per_page=2")
+        assert resp.status_code == 200
+        data = await get_data(resp)
+        assert "total" not in data["pagination"]
+        seen.extend(t["id"] for t in data["tasks"])
+        if not data["pagination"]["has_more"]:
+            assert data["pagination"]["next_cursor"] is None
+            break
+        cursor = data["pagination"]["next_cursor"]
+
+    assert sorted(seen) == sorted(created)
+    assert len(seen) == len(set(seen))
+
+
+@pytest.mark.asyncio
+async def test_tasks_cursor_total_is_optional_and_tracks_writes(logged_in_client, create_task, get_data):
+    await create_task(title="Counted")
+    data = await get_data(await logged_in_client.get("/api/tasks/?cursor=&include_total=1"))
+    assert data["pagination"]["total"] == 1
+
+    task_id = await create_task(title="Counted too")
+    data = await get_data(await logged_in_client.get("/api/tasks/?cursor=&include_total=1"))
+    assert data["pagination"]["total"] == 2
+
+    await logged_in_client.delete(f"/api/tasks/{task_id}")
+    data = await get_data(await logged_in_client.get("/api/tasks/?cursor=&include_total=1"))
+    assert data["pagination"]["total"] == 1
+
+
+@pytest.mark.asyncio
+async def test_tasks_invalid_cursor(logged_in_client, assert_error):
+    resp = await logged_in_client.get("/api/tasks/?cursor=not-a-cursor")
+    await assert_error(resp, 400)
+
+
+@pytest.mark.asyncio
+async def test_kanban_column_limit_and_load_more(logged_in_client, create_task, get_data):
+    created = [await create_task(title=f"Column {i}") for i in range(5)]
+
+    board = await get_data(await logged_in_client.get("/api/tasks/kanban?limit=2"))
+    todo = board["todo"]
+    assert len(todo["tasks"]) == 2
+    assert todo["has_more"] is True
+    assert board["done"]["tasks"] == [] and board["done"]["has_more"] is False
+
+    seen = [t["id"] for t in todo["tasks"]]
+    cursor = todo["next_cursor"]
+    while cursor:
+        resp = await logged_in_client.get(
+            f"/api/tasks/kanban/{todo['status_id']}?limit=2&cursor={cursor}"
+        )
+        column = await get_data(resp)
+        seen.extend(t["id"] for t in column["tasks"])
+        cursor = column["next_cursor"]
+
+    assert sorted(seen) == sorted(created)
+
+
+@pytest.mark.asyncio
+async def test_kanban_column_unknown_status(logged_in_client, assert_error):
+    resp = await logged_in_client.get("/api/tasks/kanban/999")
+    await assert_error(resp, 404)
+
+
+@pytest.mark.asyncio
+async def test_archive_completed_is_set_based(logged_in_client, create_task, get_data, list_titles):
+    done_ids = [await create_task(title=f"Done {i}") for i in range(3)]
+    await create_task(title="Open")
+    for task_id in done_ids:
+        await logged_in_client.put(f"/api/tasks/{task_id}", json={"done": True})
+
+    data = await get_data(await logged_in_client.post("/api/tasks/archive-completed"))
+    assert data["archived_count"] == 3
+    assert await list_titles() == ["Open"]
+
+    data = await get_data(await logged_in_client.post("/api/tasks/archive-completed"))
+    assert data["archived_count"] == 0
+
+
+@pytest.mark.asyncio
+async def test_bulk_operations_report_per_item_results(logged_in_client, create_task, get_data, list_titles):
+    keep = await create_task(title="Keep")
+    drop = await create_task(title="Drop")
+
+    resp = await logged_in_client.post(
+        "/api/tasks/bulk",
+        json={
+            "operations": [
+                {"op": "create", "data": {"title": "Fresh", "category": "Work"}},
+                {"op": "create", "data": {"title": "  "}},
+                {"op": "update", "id": keep, "data": {"done": True, "priority": True}},
+                {"op": "delete", "id": drop},
+                {"op": "update", "id": drop, "data": {"title": "Gone"}},
+                {"op": "update", "id": 999999, "data": {"title": "Nope"}},
+                {"op": "rename", "id": keep},
+            ]
+        },
+    )
+    data = await get_data(resp)
+    results = data["results"]
+    assert [r["success"] for r in results] == [True, False, True, True, False, False, False]
+    assert (data["succeeded"], data["failed"]) == (3, 4)
+    assert results[1]["error"]["code"] == 400
+    assert results[4]["error"]["code"] == 404
+    assert results[5]["error"]["code"] == 404
+    assert results[0]["task_id"]
+
+    assert sorted(await list_titles()) == ["Fresh", "Keep"]
+    task = await get_data(await logged_in_client.get(f"/api/tasks/{keep}"))
+    assert task["done"] is True and task["priority"] is True and task["closed_on"]
+
+
+@pytest.mark.asyncio
+async def test_bulk_failed_update_leaves_task_untouched(logged_in_client, create_task, get_data):
+    task_id = await create_task(title="Original")
+    other = await create_task(title="Other")
+
+    resp = await logged_in_client.post(
+        "/api/tasks/bulk",
+        json={
+            "operations": [
+                {
+                    "op": "update",
+                    "id": task_id,
+                    "data": {"title": "Renamed", "done": True, "parent_id": 999999},
+                },
+                {"op": "update", "id": other, "data": {"title": "Other renamed"}},
+            ]
+        },
+    )
+    data = await get_data(resp)
+    assert [r["success"] for r in data["results"]] == [False, True]
+    assert data["results"][0]["error"]["code"] == 400
+
+    # The rejected op is not committed along with the successful one
+    task = await get_data(await logged_in_client.get(f"/api/tasks/{task_id}"))
+    assert (task["title"], task["done"], task["closed_on"]) == ("Original", False, None)
+    assert task["parent_id"] is None
+    task = await get_data(await logged_in_client.get(f"/api/tasks/{other}"))
+    assert task["title"] == "Other renamed"
+
+
+@pytest.mark.asyncio
+async def test_bulk_rejects_bad_payload(logged_in_client, assert_error):
+    await assert_error(await logged_in_client.post("/api/tasks/bulk", json={}), 400)
+    await assert_error(
+        await logged_in_client.post(
+            "/api/tasks/bulk", json={"operations": [{"op": "delete"}] * 201}
+        ),
+        400,
+    )
+
+
+@pytest.mark.asyncio
+async def test_search_ranks_and_tracks_edits(logged_in_client, create_task, get_data, assert_error):
+    report = await create_task(title="Write quarterly report", description="numbers for finance")
+    await create_task(title="Call finance", description="ask about the quarterly report")
+    gone = await create_task(title="Report archive", description="old")
+
+    data = await get_data(await logged_in_client.get("/api/tasks/search?q=quarterly report"))
+    titles = [r["title"] for r in data["results"]]
+    # Title matches outrank description matches
+    assert titles == ["Write quarterly report", "Call finance"]
+    assert "<mark>" in data["results"][0]["snippet"]
+    assert data["results"][0]["rank"] <= data["results"][1]["rank"]
+
+    # Prefix matching and edits are picked up by the triggers
+    await logged_in_client.put(f"/api/tasks/{report}", json={"title": "Write annual summary"})
+    data = await get_data(await logged_in_client.get("/api/tasks/search?q=annu"))
+    assert [r["id"] for r in data["results"]] == [report]
+
+    await logged_in_client.delete(f"/api/tasks/{gone}")
+    data = await get_data(await logged_in_client.get("/api/tasks/search?q=archive"))
+    assert data["results"] == []
+
+    # FTS syntax in user input is treated as plain words
+    data = await get_data(await logged_in_client.get('/api/tasks/search?q=finance"*)'))
+    assert {r["title"] for r in data["results"]} == {"Call finance", "Write annual summary"}
+
+    await assert_error(await logged_in_client.get("/api/tasks/search"), 400)
+
+
+@pytest.mark.asyncio
+async def test_search_snippet_escapes_task_text(logged_in_client, create_task, get_data):
+    await create_task(title="<img src=x onerror=alert(1)> budget & plans")
+
+    data = await get_data(await logged_in_client.get("/api/tasks/search?q=budget"))
+    snippet = data["results"][0]["snippet"]
+    assert snippet == "&lt;img src=x onerror=alert(1)&gt; <mark>budget</mark> &amp; plans"
+
+
+@pytest.mark.asyncio
+async def test_task_tree_rolls_up_counts(logged_in_client, create_task, get_data, assert_error):
+    from backend.db.engine_async import async_engine
+    from backend.db.query_plan import QueryRecorder
+
+    root = await create_task(title="Trip")
+    pack = await create_task(title="Pack", parent_id=root)
+    book = await create_task(title="Book", parent_id=root)
+    clothes = await create_task(title="Clothes", parent_id=pack)
+    socks = await create_task(title="Socks", parent_id=clothes)
+    await logged_in_client.put(f"/api/tasks/{book}", json={"done": True})
+    await logged_in_client.put(f"/api/tasks/{socks}", json={"done": True})
+
+    with QueryRecorder(async_engine.sync_engine) as recorder:
+        tree = await get_data(await logged_in_client.get(f"/api/tasks/{root}/tree?depth=2"))
+    # data_version, the recursive subtree query and the tag lookup
+    assert len(recorder.queries) == 3
+    assert any("WITH RECURSIVE" in q.statement for q in recorder.queries)
+
+    assert (tree["child_count"], tree["done_child_count"]) == (2, 1)
+    assert (tree["descendant_count"], tree["done_descendant_count"]) == (4, 2)
+    assert [c["title"] for c in tree["subtasks"]] == ["Pack", "Book"]
+    pack_node = tree["subtasks"][0]
+    assert pack_node["descendant_count"] == 2
+    clothes_node = pack_node["subtasks"][0]
+    assert clothes_node["depth"] == 2 and clothes_node["subtasks"] == []
+    assert clothes_node["truncated"] is True
+
+    # List option nests subtrees under top-level tasks only
+    data = await get_data(await logged_in_client.get("/api/tasks/?subtasks=1"))
+    assert [t["title"] for t in data["tasks"]] == ["Trip"]
+    assert [c["title"] for c in data["tasks"][0]["subtasks"]] == ["Pack", "Book"]
+    # Totals count the listed top-level tasks, in both pagination modes
+    assert (data["pagination"]["total"], data["pagination"]["pages"]) == (1, 1)
+    data = await get_data(
+        await logged_in_client.get("/api/tasks/?subtasks=1&cursor=&include_total=1")
+    )
+    assert data["pagination"]["total"] == 1
+    data = await get_data(await logged_in_client.get("/api/tasks/"))
+    assert data["pagination"]["total"] == 5
+    # Moving a subtask to the top level updates the cached total
+    await logged_in_client.put(f"/api/tasks/{book}", json={"parent_id": None})
+    data = await get_data(await logged_in_client.get("/api/tasks/?subtasks=1"))
+    assert data["pagination"]["total"] == 2
+
+    # Cycles and foreign parents are rejected
+    await assert_error(
+        await logged_in_client.put(f"/api/tasks/{root}", json={"parent_id": socks}), 400
+    )
+    await assert_error(
+        await logged_in_client.post("/api/tasks", json={"title": "x", "parent_id": 999999}), 400
+    )
+    await assert_error(await logged_in_client.get("/api/tasks/999999/tree"), 404)
+
+
+@pytest.mark.asyncio
+async def test_reorder_writes_only_the_moved_task(logged_in_client, create_task, get_data, assert_error):
+    a, b, c = [await create_task(title=t) for t in "ABC"]
+
+    async def positions():
+        return {
+            t: (await get_data(await logged_in_client.get(f"/api/tasks/{t}")))["position"]
+            for t in (a, b, c)
+        }
+
+    assert await positions() == {a: 1.0, b: 2.0, c: 3.0}
+
+    async def reorder(task_id, **body):
+        return await logged_in_client.post(f"/api/tasks/{task_id}/reorder", json=body)
+
+    moved = await get_data(await reorder(c, prev_id=a, next_id=b))
+    assert moved["position"] == 1.5
+    assert await positions() == {a: 1.0, b: 2.0, c: 1.5}
+    # To the top and to the end, with a column change
+    assert (await get_data(await reorder(b, next_id=a)))["position"] == 0.0
+    moved = await get_data(await reorder(a, prev_id=b, status_id=2))
+    assert moved == {"task_id": a, "position": 1.0, "status_id": 2}
+    task = await get_data(await logged_in_client.get(f"/api/tasks/{a}"))
+    assert task["status"]["id"] == 2
+
+    await assert_error(await reorder(a), 400)
+    await assert_error(await reorder(a, prev_id=a), 400)
+    await assert_error(await reorder(a, prev_id=b, next_id=b), 400)
+    await assert_error(await reorder(a, prev_id=999999), 400)
+    await assert_error(await reorder(a, prev_id=b, status_id=999), 400)
+    await assert_error(await reorder(999999, prev_id=b), 404)
+    # c (1.5) no longer sorts before b (0.0)
+    await assert_error(await reorder(a, prev_id=c, next_id=b), 409)
+
+
+@pytest.mark.asyncio
+async def test_reorder_rebalances_dense_positions(logged_in_client, create_task, get_data):
+    from backend.db.engine_async import AsyncSessionLocal
+    from backend.db.positions import rebalance_positions
+
+    first, last = await create_task(title="first"), await create_task(title="last")
+    # Each move lands just above the previous one, halving the same gap
+    upper = last
+    for i in range(30):
+        task_id = await create_task(title=f"t{i}")
+        resp = await logged_in_client.post(
+            f"/api/tasks/{task_id}/reorder", json={"prev_id": first, "next_id": upper}
+        )
+        assert resp.status_code == 200
+        upper = task_id
+
+    data = await get_data(await logged_in_client.get("/api/tasks/?per_page=100"))
+    ordered = sorted(data["tasks"], key=lambda t: t["position"])
+    expected = ["first"] + [f"t{i}" for i in range(29, -1, -1)] + ["last"]
+    assert [t["title"] for t in ordered] == expected
+    gaps = [b["position"] - a["position"] for a, b in zip(ordered, ordered[1:])]
+    assert min(gaps) > 0
+
+    async with AsyncSessionLocal() as s:
+        assert await rebalance_positions(s, 1) == 32
+        await s.commit()
+    data = await get_data(await logged_in_client.get("/api/tasks/?per_page=100"))
+    ordered = sorted(data["tasks"], key=lambda t: t["position"])
+    assert [t["title"] for t in ordered] == expected
+    assert [t["position"] for t in ordered] == [float(i) for i in range(1, 33)]
@@ -11,7 +11,7 @@ Tests the account deletion feature including:
 import pytest
 from conftest import create_user_and_login
 from sqlalchemy import select, func
-from backend.db.models import User, Task, JournalEntry, Configuration, Conversation, UserSession
+from backend.db.models import User, Task, JournalEntry, Configuration, Conversation, UserSession, SyncChange, UserDailyStats
 
 
 @pytest.mark.asyncio
@@ -188,9 +188,18 @@ async def test_delete_account_success_and_cascade(client, app):
             select(func.count(Configuration.id)).where(Configuration.user_id == user_id)
         )
         
+        sync_after = await db_session.scalar(
+            select(func.count(SyncChange.seq)).where(SyncChange.user_id == user_id)
+        )
+        daily_stats_after = await db_session.scalar(
+            select(func.count()).select_from(UserDailyStats).where(UserDailyStats.user_id == user_id)
+        )
+
         assert tasks_after == 0, "All tasks should be deleted"
         assert journal_after == 0, "All journal entries should be deleted"
         assert config_after == 0, "Configuration should be deleted"
+        assert sync_after == 0, "Sync change entries should be deleted"
+        assert daily_stats_after == 0, "Daily stats should be deleted"
 
 
 @pytest.mark.asyncio
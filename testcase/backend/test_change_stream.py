@@ -0,0 +1,109 @@
+import asyncio
+
+import pytest
+
+
+async def _next_event(connection) -> str:
+    """Read one SSE frame (up to the blank line) from a streaming response."""
+    buffer = b""
+    while b"\n\n" not in buffer:
+        buffer += await asyncio.wait_for(connection.receive(), timeout=2)
+    return buffer.decode()
+
+
+@pytest.mark.asyncio
+async def test_events_published_after_commit_only(app):
+    from backend.data_version import bump_data_version
+    from backend.db.engine_async import AsyncSessionLocal
+    from backend.services.change_hub import change_hub
+
+    subscription = change_hub.subscribe(0)
+    try:
+        async with AsyncSessionLocal() as s:
+            await bump_data_version(s, 0, "task")
+            await s.rollback()
+        assert await subscription.get(0.01) is None
+
+        async with AsyncSessionLocal() as s:
+            await bump_data_version(s, 0, "task")
+            await bump_data_version(s, 0, "category", "task")
+            assert subscription.queue.empty()
+            await s.commit()
+        event = await subscription.get(0.01)
+        assert (event.type, event.changed) == ("change", ("category", "task"))
+        assert await subscription.get(0.01) is None
+    finally:
+        change_hub.unsubscribe(subscription)
+    assert change_hub.subscriber_count() == 0
+
+
+@pytest.mark.asyncio
+async def test_slow_subscriber_gets_resync(app):
+    from backend.services.change_hub import ChangeEvent, ChangeHub
+
+    hub = ChangeHub()
+    subscription = hub.subscribe(1)
+    overflow = subscription.queue.maxsize + 1
+    for version in range(1, overflow + 2):
+        hub.publish(1, ChangeEvent(version, ("journal",)))
+
+    # The backlog collapses into one resync; later events queue behind it
+    event = await subscription.get(0.01)
+    assert (event.type, event.version) == ("resync", overflow)
+    assert "task" in event.changed
+    assert (await subscription.get(0.01)).version == overflow + 1
+    assert await subscription.get(0.01) is None
+
+
+@pytest.mark.asyncio
+async def test_stream_pushes_changes(logged_in_client, monkeypatch):
+    from backend.blueprints.events import routes
+    from backend.services.change_hub import change_hub
+
+    monkeypatch.setattr(routes, "CHANGE_STREAM_HEARTBEAT_SECONDS", 0.05)
+
+    async with logged_in_client.request("/api/events") as connection:
+        await connection.send_complete()
+        ready = await _next_event(connection)
+        assert "event: ready" in ready
+        assert change_hub.subscriber_count(1) == 1
+
+        resp = await logged_in_client.post("/api/tasks", json={"title": "From tab B"})
+        assert resp.status_code == 201
+        frame = await _next_event(connection)
+        while frame.startswith(": heartbeat"):
+            frame = await _next_event(connection)
+        assert "event: change" in frame
+        assert '"changed": ["category", "task"]' in frame
+
+        assert (await _next_event(connection)).startswith(": heartbeat")
+        await connection.disconnect()
+
+
+@pytest.mark.asyncio
+async def test_stream_requires_login(client):
+    resp = await client.get("/api/events")
+    assert resp.status_code == 401
+
+
+@pytest.mark.asyncio
+async def test_stream_closes_after_logout(logged_in_client, monkeypatch):
+    from backend.blueprints.events import routes
+    from backend.services.change_hub import change_hub
+
+    monkeypatch.setattr(routes, "CHANGE_STREAM_HEARTBEAT_SECONDS", 0.05)
+
+    async with logged_in_client.request("/api/events") as connection:
+        await connection.send_complete()
+        assert "event: ready" in await _next_event(connection)
+
+        resp = await logged_in_client.post("/api/auth/logout")
+        assert resp.status_code == 200
+
+        # The next heartbeat check sees the revoked session and ends the stream
+        for _ in range(50):
+            if change_hub.subscriber_count(1) == 0:
+                break
+            await asyncio.sleep(0.02)
+        assert change_hub.subscriber_count(1) == 0
+        await connection.disconnect()
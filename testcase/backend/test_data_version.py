@@ -0,0 +1,71 @@
+import pytest
+
+from testcase.backend.chat import fake_llm_service
+
+
+async def _etag(client, url):
+    resp = await client.get(url)
+    assert resp.status_code == 200
+    etag = resp.headers.get("ETag")
+    assert etag and etag.startswith('W/"')
+    return etag
+
+
+@pytest.mark.asyncio
+async def test_matching_etag_returns_304_without_querying(logged_in_client):
+    from backend.db.engine_async import async_engine
+    from backend.db.query_plan import QueryRecorder
+
+    await logged_in_client.post("/api/tasks", json={"title": "Cached"})
+    etag = await _etag(logged_in_client, "/api/tasks/kanban")
+
+    with QueryRecorder(async_engine.sync_engine) as recorder:
+        resp = await logged_in_client.get(
+            "/api/tasks/kanban", headers={"If-None-Match": etag}
+        )
+    assert resp.status_code == 304
+    assert resp.headers["ETag"] == etag
+    assert await resp.get_data() == b""
+    # Only the data_version lookup runs
+    assert not [q for q in recorder.queries if "FROM task" in q.statement]
+
+
+@pytest.mark.asyncio
+async def test_writes_bump_version(logged_in_client, patch_llm):
+    etag = await _etag(logged_in_client, "/api/tasks/")
+
+    resp = await logged_in_client.post("/api/tasks", json={"title": "New"})
+    task_id = (await resp.get_json())["data"]["task_id"]
+    after_create = await _etag(logged_in_client, "/api/tasks/")
+    assert after_create != etag
+
+    await logged_in_client.put(f"/api/tasks/{task_id}", json={"done": True})
+    after_update = await _etag(logged_in_client, "/api/tasks/")
+    assert after_update != after_create
+
+    await logged_in_client.post("/api/review/journal", json={"content": "Entry"})
+    after_journal = await _etag(logged_in_client, "/api/review/journal")
+    assert after_journal != after_update
+
+    await logged_in_client.put("/api/settings", json={"theme": "dark"})
+    after_settings = await _etag(logged_in_client, "/api/settings")
+    assert after_settings != after_journal
+
+    resp = await logged_in_client.post(
+        "/api/categories", json={"name": "Errands", "color_hex": "00ff00"}
+    )
+    assert resp.status_code == 201, await resp.get_json()
+    after_category = await _etag(logged_in_client, "/api/categories")
+    assert after_category != after_settings
+
+    patch_llm(fake_llm_service.FakeLLMServiceCreate)
+    resp = await logged_in_client.post("/api/chat/message", json={"message": "add it"})
+    assert (await resp.get_json())["actions_executed"], await resp.get_json()
+    after_chat = await _etag(logged_in_client, "/api/tasks/")
+    assert after_chat != after_category
+
+    # A stale tag gets the full response again
+    resp = await logged_in_client.get(
+        "/api/tasks/", headers={"If-None-Match": etag}
+    )
+    assert resp.status_code == 200
@@ -0,0 +1,79 @@
+"""
+Tests for the PIN hashing worker pool.
+
+Checks that hashing/verification run through the pool, that a full queue
+turns into a fast 503 for the caller, and that /api/health/metrics reports
+the pool's queue depth and latency to logged-in callers only.
+"""
+
+import hashlib
+
+import pytest
+
+from conftest import create_user_and_login
+from backend.security.pin_executor import (
+    PinHashExecutor,
+    pin_executor,
+    verify_and_migrate_pin_async,
+)
+from backend.errors import ServiceUnavailableError
+
+
+@pytest.mark.asyncio
+async def test_verify_runs_on_pool_and_migrates_legacy_hash():
+    legacy_hash = hashlib.sha256(b"1234").hexdigest()
+    before = pin_executor.stats()["completed"]
+
+    is_valid, new_hash = await verify_and_migrate_pin_async("1234", legacy_hash)
+
+    assert is_valid is True
+    assert new_hash is not None
+    assert pin_executor.stats()["completed"] == before + 1
+
+
+@pytest.mark.asyncio
+async def test_full_queue_rejects_immediately():
+    executor = PinHashExecutor(max_workers=1, max_pending=1)
+    executor._pending = 1  # Pretend one call is already in flight
+
+    with pytest.raises(ServiceUnavailableError) as exc_info:
+        await executor.run(lambda: None)
+
+    assert exc_info.value.status_code == 503
+    assert executor.stats()["rejected"] == 1
+    executor.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_login_returns_503_when_pool_is_saturated(client, monkeypatch):
+    await create_user_and_login(client, username="busy_user", email="busy@example.com")
+
+    monkeypatch.setattr(pin_executor, "_pending", pin_executor.max_pending)
+    resp = await client.post(
+        "/api/auth/login", json={"pin": "1234", "username": "busy_user"}
+    )
+
+    assert resp.status_code == 503
+    body = await resp.get_json()
+    assert body["success"] is False
+    assert body["error"]["code"] == 503
+
+
+@pytest.mark.asyncio
+async def test_metrics_report_pin_hashing_to_logged_in_users(client):
+    # Anonymous callers get liveness only
+    resp = await client.get("/api/health")
+    assert "pin_hashing" not in await resp.get_json()
+    resp = await client.get("/api/health/metrics")
+    assert resp.status_code == 401
+
+    await create_user_and_login(client)
+
+    resp = await client.get("/api/health/metrics")
+    assert resp.status_code == 200
+    data = await resp.get_json()
+
+    metrics = data["pin_hashing"]
+    assert metrics["queue_depth"] == 0
+    assert metrics["completed"] >= 2  # setup hash + login verify
+    assert metrics["avg_latency_ms"] > 0
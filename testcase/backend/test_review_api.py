@@ -71,3 +71,196 @@ async def test_review_journal_and_summaries(client):
     # Delete the journal entry
     r = await client.delete(f"/api/review/journal/{entry_id}")
     assert r.status_code in (200, 204)
+
+
+async def _legacy_daily_counts(user_id, day, today):
+    """The per-count queries daily_summary used to run, as an oracle."""
+    from sqlalchemy import and_, func, select
+
+    from backend.db.engine_async import AsyncSessionLocal
+    from backend.db.models import Category, Task
+
+    active = and_(Task.created_by == user_id, Task.archived == False)
+    created = and_(active, func.date(Task.created_on) == day)
+    open_in = lambda status_id: and_(active, Task.done == False, Task.status_id == status_id)
+
+    async with AsyncSessionLocal() as s:
+        count = lambda cond: s.scalar(select(func.count()).select_from(Task).where(cond))
+        categories = await s.execute(
+            select(Category.name, func.count(Task.id))
+            .join(Task)
+            .where(created, Task.category_id.isnot(None))
+            .group_by(Category.name)
+        )
+        return {
+            "completed_tasks": await count(and_(created, Task.done == True)),
+            "created_tasks": await count(created),
+            "todo_tasks": await count(open_in(1)),
+            "in_progress_tasks": await count(open_in(2)),
+            "overdue_tasks": await count(
+                and_(active, Task.done == False, Task.due_date < today)
+            ),
+            "categories": dict(categories.all()),
+        }
+
+
+@pytest.mark.asyncio
+async def test_daily_summary_single_pass_matches_legacy_counts(logged_in_client):
+    from datetime import date, timedelta
+
+    from sqlalchemy import text
+
+    from backend.db.engine_async import AsyncSessionLocal, async_engine
+    from backend.db.query_plan import QueryRecorder
+
+    client = logged_in_client
+    today = date.today()
+    yesterday = today - timedelta(days=1)
+    specs = [
+        {"title": "Work todo", "category": "Work"},
+        {"title": "Work going", "category": "Work", "status_id": 2},
+        {"title": "Home overdue", "category": "Home", "due_date": yesterday.isoformat()},
+        {"title": "Due today", "due_date": today.isoformat()},
+        {"title": "Finished", "category": "Home"},
+        {"title": "Archived", "category": "Work"},
+        {"title": "Old", "category": "Old"},
+    ]
+    ids = {}
+    for spec in specs:
+        resp = await client.post("/api/tasks", json=spec)
+        ids[spec["title"]] = (await resp.get_json())["data"]["task_id"]
+    await client.put(f"/api/tasks/{ids['Finished']}", json={"done": True})
+    await client.put(f"/api/tasks/{ids['Archived']}", json={"done": True})
+    await client.post("/api/tasks/archive-completed")
+    await client.put(f"/api/tasks/{ids['Finished']}", json={"done": True})
+    async with AsyncSessionLocal() as s:
+        await s.execute(
+            text("UPDATE task SET created_on = :at WHERE id = :id"),
+            {"at": f"{yesterday} 23:59:59.999999", "id": ids["Old"]},
+        )
+        await s.commit()
+
+    for day in (today, yesterday):
+        with QueryRecorder(async_engine.sync_engine) as recorder:
+            resp = await client.get(f"/api/review/summary/daily?date={day}")
+        data = (await resp.get_json())["data"]
+        # Besides the ETag's data_version read
+        queries = [q.statement for q in recorder.queries if "data_version" not in q.statement]
+        assert len(queries) <= 2, queries
+
+        expected = await _legacy_daily_counts(1, day, today)
+        assert {key: data[key] for key in expected} == expected
+
+    assert expected["created_tasks"] == 1
+    assert expected["categories"] == {"Old": 1}
+
+
+@pytest.mark.asyncio
+async def test_weekly_summary_groups_any_week(logged_in_client):
+    from sqlalchemy import text
+
+    from backend.db.engine_async import AsyncSessionLocal, async_engine
+    from backend.db.query_plan import QueryRecorder
+
+    client = logged_in_client
+    # (title, category, created_on, closed_on, done)
+    rows = [
+        ("Mon", "Work", "2030-01-07 09:00:00.000000", None, True),
+        ("Mon late", "Home", "2030-01-01 09:00:00.000000", "2030-01-07 23:59:59.000000", True),
+        ("Wed", "Work", "2030-01-09 00:00:00.000000", None, True),
+        ("Next Mon", "Work", "2030-01-14 00:00:00.000000", None, True),
+        ("Open", None, "2030-01-08 10:00:00.000000", None, False),
+        ("Closed before", None, "2030-01-08 10:00:00.000000", "2030-01-06 10:00:00.000000", True),
+    ]
+    for title, category, created_on, closed_on, done in rows:
+        payload = {"title": title, **({"category": category} if category else {})}
+        resp = await client.post("/api/tasks", json=payload)
+        task_id = (await resp.get_json())["data"]["task_id"]
+        async with AsyncSessionLocal() as s:
+            await s.execute(
+                text(
+                    "UPDATE task SET created_on = :created, closed_on = :closed, "
+                    "done = :done WHERE id = :id"
+                ),
+                {"created": created_on, "closed": closed_on, "done": done, "id": task_id},
+            )
+            await s.commit()
+
+    with QueryRecorder(async_engine.sync_engine) as recorder:
+        resp = await client.get("/api/review/summary/weekly?week_start=2030-01-07")
+    weekly = await resp.get_json()
+    queries = [q.statement for q in recorder.queries if "data_version" not in q.statement]
+    # One read of the daily rollup
+    assert len(queries) == 1, queries
+
+    assert (weekly["week_start"], weekly["week_end"]) == ("2030-01-07", "2030-01-13")
+    assert [d["count"] for d in weekly["daily_breakdown"]] == [2, 0, 1, 0, 0, 0, 0]
+    assert weekly["daily_breakdown"][0] == {"day": "Monday", "count": 2, "date": "2030-01-07"}
+    assert weekly["most_productive_day"] == "Monday"
+    assert weekly["total_completed"] == 3
+    # Created in the week: Mon, Wed, Open, Closed before
+    assert weekly["total_tasks"] == 4
+    assert weekly["category_performance"] == {
+        "Work": {"completed": 2},
+        "Home": {"completed": 1},
+    }
+
+    # Weeks need not start on a Monday
+    resp = await client.get("/api/review/summary/weekly?week_start=2030-01-08")
+    assert [d["count"] for d in (await resp.get_json())["daily_breakdown"]] == [
+        0, 1, 0, 0, 0, 0, 1
+    ]
+
+    resp = await client.get("/api/review/summary/weekly?week_start=soon")
+    assert resp.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_insights_trends_any_horizon_in_one_scan(logged_in_client):
+    from datetime import date, timedelta
+
+    from sqlalchemy import text
+
+    from backend.db.engine_async import AsyncSessionLocal, async_engine
+    from backend.db.query_plan import QueryRecorder
+
+    client = logged_in_client
+    this_week = date.today() - timedelta(days=date.today().weekday())
+    busy_day = this_week - timedelta(weeks=10) + timedelta(days=2)
+    closed = [busy_day, busy_day, busy_day, this_week, this_week - timedelta(weeks=60)]
+    for closed_on in closed:
+        resp = await client.post("/api/tasks", json={"title": f"Done {closed_on}"})
+        task_id = (await resp.get_json())["data"]["task_id"]
+        async with AsyncSessionLocal() as s:
+            await s.execute(
+                text("UPDATE task SET done = 1, closed_on = :closed WHERE id = :id"),
+                {"closed": f"{closed_on} 12:00:00.000000", "id": task_id},
+            )
+            await s.commit()
+
+    counts = []
+    for weeks in (4, 52):
+        with QueryRecorder(async_engine.sync_engine) as recorder:
+            resp = await client.get(f"/api/review/insights?weeks={weeks}")
+        insights = await resp.get_json()
+        queries = [q.statement for q in recorder.queries if "data_version" not in q.statement]
+        counts.append(len(queries))
+
+        trends = insights["performance_trends"]
+        assert len(trends) == weeks
+        assert trends[-1]["period"] == "This Week"
+        assert trends[-1]["week_start"] == this_week.isoformat()
+        assert trends[-1]["completed"] == 1
+        assert insights["completed_tasks"] == 5
+
+    assert counts[0] == counts[1] == 2
+    # The 52-week horizon reaches the busy day but not the one 60 weeks back
+    assert sum(t["completed"] for t in trends) == 4
+    assert trends[-11] == {
+        "period": "10 Weeks Ago",
+        "completed": 3,
+        "week_start": (this_week - timedelta(weeks=10)).isoformat(),
+        "week_end": (this_week - timedelta(weeks=10) + timedelta(days=6)).isoformat(),
+    }
+    assert insights["most_productive_day"] == busy_day.isoformat()
+    assert insights["tasks_on_most_productive_day"] == 3
@@ -65,6 +65,10 @@ async def test_auto_lock_timeout_expires_session(client):
         us.expires_at = datetime.now() - timedelta(minutes=5)
         await db.commit()
 
+    # The row was changed behind the app's back, so drop the cached validation
+    from backend.security.session_cache import session_cache
+    session_cache.invalidate(session_id)
+
     # Attempt to access protected route should now yield 401
     r2 = await client.get("/api/sessions/current")
     assert r2.status_code == 401
@@ -96,3 +100,112 @@ async def test_session_invalidation_on_logout(client):
     # After logout the same protected route should now fail with 401
     r2 = await client.get("/api/tasks/")
     assert r2.status_code == 401
+
+
+@pytest.mark.asyncio
+async def test_force_logout_revokes_cached_session_immediately(app, client):
+    await create_user_and_login(
+        client, username="revoke_user", email="revoke_user@example.com"
+    )
+
+    # Second device logs in as the same user and warms the validation cache
+    async with app.test_client() as other:
+        r = await other.post(
+            "/api/auth/login", json={"pin": "1234", "username": "revoke_user"}
+        )
+        assert r.status_code == 200
+        assert (await other.get("/api/tasks/")).status_code == 200
+
+        async with other.session_transaction() as sess:
+            other_session_id = sess["session_id"]
+
+        r = await client.get("/api/sessions/current")
+        sessions = (await r.get_json())["sessions"]
+        target = next(s for s in sessions if s["session_id"] == other_session_id)
+
+        r = await client.post(f"/api/sessions/{target['id']}/logout")
+        assert r.status_code == 200
+
+        # No TTL wait: the revoked session is rejected on its very next request
+        assert (await other.get("/api/tasks/")).status_code == 401
+
+
+@pytest.mark.asyncio
+async def test_session_activity_is_buffered_and_flushed(client):
+    from backend.security.session_cache import session_cache
+    from backend.db.engine_async import AsyncSessionLocal
+
+    await create_user_and_login(
+        client, username="activity_user", email="activity_user@example.com"
+    )
+    async with client.session_transaction() as sess:
+        session_id = sess["session_id"]
+
+    async with AsyncSessionLocal() as db:
+        before = (
+            await db.execute(
+                select(UserSession.last_activity).where(
+                    UserSession.session_id == session_id
+                )
+            )
+        ).scalar_one()
+
+    for _ in range(3):
+        assert (await client.get("/api/tasks/")).status_code == 200
+
+    assert session_cache.pending_count >= 1
+    assert await session_cache.flush() >= 1
+    assert session_cache.pending_count == 0
+
+    async with AsyncSessionLocal() as db:
+        after = (
+            await db.execute(
+                select(UserSession.last_activity).where(
+                    UserSession.session_id == session_id
+                )
+            )
+        ).scalar_one()
+    assert after >= before
+
+
+@pytest.mark.asyncio
+async def test_reaper_deletes_expired_and_idle_sessions_in_batches(client):
+    from backend.db.engine_async import AsyncSessionLocal
+    from backend.services.scheduler import reap_sessions
+
+    login = await create_user_and_login(
+        client, username="reap_user", email="reap_user@example.com"
+    )
+    user_id = login["user_id"]
+    now = datetime.now()
+
+    async with AsyncSessionLocal() as db:
+        for i in range(5):
+            db.add(
+                UserSession(
+                    session_id=f"expired-{i}",
+                    user_id=user_id,
+                    expires_at=now - timedelta(hours=1),
+                )
+            )
+        db.add(
+            UserSession(
+                session_id="idle",
+                user_id=user_id,
+                last_activity=now - timedelta(days=90),
+                expires_at=None,
+            )
+        )
+        await db.commit()
+
+    # Batches of 2 still remove every expired row; idle rows are kept
+    assert await reap_sessions(inactive_days=None, batch_size=2) == 5
+    # The idle session goes once the inactivity rule is applied
+    assert await reap_sessions(inactive_days=30, batch_size=2) == 1
+
+    # The live setup/login sessions are untouched
+    r = await client.get("/api/sessions/current")
+    assert r.status_code == 200
+    remaining = [s["session_id"] for s in (await r.get_json())["sessions"]]
+    assert remaining
+    assert not any(sid.startswith(("expired-", "idle")) for sid in remaining)
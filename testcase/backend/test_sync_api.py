@@ -0,0 +1,105 @@
+import pytest
+
+
+async def _sync(client, since=None, **params):
+    url = "/api/sync"
+    query = {**({"since": since} if since is not None else {}), **params}
+    if query:
+        url += "?" + "&".join(f"{k}={v}" for k, v in query.items())
+    resp = await client.get(url)
+    assert resp.status_code == 200, await resp.get_json()
+    return (await resp.get_json())["data"]
+
+
+async def _created_id(resp):
+    assert resp.status_code == 201, await resp.get_json()
+    data = (await resp.get_json())["data"]
+    return data.get("task_id") or data.get("id")
+
+
+@pytest.mark.asyncio
+async def test_sync_returns_changes_and_tombstones(logged_in_client):
+    client = logged_in_client
+    start = await _sync(client)
+    assert start["tasks"] == [] and start["journal_entries"] == []
+
+    keep = await _created_id(
+        await client.post("/api/tasks", json={"title": "Keep", "category": "Work"})
+    )
+    drop = await _created_id(await client.post("/api/tasks", json={"title": "Drop"}))
+    await client.post("/api/review/journal", json={"content": "Note"})
+
+    first = await _sync(client, start["token"])
+    assert {t["title"] for t in first["tasks"]} == {"Keep", "Drop"}
+    assert [c["name"] for c in first["categories"]] == ["Work"]
+    assert [j["content"] for j in first["journal_entries"]] == ["Note"]
+    assert first["token"] > start["token"]
+
+    # Nothing changed: same token, empty payload
+    idle = await _sync(client, first["token"])
+    assert idle["token"] == first["token"] and idle["tasks"] == []
+
+    await client.put(f"/api/tasks/{keep}", json={"priority": True})
+    await client.delete(f"/api/tasks/{drop}")
+    second = await _sync(client, first["token"])
+    assert [t["id"] for t in second["tasks"]] == [keep]
+    assert second["tasks"][0]["priority"] is True
+    assert second["deleted"]["tasks"] == [drop]
+    assert second["categories"] == []
+
+    # Renaming a category changes the payload of its tasks
+    category_id = first["categories"][0]["id"]
+    await client.put(f"/api/categories/{category_id}", json={"name": "Office"})
+    third = await _sync(client, second["token"])
+    assert [c["name"] for c in third["categories"]] == ["Office"]
+    assert [(t["id"], t["category"]) for t in third["tasks"]] == [(keep, "Office")]
+
+    # Deleting it leaves a tombstone and clears the task's category (SET NULL)
+    await client.delete(f"/api/categories/{category_id}")
+    fourth = await _sync(client, third["token"])
+    assert fourth["deleted"]["categories"] == [category_id]
+    assert [(t["id"], t["category"]) for t in fourth["tasks"]] == [(keep, None)]
+
+    # A full snapshot carries live rows only
+    snapshot = await _sync(client)
+    assert [t["id"] for t in snapshot["tasks"]] == [keep]
+    assert snapshot["deleted"]["tasks"] == []
+
+
+@pytest.mark.asyncio
+async def test_reusing_a_category_does_not_sync_it(logged_in_client):
+    from backend.db.categories import category_ids
+
+    client = logged_in_client
+    await client.post("/api/tasks", json={"title": "First", "category": "Work"})
+    token = (await _sync(client, 0))["token"]
+
+    # A cache miss (restart, invalidation) resolves the name with a no-op upsert
+    category_ids.invalidate(1)
+    await client.post("/api/tasks", json={"title": "Second", "category": "Work"})
+    batch = await _sync(client, token)
+    assert [t["title"] for t in batch["tasks"]] == ["Second"]
+    assert batch["categories"] == []
+
+
+@pytest.mark.asyncio
+async def test_sync_pages_with_limit(logged_in_client):
+    for title in ("A", "B", "C"):
+        await logged_in_client.post("/api/tasks", json={"title": title})
+
+    seen, token, pages = [], 0, 0
+    while True:
+        page = await _sync(logged_in_client, token, limit=2)
+        seen += [t["title"] for t in page["tasks"]]
+        token, pages = page["token"], pages + 1
+        if not page["has_more"]:
+            break
+    assert seen == ["A", "B", "C"] and pages == 2
+
+
+@pytest.mark.asyncio
+async def test_sync_rejects_bad_token(logged_in_client):
+    resp = await logged_in_client.get("/api/sync?since=abc")
+    assert resp.status_code == 400
+    resp = await logged_in_client.get("/api/sync?since=-1")
+    assert resp.status_code == 400
@@ -0,0 +1,91 @@
+import pytest
+
+from testcase.backend.chat import fake_llm_service
+from backend.services.title_index import TitleIndex
+
+
+def test_resolve_exact_fuzzy_and_miss():
+    index = TitleIndex(
+        [(1, "Write quarterly report"), (2, "Call the dentist"), (3, "Write report")]
+    )
+    assert index.resolve("write REPORT!") == (3, "Write report", 1.0)
+
+    match = index.resolve("write quartely report")  # typo
+    assert match.task_id == 1 and 0.7 < match.score < 1.0
+
+    assert index.resolve("call the dentst").task_id == 2
+    assert index.resolve("dentist") is None  # too partial to act on
+    assert index.resolve("buy groceries") is None
+    assert index.resolve("   ") is None
+
+
+def test_near_miss_titles_do_not_resolve():
+    index = TitleIndex([(1, "Call mom"), (2, "Pay rent"), (3, "Pay electricity bill")])
+    assert index.resolve("call dad") is None
+    assert index.resolve("pay bills") is None
+    assert index.resolve("call mum") is None
+
+
+def test_ambiguous_titles_do_not_resolve():
+    index = TitleIndex([(1, "Write report draft"), (2, "Write report drafts")])
+    assert index.resolve("write report draf") is None
+    # An exact title still wins over a close neighbour
+    assert index.resolve("write report draft").task_id == 1
+
+
+def test_ties_prefer_earlier_titles():
+    index = TitleIndex([(10, "Plan trip"), (11, "Plan trip")])
+    assert index.resolve("plan trip").task_id == 10
+    assert index.resolve("plan tri").task_id == 10
+
+
+def test_resolve_many_dedupes_queries():
+    index = TitleIndex([(1, "Email Bob"), (2, "Pay rent")])
+    resolved = index.resolve_many(["email bob", "pay rent", "email bob", "nothing here"])
+    assert set(resolved) == {"email bob", "pay rent", "nothing here"}
+    assert resolved["pay rent"].task_id == 2
+    assert resolved["nothing here"] is None
+
+
+@pytest.mark.asyncio
+async def test_chat_actions_use_fuzzy_title(client, seed_ai_config, patch_llm, monkeypatch):
+    from backend.services.title_index import title_indexes
+
+    resp = await client.post("/api/tasks", json={"title": "Plan summer trip"})
+    task_id = (await resp.get_json())["data"]["task_id"]
+    await client.post("/api/tasks", json={"title": "Pay electricity bill"})
+
+    monkeypatch.setattr(fake_llm_service, "INJECT_TASK_TITLE", "plan sumer trip")
+    patch_llm(fake_llm_service.FakeLLMServiceArchive)
+    resp = await client.post("/api/chat/message", json={"message": "archive it"})
+    body = await resp.get_json()
+    assert body["actions_executed"] == [{"action": "archive_task"}]
+
+    archived = await (await client.get("/api/tasks/archived")).get_json()
+    assert [t["id"] for t in archived["data"]] == [task_id]
+    # The write dropped the cached snapshot
+    assert seed_ai_config["user_id"] not in title_indexes._entries
+
+
+@pytest.mark.asyncio
+async def test_chat_actions_see_tasks_created_in_same_reply(
+    client, seed_ai_config, patch_llm
+):
+    # "Chain" would fuzzy match this task in the pre-built index
+    resp = await client.post("/api/tasks", json={"title": "Chains"})
+    existing_id = (await resp.get_json())["data"]["task_id"]
+
+    patch_llm(fake_llm_service.FakeLLMServiceMultiAction)
+    resp = await client.post("/api/chat/message", json={"message": "chain it"})
+    body = await resp.get_json()
+    assert [a["action"] for a in body["actions_executed"]] == [
+        "create_task",
+        "update_task",
+        "archive_task",
+    ]
+
+    archived = await (await client.get("/api/tasks/archived")).get_json()
+    assert [t["title"] for t in archived["data"]] == ["Chain"]
+    existing = await (await client.get(f"/api/tasks/{existing_id}")).get_json()
+    assert existing["data"]["archived"] is False
+    assert existing["data"]["priority"] is False